@@ -13,6 +13,10 @@ CREATE TABLE IF NOT EXISTS sprints (
   start_date  DATE NOT NULL,
   end_date    DATE NOT NULL,
   status      ENUM('ACTIVE','CLOSED') DEFAULT 'ACTIVE',
+  committed_points INT,      -- 关闭时固化的承诺点数（滚动结转前）
+  completed_points INT,      -- 关闭时固化的完成点数
+  closed_at   DATETIME,
+  review_sla_days INT,       -- 评审 SLA 天数，为空时使用 DEVSPRINT_REVIEW_SLA_DAYS
   created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   CONSTRAINT chk_sprint_dates CHECK (end_date >= start_date)
@@ -28,6 +32,7 @@ CREATE TABLE IF NOT EXISTS user_stories (
   priority     INT DEFAULT 3,
   is_tech_debt TINYINT(1) DEFAULT 0,
   status       ENUM('PLANNED','ACTIVE','DONE') DEFAULT 'PLANNED',
+  version      INT NOT NULL DEFAULT 1, -- 乐观锁版本号，每次更新自增
   created_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   CONSTRAINT fk_story_sprint
@@ -46,10 +51,16 @@ CREATE TABLE IF NOT EXISTS tasks (
   assignee      VARCHAR(255),
   reviewer      VARCHAR(255),
   review_started_at DATETIME,
+  review_due_at DATETIME,      -- 评审截止时间 = review_started_at + SLA，离开评审时清空
+  review_breached_at DATETIME, -- 超期扫描发现并发布的时间
   is_blocked    TINYINT(1) DEFAULT 0,
   tech_debt_estimate_days INT,
+  version       INT NOT NULL DEFAULT 1, -- 乐观锁版本号，每次更新自增
   created_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  KEY ix_tasks_story_id (story_id),
+  KEY ix_tasks_assignee_status (assignee, status),
+  KEY ix_tasks_review_due (review_due_at, review_breached_at), -- 超期扫描的范围查询
   CONSTRAINT fk_task_story
     FOREIGN KEY (story_id) REFERENCES user_stories(id)
     ON UPDATE CASCADE ON DELETE CASCADE
@@ -79,11 +90,15 @@ CREATE TABLE IF NOT EXISTS task_assignments (
   task_id        INT NOT NULL,
   user           VARCHAR(255),
   role           VARCHAR(20) NOT NULL, -- 'DEV' or 'REVIEW'
-  remaining_days INT DEFAULT 0,
+  remaining_days INT DEFAULT 0, -- 旧倒计时列，仅在 due_date 为空时读取
+  due_date       DATE,          -- 到期日；剩余天数 = due_date - 当前（模拟）日期
   started_at     DATETIME,
-  status         VARCHAR(20) DEFAULT 'ACTIVE',
+  status         VARCHAR(20) DEFAULT 'ACTIVE', -- 'ACTIVE', 'DONE', 'REASSIGNED'（超期评审已转交）
   decision       VARCHAR(20), -- 'APPROVED', 'REJECTED'
   created_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  KEY ix_task_assignments_status_due (status, due_date),
+  KEY ix_task_assignments_task_role (task_id, role),
+  KEY ix_task_assignments_user_status_role (user, status, role), -- 个人工作量查询
   CONSTRAINT fk_assignment_task
     FOREIGN KEY (task_id) REFERENCES tasks(id)
     ON UPDATE CASCADE ON DELETE CASCADE
@@ -95,6 +110,7 @@ CREATE TABLE IF NOT EXISTS burndown_snapshots (
   sprint_id        INT NOT NULL,
   snapshot_date    DATE NOT NULL,
   remaining_points INT NOT NULL DEFAULT 0,
+  is_simulated     TINYINT(1) DEFAULT 0,
   created_at       TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   CONSTRAINT fk_snapshot_sprint
     FOREIGN KEY (sprint_id) REFERENCES sprints(id)
@@ -111,9 +127,80 @@ CREATE TABLE IF NOT EXISTS flow_snapshots (
   in_progress_count INT DEFAULT 0,
   code_review_count INT DEFAULT 0,
   done_count        INT DEFAULT 0,
+  is_simulated      TINYINT(1) DEFAULT 0,
   created_at        TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   CONSTRAINT fk_flow_sprint
     FOREIGN KEY (sprint_id) REFERENCES sprints(id)
     ON UPDATE CASCADE ON DELETE CASCADE,
   UNIQUE KEY uniq_flow_day (sprint_id, snapshot_date)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 9. 已关闭 Sprint 的快照归档（列式 JSON）
+CREATE TABLE IF NOT EXISTS snapshot_archives (
+  id              INT AUTO_INCREMENT PRIMARY KEY,
+  sprint_id       INT NOT NULL,
+  burndown_series MEDIUMTEXT,
+  flow_series     MEDIUMTEXT,
+  compacted_at    DATETIME,
+  CONSTRAINT fk_archive_sprint
+    FOREIGN KEY (sprint_id) REFERENCES sprints(id)
+    ON UPDATE CASCADE ON DELETE CASCADE,
+  UNIQUE KEY uniq_archive_sprint (sprint_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 10. 模拟时钟（多进程共享的模拟天数偏移，仅一行 id=1）
+CREATE TABLE IF NOT EXISTS simulation_clock (
+  id          INT PRIMARY KEY,
+  offset_days INT NOT NULL DEFAULT 0,
+  updated_at  DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 11. 定时任务租约（leader 选举）
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+  name        VARCHAR(64) PRIMARY KEY,
+  holder      VARCHAR(255) NOT NULL,
+  expires_at  DATETIME NOT NULL,
+  acquired_at DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 12. 后台任务队列（API 入队，backend.worker 认领执行）
+CREATE TABLE IF NOT EXISTS jobs (
+  id          INT AUTO_INCREMENT PRIMARY KEY,
+  kind        VARCHAR(50) NOT NULL,
+  payload     TEXT,
+  status      VARCHAR(20) DEFAULT 'QUEUED',
+  result      TEXT,
+  error       TEXT,
+  attempts    INT DEFAULT 0,
+  worker      VARCHAR(255),
+  created_at  DATETIME,
+  started_at  DATETIME,
+  heartbeat_at DATETIME, -- 执行中的 worker 定期续租，超过租期未续才重新入队
+  finished_at DATETIME,
+  KEY idx_jobs_status (status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 13. 任务状态变更日志（只追加；周期时间、吞吐量分析）
+CREATE TABLE IF NOT EXISTS task_transitions (
+  id              INT AUTO_INCREMENT PRIMARY KEY,
+  task_id         INT NOT NULL,
+  from_status     VARCHAR(20),          -- 为空表示任务创建
+  to_status       VARCHAR(20) NOT NULL,
+  is_blocked      BOOLEAN DEFAULT FALSE,
+  transitioned_at DATETIME NOT NULL,    -- 含模拟时钟偏移
+  KEY ix_task_transitions_task_time (task_id, transitioned_at),
+  KEY ix_task_transitions_transitioned_at (transitioned_at),
+  FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 14. 看板检查点（快照任务写入，历史看板从最近检查点回放 task_transitions 重建）
+CREATE TABLE IF NOT EXISTS board_checkpoints (
+  id            INT AUTO_INCREMENT PRIMARY KEY,
+  sprint_id     INT NOT NULL,
+  checkpoint_at DATETIME NOT NULL,
+  task_states   MEDIUMTEXT NOT NULL, -- 列式 JSON：{"task_id": [...], "status": [...], "is_blocked": [...]}
+  is_simulated  BOOLEAN DEFAULT FALSE,
+  created_at    DATETIME,
+  KEY ix_board_checkpoints_sprint_time (sprint_id, checkpoint_at),
+  FOREIGN KEY (sprint_id) REFERENCES sprints(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
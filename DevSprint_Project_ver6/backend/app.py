@@ -0,0 +1,112 @@
+import importlib
+import logging
+import os
+import sys
+from typing import Iterable, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy import text
+from sqlalchemy.orm.exc import StaleDataError
+
+from backend.compression import CompressionMiddleware
+from backend.config import env_flag
+from backend.database import SessionLocal, engine, ensure_db_ready
+from backend.leases import acquire_lease, release_lease
+from backend.observability import ProfiledRoute, instrument_requests, render_metrics
+
+# 可按部署挂载的路由模块（backend/routers/<name>.py），未挂载的模块不会被导入
+ROUTER_NAMES = ("sprints", "tasks", "review", "github", "analytics", "users", "simulate", "jobs", "admin")
+
+
+def enabled_routers() -> Tuple[str, ...]:
+    # DEVSPRINT_ROUTERS=analytics,sprints 只挂载所列路由；未设置时挂载全部
+    value = os.getenv("DEVSPRINT_ROUTERS", "").strip()
+    if not value or value == "all":
+        return ROUTER_NAMES
+    names = tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = [name for name in names if name not in ROUTER_NAMES]
+    if unknown:
+        raise ValueError(f"Unknown DEVSPRINT_ROUTERS entries: {', '.join(unknown)}")
+    return names
+
+
+def create_app(routers: Optional[Iterable[str]] = None) -> FastAPI:
+    app = FastAPI(title="DevSprint API", description="Agile Task Management API")
+    app.router.route_class = ProfiledRoute
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:3000"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    # 压缩在请求统计之内执行，Server-Timing 的 app 耗时包含压缩开销
+    if env_flag("DEVSPRINT_COMPRESSION", "1"):
+        app.add_middleware(CompressionMiddleware)
+    app.middleware("http")(instrument_requests)
+
+    for name in tuple(routers) if routers is not None else enabled_routers():
+        if name not in ROUTER_NAMES:
+            raise ValueError(f"Unknown router: {name}")
+        module = importlib.import_module(f"backend.routers.{name}")
+        app.include_router(module.router)
+
+    @app.exception_handler(StaleDataError)
+    def stale_data_conflict(request, exc: StaleDataError) -> JSONResponse:
+        # 乐观锁冲突：读取后该行已被其他写入方（Webhook、模拟器、其他用户）修改
+        return JSONResponse(status_code=409, content={"detail": "Resource was modified concurrently, reload and retry"})
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics() -> PlainTextResponse:
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    @app.get("/readyz", include_in_schema=False)
+    def readiness() -> JSONResponse:
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception as exc:
+            return JSONResponse(status_code=503, content={"ready": False, "detail": f"database unreachable: {exc}"})
+        if env_flag("DEVSPRINT_AUTO_INIT_DB", "1") and not ensure_db_ready():
+            return JSONResponse(status_code=503, content={"ready": False, "detail": "schema initialisation failed"})
+        return JSONResponse(content={"ready": True})
+
+    @app.on_event("startup")
+    def on_startup():
+        # 就绪步骤：默认在启动时执行一次 init_db；生产环境可先运行 `python -m backend.manage init-db`
+        # 并设 DEVSPRINT_AUTO_INIT_DB=0，启动时不再做任何 DDL 检查。
+        # 初始化失败时让启动直接失败（由进程管理器重启），否则演示数据与调度器永远不会启动
+        if env_flag("DEVSPRINT_AUTO_INIT_DB", "1") and not ensure_db_ready():
+            raise RuntimeError("Database initialisation failed; refusing to start without a ready schema")
+        # 多 worker 同时启动时只允许一个进程写入演示数据
+        if env_flag("DEVSPRINT_SEED_DEMO", "1") and acquire_lease("seed_demo", 300):
+            from backend.seed import seed_demo_data
+
+            db = SessionLocal()
+            try:
+                seed_demo_data(db)
+            except Exception as exc:
+                logging.exception("Demo data seeding failed: %s", exc)
+            finally:
+                db.close()
+                release_lease("seed_demo")
+        # 部署了独立 worker（python -m backend.worker）时可设 DEVSPRINT_API_SCHEDULER=0，定时任务只在 worker 中运行
+        if env_flag("DEVSPRINT_API_SCHEDULER", "1"):
+            from backend.jobs import get_scheduler
+
+            scheduler = get_scheduler()
+            if not scheduler.running:
+                scheduler.start()
+                logging.info("Background scheduler started.")
+
+    @app.on_event("shutdown")
+    def on_shutdown():
+        # 调度器从未启动时不必为关闭而导入任务模块
+        jobs = sys.modules.get("backend.jobs")
+        if jobs is not None:
+            jobs.stop_scheduler()
+
+    return app
@@ -0,0 +1,159 @@
+import json
+from datetime import datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import Session
+
+from backend.models import BoardCheckpointModel, TaskModel, TaskTransitionModel, UserStoryModel
+
+# 历史看板：检查点保存某一时刻的完整任务状态，重建时取 as_of 之前最近的检查点，
+# 再按时间顺序回放之后的 task_transitions。代价与检查点之后的变更数成正比，而不是全部历史。
+
+TaskState = Tuple[str, bool]
+
+
+def sprint_story_ids(sprint_id: int):
+    return select(UserStoryModel.id).where(UserStoryModel.sprint_id == sprint_id)
+
+
+def sprint_task_ids(sprint_id: int):
+    return select(TaskModel.id).join(UserStoryModel, TaskModel.story_id == UserStoryModel.id).where(
+        UserStoryModel.sprint_id == sprint_id
+    )
+
+
+def capture_board_checkpoint(db: Session, sprint_id: int, at: datetime, simulated: bool = False) -> None:
+    # 由快照任务调用，调用方负责提交。每个 Sprint 每天只保留一个检查点：当天已有时覆盖为最新状态，
+    # 当天更早的时刻改由前一天的检查点回放得到，结果不变
+    states: Dict[str, list] = {"task_id": [], "status": [], "is_blocked": []}
+    for row in db.execute(
+        select(TaskModel.id, TaskModel.status, TaskModel.is_blocked)
+        .where(TaskModel.id.in_(sprint_task_ids(sprint_id)))
+        .order_by(TaskModel.id)
+    ):
+        states["task_id"].append(row.id)
+        states["status"].append(row.status)
+        states["is_blocked"].append(bool(row.is_blocked))
+    day_start = datetime.combine(at.date(), time.min)
+    checkpoint = db.scalars(
+        select(BoardCheckpointModel)
+        .where(
+            BoardCheckpointModel.sprint_id == sprint_id,
+            BoardCheckpointModel.checkpoint_at >= day_start,
+            BoardCheckpointModel.checkpoint_at < day_start + timedelta(days=1),
+        )
+        .order_by(BoardCheckpointModel.checkpoint_at.desc(), BoardCheckpointModel.id.desc())
+        .limit(1)
+    ).first()
+    if checkpoint is None:
+        checkpoint = BoardCheckpointModel(sprint_id=sprint_id)
+        db.add(checkpoint)
+    checkpoint.checkpoint_at = at
+    checkpoint.task_states = json.dumps(states, separators=(",", ":"))
+    checkpoint.is_simulated = simulated
+    checkpoint.created_at = datetime.utcnow()
+
+
+def thin_board_checkpoints(db: Session, sprint_id: int) -> int:
+    """已关闭 Sprint 的检查点只保留每周第一个，以及整个 Sprint 最后一个检查点，返回删除的行数；由调用方提交。
+
+    删除检查点不影响重建结果（从更早的检查点回放即可），只是回放的变更最多为一周。
+    """
+    rows = db.execute(
+        select(BoardCheckpointModel.id, BoardCheckpointModel.checkpoint_at)
+        .where(BoardCheckpointModel.sprint_id == sprint_id)
+        .order_by(BoardCheckpointModel.checkpoint_at, BoardCheckpointModel.id)
+    ).all()
+    weeks = set()
+    stale = []
+    for row in rows[:-1]:
+        week = row.checkpoint_at.isocalendar()[:2]
+        if week in weeks:
+            stale.append(row.id)
+        weeks.add(week)
+    if stale:
+        db.execute(delete(BoardCheckpointModel).where(BoardCheckpointModel.id.in_(stale)))
+    return len(stale)
+
+
+def current_board(db: Session, sprint_id: int) -> Dict:
+    rows = db.execute(
+        select(TaskModel.id, TaskModel.status, TaskModel.is_blocked).where(TaskModel.story_id.in_(sprint_story_ids(sprint_id)))
+    )
+    states = {row.id: (row.status, bool(row.is_blocked)) for row in rows}
+    return {"checkpoint_at": None, "replayed_transitions": 0, "states": states}
+
+
+def reconstruct_board(db: Session, sprint_id: int, as_of: datetime) -> Dict:
+    """返回 as_of 时刻 Sprint 内各任务的 (status, is_blocked)，以及所用检查点与回放的变更数。
+
+    没有更早的检查点时从变更日志起点回放；变更日志启用前就存在且之后没有变化的任务无法还原。
+    """
+    checkpoint = db.execute(
+        select(BoardCheckpointModel.checkpoint_at, BoardCheckpointModel.task_states)
+        .where(BoardCheckpointModel.sprint_id == sprint_id, BoardCheckpointModel.checkpoint_at <= as_of)
+        .order_by(BoardCheckpointModel.checkpoint_at.desc(), BoardCheckpointModel.id.desc())
+        .limit(1)
+    ).first()
+    states: Dict[int, TaskState] = {}
+    query = (
+        select(TaskTransitionModel.task_id, TaskTransitionModel.to_status, TaskTransitionModel.is_blocked)
+        .where(TaskTransitionModel.transitioned_at <= as_of)
+        .order_by(TaskTransitionModel.transitioned_at, TaskTransitionModel.id)
+    )
+    checkpoint_at: Optional[datetime] = None
+    if checkpoint is not None:
+        checkpoint_at = checkpoint.checkpoint_at
+        raw = json.loads(checkpoint.task_states)
+        states = {
+            task_id: (status, blocked)
+            for task_id, status, blocked in zip(raw["task_id"], raw["status"], raw["is_blocked"])
+        }
+        # 检查点之后的变更：当前在本 Sprint 的任务用子查询过滤；检查点中已移出本 Sprint 的任务
+        # 数量很少，按其主键范围取回后在内存中筛选，不把整个 id 列表绑定进 IN (...)
+        members = set(db.scalars(sprint_task_ids(sprint_id)))
+        departed = [task_id for task_id in states if task_id not in members]
+        in_sprint = TaskTransitionModel.task_id.in_(sprint_task_ids(sprint_id))
+        if departed:
+            in_sprint = or_(in_sprint, TaskTransitionModel.task_id.between(min(departed), max(departed)))
+        query = query.where(TaskTransitionModel.transitioned_at > checkpoint_at, in_sprint)
+        rows = [row for row in db.execute(query) if row.task_id in members or row.task_id in states]
+    else:
+        rows = db.execute(query.where(TaskTransitionModel.task_id.in_(sprint_task_ids(sprint_id))))
+    replayed = 0
+    for row in rows:
+        states[row.task_id] = (row.to_status, bool(row.is_blocked))
+        replayed += 1
+    return {"checkpoint_at": checkpoint_at, "replayed_transitions": replayed, "states": states}
+
+
+def board_tasks(db: Session, sprint_id: int, states: Dict[int, TaskState]) -> List[Dict]:
+    # 任务的标题、点数等取当前值；已删除的任务不再出现在历史看板中
+    if not states:
+        return []
+    columns = (TaskModel.id, TaskModel.story_id, TaskModel.title, TaskModel.story_points, TaskModel.assignee)
+    rows = {row.id: row for row in db.execute(select(*columns).where(TaskModel.story_id.in_(sprint_story_ids(sprint_id))))}
+    # 历史看板中已移出本 Sprint 的任务：按主键范围取回，同 reconstruct_board
+    departed = [task_id for task_id in states if task_id not in rows]
+    if departed:
+        rows.update(
+            (row.id, row)
+            for row in db.execute(select(*columns).where(TaskModel.id.between(min(departed), max(departed))))
+        )
+    tasks: List[Dict] = []
+    for task_id in sorted(task_id for task_id in states if task_id in rows):
+        row = rows[task_id]
+        status, blocked = states[task_id]
+        tasks.append(
+            {
+                "id": row.id,
+                "story_id": row.story_id,
+                "title": row.title,
+                "story_points": row.story_points,
+                "assignee": row.assignee,
+                "status": status,
+                "is_blocked": blocked,
+            }
+        )
+    return tasks
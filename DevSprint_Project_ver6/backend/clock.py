@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from backend.config import env_float
+from backend.database import SessionLocal
+from backend.models import SimulationClockModel
+
+
+class SimulationClock:
+    """模拟天数偏移：持久化在 simulation_clock 表，进程内按 TTL 缓存。
+
+    写操作直接落库并刷新本进程缓存；其他 worker 最多在 ttl 秒后看到新值。
+    """
+
+    ROW_ID = 1
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._offset = 0
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _fresh(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is not None and time.monotonic() - loaded_at < self.ttl_seconds
+
+    def offset(self) -> int:
+        if not self._fresh():
+            # 双重检查：TTL 过期时只有拿到锁的第一个线程查库，其余线程等待后直接使用新值
+            with self._lock:
+                if not self._fresh():
+                    self._load()
+        return self._offset
+
+    def refresh(self) -> int:
+        with self._lock:
+            return self._load()
+
+    def _load(self) -> int:
+        # 调用方持有 self._lock
+        try:
+            with SessionLocal() as db:
+                value = (
+                    db.query(SimulationClockModel.offset_days)
+                    .filter(SimulationClockModel.id == self.ROW_ID)
+                    .scalar()
+                )
+        except Exception:
+            # 读失败时沿用旧值，避免时钟故障拖垮整个请求
+            logging.exception("Failed to load simulation clock")
+            value = self._offset
+        self._offset = value or 0
+        self._loaded_at = time.monotonic()
+        return self._offset
+
+    def set(self, offset_days: int) -> int:
+        return self._write(lambda query: query.update(
+            {SimulationClockModel.offset_days: offset_days, SimulationClockModel.updated_at: datetime.utcnow()},
+            synchronize_session=False,
+        ), offset_days)
+
+    def advance(self, days: int = 1) -> int:
+        # 原子自增，多个 worker 并发推进时不会丢失更新
+        return self._write(lambda query: query.update(
+            {
+                SimulationClockModel.offset_days: SimulationClockModel.offset_days + days,
+                SimulationClockModel.updated_at: datetime.utcnow(),
+            },
+            synchronize_session=False,
+        ), days)
+
+    def _write(self, apply_update, initial: int) -> int:
+        with self._lock, SessionLocal() as db:
+            query = db.query(SimulationClockModel).filter(SimulationClockModel.id == self.ROW_ID)
+            if not apply_update(query):
+                try:
+                    db.add(SimulationClockModel(id=self.ROW_ID, offset_days=initial))
+                    db.flush()
+                except IntegrityError:
+                    # 另一个进程刚插入了这一行，回滚后按更新重试
+                    db.rollback()
+                    apply_update(db.query(SimulationClockModel).filter(SimulationClockModel.id == self.ROW_ID))
+            db.commit()
+            value = query.with_entities(SimulationClockModel.offset_days).scalar()
+            self._offset = value or 0
+            self._loaded_at = time.monotonic()
+            return self._offset
+
+
+simulation_clock = SimulationClock(env_float("DEVSPRINT_CLOCK_TTL_SECONDS", 1.0))
+
+
+def get_today() -> date:
+    return date.today() + timedelta(days=simulation_clock.offset())
+
+
+def get_now() -> datetime:
+    # 含模拟偏移的当前 UTC 时间，用于状态变更时间戳，模拟推进的天数计入周期时间
+    return datetime.utcnow() + timedelta(days=simulation_clock.offset())
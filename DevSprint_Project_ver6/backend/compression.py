@@ -0,0 +1,89 @@
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+# IdentityResponder 自 Starlette 0.46 起提供，requirements.txt 中已固定 starlette>=0.46
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.config import env_int
+
+try:
+    import brotli
+except ImportError:  # brotli 为可选依赖，缺失时只协商 gzip
+    brotli = None
+
+COMPRESS_MIN_BYTES = env_int("DEVSPRINT_COMPRESS_MIN_BYTES", 1024)
+GZIP_LEVEL = env_int("DEVSPRINT_GZIP_LEVEL", 6)
+BROTLI_QUALITY = env_int("DEVSPRINT_BROTLI_QUALITY", 4)
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        data = self.compressor.process(body)
+        # 流式响应每块都 flush，保证客户端能及时解码
+        return data + (self.compressor.flush() if more_body else self.compressor.finish())
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    codings: Dict[str, float] = {}
+    for part in value.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def negotiate_encoding(value: str) -> Optional[str]:
+    # 按 q 值协商，同等权重时 br 优先；q=0 表示客户端明确拒绝
+    codings = parse_accept_encoding(value)
+    wildcard = codings.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = codings.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressionMiddleware:
+    # 大于阈值的响应按 Accept-Encoding 压缩；text/event-stream 与已编码的响应由 Starlette 的 responder 原样透传
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESS_MIN_BYTES,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding == "br":
+            responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        elif encoding == "gzip":
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -0,0 +1,27 @@
+import logging
+import os
+from typing import Optional
+
+logging.basicConfig(level=logging.INFO)
+
+
+def env_flag(name: str, default: str = "1") -> bool:
+    value = os.getenv(name, default)
+    return value is not None and value.lower() in {"1", "true", "yes", "y", "on"}
+
+
+def env_int(name: str, default: Optional[int] = None) -> Optional[int]:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except Exception:
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
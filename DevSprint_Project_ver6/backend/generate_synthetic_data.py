@@ -0,0 +1,357 @@
+"""Synthetic data generator that writes straight into the DevSprint database.
+
+Produces a production-shaped history with bulk inserts: many sprints, skewed
+story sizes, Zipf-like assignee load, DEV/REVIEW assignment histories (including
+rejected reviews that turn into tech debt), GitHub commit/PR links with CI
+results, the task status transition log, and backfilled burndown/flow snapshots
+derived from the same task timelines. Output is fully determined by --seed.
+
+Usage (from the project root):
+    python -m backend.generate_synthetic_data --database-url sqlite:///./synthetic.db --tasks 1000000 --reset
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+STORY_POINT_WEIGHTS = [(1, 10), (2, 18), (3, 24), (5, 20), (8, 14), (13, 9), (21, 5)]
+CI_STATES = ["success"] * 19 + ["failure"]
+
+
+class BulkWriter:
+    """Buffers rows per table and flushes them in FK dependency order."""
+
+    def __init__(self, conn, tables: List[Any], batch_size: int) -> None:
+        self.conn = conn
+        self.tables = tables
+        self.batch_size = batch_size
+        self.buffers: Dict[str, List[Dict[str, Any]]] = {table.name: [] for table in tables}
+        self.pending = 0
+        self.written: Dict[str, int] = {table.name: 0 for table in tables}
+
+    def add(self, table, row: Dict[str, Any]) -> None:
+        self.buffers[table.name].append(row)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        for table in self.tables:
+            rows = self.buffers[table.name]
+            if rows:
+                self.conn.execute(table.insert(), rows)
+                self.written[table.name] += len(rows)
+                self.buffers[table.name] = []
+        self.conn.commit()
+        self.pending = 0
+
+
+def _next_id(conn, table) -> int:
+    from sqlalchemy import func, select
+
+    return (conn.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def _zipf_weights(count: int, exponent: float) -> List[float]:
+    return [1.0 / (rank + 1) ** exponent for rank in range(count)]
+
+
+def generate(
+    tasks: int,
+    sprints: int,
+    seed: int = 7,
+    users: int = 200,
+    reviewers: int = 20,
+    sprint_days: int = 14,
+    batch_size: int = 20000,
+    reset: bool = False,
+    log=print,
+) -> Dict[str, int]:
+    # DATABASE_URL 可能由命令行覆盖，数据库模块需在调用时才导入
+    from backend import models
+    from backend.clock import get_today
+    from backend.database import Base, engine
+    from backend.review_sla import default_review_sla_days
+
+    rng = random.Random(seed)
+    sprints = max(1, sprints)
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    t_sprints = models.SprintModel.__table__
+    t_stories = models.UserStoryModel.__table__
+    t_tasks = models.TaskModel.__table__
+    t_links = models.GitHubLinkModel.__table__
+    t_assign = models.TaskAssignmentModel.__table__
+    t_burn = models.BurndownSnapshotModel.__table__
+    t_flow = models.FlowSnapshotModel.__table__
+    t_trans = models.TaskTransitionModel.__table__
+
+    user_names = [f"user_{i:04d}" for i in range(users)]
+    user_weights = _zipf_weights(users, 0.8)
+    reviewer_names = [f"reviewer_{i:03d}" for i in range(reviewers)]
+    point_values = [p for p, _ in STORY_POINT_WEIGHTS]
+    point_weights = [w for _, w in STORY_POINT_WEIGHTS]
+
+    today = get_today()
+    review_sla = timedelta(days=default_review_sla_days())
+    active_elapsed = sprint_days // 2 + 1
+    active_start = today - timedelta(days=active_elapsed - 1)
+    per_sprint = [tasks // sprints] * sprints
+    for index in range(tasks - sum(per_sprint)):
+        per_sprint[index] += 1
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        writer = BulkWriter(
+            conn, [t_sprints, t_stories, t_tasks, t_links, t_assign, t_trans, t_burn, t_flow], batch_size
+        )
+        sprint_id = _next_id(conn, t_sprints)
+        story_id = _next_id(conn, t_stories)
+        task_id = _next_id(conn, t_tasks)
+        link_id = _next_id(conn, t_links)
+        assign_id = _next_id(conn, t_assign)
+
+        for sprint_index in range(sprints):
+            is_active = sprint_index == sprints - 1
+            start = active_start - timedelta(days=(sprints - 1 - sprint_index) * sprint_days)
+            end = start + timedelta(days=sprint_days - 1)
+            observed = active_elapsed if is_active else sprint_days
+            last_day = observed - 1
+
+            def at(day: int, hour: int, sprint_start=start) -> datetime:
+                return datetime.combine(sprint_start + timedelta(days=day), datetime.min.time()) + timedelta(hours=hour)
+            writer.add(t_sprints, {
+                "id": sprint_id, "name": f"Sprint {sprint_index + 1:04d}", "goal": "synthetic",
+                "start_date": start, "end_date": end,
+                "status": "ACTIVE" if is_active else "CLOSED",
+            })
+
+            started_hist = [0] * observed
+            review_hist = [0] * observed
+            done_hist = [0] * observed
+            story_done_points = [0] * observed
+            total_story_points = 0
+            sprint_tasks = 0
+            remaining_tasks = per_sprint[sprint_index]
+
+            while remaining_tasks > 0:
+                points = rng.choices(point_values, point_weights)[0]
+                task_count = min(remaining_tasks, max(1, int(rng.lognormvariate(0.9 + points / 20, 0.5))))
+                remaining_tasks -= task_count
+                is_tech_debt_story = rng.random() < 0.06
+                task_statuses: List[str] = []
+                story_done_day: Optional[int] = 0
+
+                story_row = {
+                    "id": story_id, "sprint_id": sprint_id, "title": f"Story {story_id}",
+                    "description": "- synthetic story", "story_points": points,
+                    "priority": rng.choices([1, 2, 3, 4, 5], [8, 20, 40, 20, 12])[0],
+                    "is_tech_debt": is_tech_debt_story, "status": "PLANNED",
+                }
+                task_rows: List[Dict[str, Any]] = []
+                for _ in range(task_count):
+                    assignee = rng.choices(user_names, user_weights)[0] if rng.random() < 0.92 else None
+                    start_day = int(rng.expovariate(1 / (sprint_days * 0.25)))
+                    review_day = start_day + 1 + int(rng.expovariate(0.5))
+                    done_day = review_day + int(rng.expovariate(1.0))
+                    if done_day <= last_day:
+                        status = "DONE"
+                    elif review_day <= last_day:
+                        status = "CODE_REVIEW"
+                    elif start_day <= last_day:
+                        status = "IN_PROGRESS"
+                    else:
+                        status = "TODO"
+                    task_statuses.append(status)
+                    if start_day <= last_day:
+                        started_hist[start_day] += 1
+                    if review_day <= last_day:
+                        review_hist[review_day] += 1
+                    if status == "DONE":
+                        done_hist[done_day] += 1
+                        story_done_day = max(story_done_day, done_day) if story_done_day is not None else None
+                    else:
+                        story_done_day = None
+
+                    rejected = status in ("DONE", "CODE_REVIEW") and rng.random() < 0.08
+                    ci_state = rng.choice(CI_STATES) if status != "TODO" else None
+                    review_started = (
+                        datetime.combine(start + timedelta(days=review_day), datetime.min.time())
+                        if status in ("CODE_REVIEW", "DONE") else None
+                    )
+                    task_rows.append({
+                        "id": task_id, "story_id": story_id, "title": f"Task {task_id}", "status": status,
+                        "story_points": rng.choices([1, 2, 3, 5, 8], [25, 30, 25, 15, 5])[0],
+                        "is_tech_debt": is_tech_debt_story or rejected, "assignee": assignee, "reviewer": None,
+                        "review_started_at": review_started,
+                        # 评审中的任务带 SLA 截止时间，超期标记由扫描任务写入
+                        "review_due_at": review_started + review_sla if status == "CODE_REVIEW" else None,
+                        "is_blocked": ci_state == "failure" and status != "DONE",
+                        "tech_debt_estimate_days": rng.randint(1, 3) if rejected else None,
+                    })
+
+                    # 状态变更日志：创建于 Sprint 首日，随后按同一时间线推进（被驳回的任务多一轮评审）
+                    steps = [(None, "TODO", at(0, 8))]
+                    if status != "TODO":
+                        steps.append(("TODO", "IN_PROGRESS", at(start_day, rng.randint(9, 12))))
+                    if status in ("CODE_REVIEW", "DONE"):
+                        review_at = at(review_day, rng.randint(13, 15))
+                        steps.append(("IN_PROGRESS", "CODE_REVIEW", review_at))
+                        if rejected:
+                            steps.append(("CODE_REVIEW", "IN_PROGRESS", review_at + timedelta(hours=1)))
+                            steps.append(("IN_PROGRESS", "CODE_REVIEW", review_at + timedelta(hours=2)))
+                    if status == "DONE":
+                        steps.append(("CODE_REVIEW", "DONE", at(done_day, rng.randint(18, 20))))
+                    task_rows[-1]["_transitions"] = [
+                        {
+                            "task_id": task_id, "from_status": from_status, "to_status": to_status,
+                            "is_blocked": task_rows[-1]["is_blocked"] and index == len(steps) - 1,
+                            "transitioned_at": moment,
+                        }
+                        for index, (from_status, to_status, moment) in enumerate(steps)
+                    ]
+
+                    if assignee:
+                        dev_done = status in ("CODE_REVIEW", "DONE")
+                        writer_rows = [{
+                            "id": assign_id, "task_id": task_id, "user": assignee, "role": "DEV",
+                            "due_date": today + timedelta(days=0 if dev_done else max(0, review_day - last_day)),
+                            "started_at": datetime.combine(start + timedelta(days=min(start_day, last_day)),
+                                                           datetime.min.time()),
+                            "status": "DONE" if dev_done else "ACTIVE", "decision": None,
+                        }]
+                        assign_id += 1
+                    else:
+                        writer_rows = []
+                    if status in ("CODE_REVIEW", "DONE"):
+                        for reviewer in rng.sample(reviewer_names, k=min(len(reviewer_names), rng.randint(1, 2))):
+                            if rejected:
+                                writer_rows.append({
+                                    "id": assign_id, "task_id": task_id, "user": reviewer, "role": "REVIEW",
+                                    "due_date": review_started.date(), "started_at": review_started, "status": "DONE",
+                                    "decision": "REJECTED",
+                                })
+                                assign_id += 1
+                            writer_rows.append({
+                                "id": assign_id, "task_id": task_id, "user": reviewer, "role": "REVIEW",
+                                "due_date": today + timedelta(days=0 if status == "DONE" else rng.randint(0, 2)),
+                                "started_at": review_started,
+                                "status": "DONE" if status == "DONE" else "ACTIVE",
+                                "decision": "APPROVED" if status == "DONE" else None,
+                            })
+                            assign_id += 1
+                    task_rows[-1]["_assignments"] = writer_rows
+
+                    links = []
+                    if status != "TODO" and (status != "IN_PROGRESS" or rng.random() < 0.5):
+                        for _ in range(rng.randint(1, 3)):
+                            links.append({
+                                "id": link_id, "task_id": task_id, "commit_hash": f"{rng.getrandbits(160):040x}",
+                                "pr_url": None, "repo_name": "synthetic/service", "pr_state": None,
+                                "pr_merged": False, "ci_status": ci_state,
+                            })
+                            link_id += 1
+                    if status in ("CODE_REVIEW", "DONE"):
+                        links.append({
+                            "id": link_id, "task_id": task_id, "commit_hash": None,
+                            "pr_url": f"https://github.com/synthetic/service/pull/{task_id}",
+                            "repo_name": "synthetic/service",
+                            "pr_state": "closed" if status == "DONE" else "open",
+                            "pr_merged": status == "DONE", "ci_status": ci_state,
+                        })
+                        link_id += 1
+                    task_rows[-1]["_links"] = links
+                    task_id += 1
+
+                if all(s == "DONE" for s in task_statuses):
+                    story_row["status"] = "DONE"
+                elif any(s in ("IN_PROGRESS", "CODE_REVIEW") for s in task_statuses):
+                    story_row["status"] = "ACTIVE"
+                writer.add(t_stories, story_row)
+                for row in task_rows:
+                    assignments = row.pop("_assignments")
+                    links = row.pop("_links")
+                    transitions = row.pop("_transitions")
+                    writer.add(t_tasks, row)
+                    for link in links:
+                        writer.add(t_links, link)
+                    for assignment in assignments:
+                        writer.add(t_assign, assignment)
+                    for transition in transitions:
+                        writer.add(t_trans, transition)
+                total_story_points += points
+                if story_done_day is not None:
+                    story_done_points[story_done_day] += points
+                sprint_tasks += task_count
+                story_id += 1
+
+            # 用与任务相同的时间线回填每日燃尽与累积流快照
+            started_count = reviewed_count = done_count = done_points = 0
+            for day in range(observed):
+                started_count += started_hist[day]
+                reviewed_count += review_hist[day]
+                done_count += done_hist[day]
+                done_points += story_done_points[day]
+                snapshot_date = start + timedelta(days=day)
+                created_at = datetime.combine(snapshot_date, datetime.min.time())
+                writer.add(t_burn, {
+                    "sprint_id": sprint_id, "snapshot_date": snapshot_date,
+                    "remaining_points": total_story_points - done_points,
+                    "is_simulated": False, "created_at": created_at,
+                })
+                writer.add(t_flow, {
+                    "sprint_id": sprint_id, "snapshot_date": snapshot_date,
+                    "todo_count": sprint_tasks - started_count,
+                    "in_progress_count": started_count - reviewed_count,
+                    "code_review_count": reviewed_count - done_count,
+                    "done_count": done_count,
+                    "is_simulated": False, "created_at": created_at,
+                })
+            sprint_id += 1
+            if (sprint_index + 1) % max(1, sprints // 10) == 0:
+                log(f"  ... {sprint_index + 1}/{sprints} sprints, {task_id - 1} tasks "
+                    f"({time.perf_counter() - started:.1f}s)")
+        writer.flush()
+
+    log(f"Generated {writer.written} in {time.perf_counter() - started:.1f}s")
+    return writer.written
+
+
+def main_cli() -> int:
+    parser = argparse.ArgumentParser(description="Bulk-load synthetic DevSprint history into the database")
+    parser.add_argument("--database-url", help="Overrides DATABASE_URL")
+    parser.add_argument("--tasks", type=int, default=100000, help="Total number of tasks")
+    parser.add_argument("--sprints", type=int, default=52, help="Number of sprints (the last one is ACTIVE)")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--reviewers", type=int, default=20)
+    parser.add_argument("--sprint-days", type=int, default=14)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--batch-size", type=int, default=20000)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    generate(
+        tasks=args.tasks,
+        sprints=args.sprints,
+        seed=args.seed,
+        users=args.users,
+        reviewers=args.reviewers,
+        sprint_days=args.sprint_days,
+        batch_size=args.batch_size,
+        reset=args.reset,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
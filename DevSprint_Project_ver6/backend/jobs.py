@@ -0,0 +1,345 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.clock import get_today
+from backend.config import env_int
+from backend.database import SessionLocal
+from backend.leases import SCHEDULER_LEASE, SCHEDULER_LEASE_SECONDS, acquire_lease, release_lease
+from backend.models import JobModel, JobStatus
+from backend.observability import JOB_DURATION, JOB_LAST_SUCCESS, JOB_RUNS, SCHEDULER_LEADER
+from backend.review_sla import run_review_breach_scan
+from backend.reviewers import run_review_rebalance
+from backend.schemas import JobResponse
+from backend.snapshots import capture_burndown_snapshots, compact_snapshot_history
+
+
+def is_scheduler_leader() -> bool:
+    leader = acquire_lease(SCHEDULER_LEASE, SCHEDULER_LEASE_SECONDS)
+    SCHEDULER_LEADER.set((), 1 if leader else 0)
+    return leader
+
+
+def scheduler_heartbeat() -> None:
+    # 定期续租，保证同一时刻只有一个稳定的 leader；leader 退出后租约过期由其他进程接管
+    is_scheduler_leader()
+
+
+def track_job(name: str, func):
+    # 包装定时任务：记录耗时与结果，异常在此记录日志而不是交给 APScheduler；
+    # 未持有调度租约的进程直接跳过，避免多 worker 重复执行
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        if not is_scheduler_leader():
+            JOB_RUNS.inc((name, "skipped"))
+            return None
+        started = time.perf_counter()
+        outcome = "success"
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            outcome = "error"
+            logging.exception("Scheduled job %s failed", name)
+        finally:
+            JOB_DURATION.observe((name,), time.perf_counter() - started)
+            JOB_RUNS.inc((name, outcome))
+            if outcome == "success":
+                JOB_LAST_SUCCESS.set((name,), time.time())
+
+    run.__name__ = name
+    return run
+
+
+def poll_github_updates():
+    # 这里可以扩展调用 GitHub API，同步最新 commit/PR
+    logging.info("GitHub polling executed - integrate with GitHub API here.")
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    # 首次使用时才导入 APScheduler 并注册任务，不跑调度器的进程（只读节点、脚本）无需加载
+    global _scheduler
+    if _scheduler is None:
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        scheduler = BackgroundScheduler(timezone=os.getenv("TZ", "UTC"))
+        scheduler.add_job(
+            track_job("capture_burndown_snapshots", functools.partial(capture_burndown_snapshots, raise_errors=True)),
+            "cron",
+            id="capture_burndown_snapshots",
+            hour=0,
+            minute=0,
+        )
+        scheduler.add_job(
+            track_job("compact_snapshot_history", functools.partial(compact_snapshot_history, raise_errors=True)),
+            "cron",
+            id="compact_snapshot_history",
+            hour=0,
+            minute=30,
+        )
+        scheduler.add_job(
+            track_job("scan_review_breaches", functools.partial(run_review_breach_scan, raise_errors=True)),
+            "interval",
+            id="scan_review_breaches",
+            minutes=env_int("DEVSPRINT_REVIEW_BREACH_SCAN_MINUTES", 5) or 5,
+        )
+        scheduler.add_job(
+            track_job("rebalance_reviews", functools.partial(run_review_rebalance, raise_errors=True)),
+            "interval",
+            id="rebalance_reviews",
+            minutes=env_int("DEVSPRINT_REVIEW_REBALANCE_MINUTES", 30) or 30,
+        )
+        scheduler.add_job(
+            track_job("poll_github_updates", poll_github_updates),
+            "interval",
+            id="poll_github_updates",
+            minutes=10,
+        )
+        scheduler.add_job(
+            scheduler_heartbeat,
+            "interval",
+            id="scheduler_heartbeat",
+            seconds=max(5, SCHEDULER_LEASE_SECONDS // 3),
+        )
+        _scheduler = scheduler
+    return _scheduler
+
+
+def stop_scheduler() -> None:
+    if _scheduler is not None and _scheduler.running:
+        _scheduler.shutdown(wait=False)
+    release_lease(SCHEDULER_LEASE)
+
+
+# 后台任务队列：kind -> 处理函数（参数为 payload，返回可 JSON 序列化的结果）
+def _job_capture_snapshots(payload: Dict) -> Dict:
+    target = date.fromisoformat(payload["date"]) if payload.get("date") else None
+    capture_burndown_snapshots(target, simulated=bool(payload.get("simulated")), raise_errors=True)
+    return {"snapshot_date": (target or get_today()).isoformat()}
+
+
+def _job_poll_github(payload: Dict) -> Dict:
+    poll_github_updates()
+    return {}
+
+
+def _job_simulate_advance_days(payload: Dict) -> Dict:
+    # 模拟代码只在真正执行模拟任务时加载，只读分析节点不会导入
+    from backend.simulation import run_simulation_days
+
+    return run_simulation_days(int(payload["days"]))
+
+
+def _job_simulate_set_remaining_days(payload: Dict) -> Dict:
+    from backend.simulation import run_set_remaining_days
+
+    return run_set_remaining_days(int(payload["remaining_days"]))
+
+
+JOB_HANDLERS = {
+    "capture_snapshots": _job_capture_snapshots,
+    "compact_snapshots": lambda payload: compact_snapshot_history(raise_errors=True),
+    "poll_github": _job_poll_github,
+    "rebalance_reviews": lambda payload: run_review_rebalance(raise_errors=True),
+    "scan_review_breaches": lambda payload: run_review_breach_scan(raise_errors=True),
+    "simulate_advance_days": _job_simulate_advance_days,
+    "simulate_set_remaining_days": _job_simulate_set_remaining_days,
+}
+JOB_MAX_ATTEMPTS = env_int("DEVSPRINT_JOB_MAX_ATTEMPTS", 3)
+# 执行中的任务每 JOB_LEASE_SECONDS / 4 秒续租一次，超过 JOB_LEASE_SECONDS 未续租才重新入队
+JOB_LEASE_SECONDS = max(4, env_int("DEVSPRINT_JOB_LEASE_SECONDS", 120) or 120)
+
+
+def job_to_response(job: JobModel) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        kind=job.kind,
+        status=job.status,
+        payload=json.loads(job.payload) if job.payload else None,
+        result=json.loads(job.result) if job.result else None,
+        error=job.error,
+        attempts=job.attempts or 0,
+        worker=job.worker,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def enqueue_job(db: Session, kind: str, payload: Optional[Dict] = None) -> JobModel:
+    if kind not in JOB_HANDLERS:
+        raise HTTPException(status_code=400, detail=f"Unknown job kind: {kind}")
+    job = JobModel(kind=kind, payload=json.dumps(payload or {}), status=JobStatus.QUEUED.value)
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def enqueue_job_response(kind: str, payload: Dict) -> JSONResponse:
+    db = SessionLocal()
+    try:
+        job = enqueue_job(db, kind, payload)
+        return JSONResponse(
+            status_code=202,
+            content=job_to_response(job).model_dump(mode="json"),
+            headers={"Location": f"/api/jobs/{job.id}"},
+        )
+    finally:
+        db.close()
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    # 租约过期（worker 崩溃、失联）的任务重新入队，超过重试次数则标记失败；
+    # 仍在执行的任务由 JobHeartbeat 续租，运行时间再长也不会被重复执行
+    cutoff = datetime.utcnow() - timedelta(seconds=JOB_LEASE_SECONDS)
+    stale = (
+        JobModel.status == JobStatus.RUNNING.value,
+        func.coalesce(JobModel.heartbeat_at, JobModel.started_at) < cutoff,
+    )
+    failed = (
+        db.query(JobModel)
+        .filter(*stale, JobModel.attempts >= JOB_MAX_ATTEMPTS)
+        .update(
+            {JobModel.status: JobStatus.FAILED.value, JobModel.error: "Lease expired", JobModel.finished_at: datetime.utcnow()},
+            synchronize_session=False,
+        )
+    )
+    requeued = (
+        db.query(JobModel)
+        .filter(*stale)
+        .update({JobModel.status: JobStatus.QUEUED.value, JobModel.worker: None}, synchronize_session=False)
+    )
+    db.commit()
+    return failed + requeued
+
+
+def claim_next_job(worker_id: str) -> Optional[int]:
+    """按创建顺序认领一个排队任务；条件 UPDATE 保证多个 worker 不会认领同一任务。"""
+    db = SessionLocal()
+    try:
+        candidates = [
+            row.id
+            for row in db.execute(
+                select(JobModel.id)
+                .where(JobModel.status == JobStatus.QUEUED.value)
+                .order_by(JobModel.id)
+                .limit(5)
+            )
+        ]
+        for job_id in candidates:
+            claimed = (
+                db.query(JobModel)
+                .filter(JobModel.id == job_id, JobModel.status == JobStatus.QUEUED.value)
+                .update(
+                    {
+                        JobModel.status: JobStatus.RUNNING.value,
+                        JobModel.worker: worker_id,
+                        JobModel.started_at: datetime.utcnow(),
+                        JobModel.heartbeat_at: datetime.utcnow(),
+                        JobModel.attempts: JobModel.attempts + 1,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if claimed:
+                return job_id
+        return None
+    finally:
+        db.close()
+
+
+def _owned_by(job_id: int, worker_id: str) -> tuple:
+    return (
+        JobModel.id == job_id,
+        JobModel.worker == worker_id,
+        JobModel.status == JobStatus.RUNNING.value,
+    )
+
+
+class JobHeartbeat:
+    """任务执行期间在后台线程中定期续租（更新 heartbeat_at）。
+
+    续租以 worker 与 RUNNING 状态为条件；任务已被回收（租约曾经过期）时停止续租并记录日志。
+    """
+
+    def __init__(self, job_id: int, worker_id: str, interval: float) -> None:
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"job-heartbeat-{job_id}", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                with SessionLocal() as db:
+                    renewed = (
+                        db.query(JobModel)
+                        .filter(*_owned_by(self.job_id, self.worker_id))
+                        .update({JobModel.heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+                    )
+                    db.commit()
+            except Exception:
+                # 单次续租失败不致命，租期内还有多次机会
+                logging.exception("Failed to renew lease of job %s", self.job_id)
+                continue
+            if not renewed:
+                logging.warning("Job %s is no longer owned by %s, stopping heartbeat", self.job_id, self.worker_id)
+                return
+
+    def __enter__(self) -> "JobHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def run_job(job_id: int, worker_id: str) -> JobModel:
+    db = SessionLocal()
+    try:
+        job = db.get(JobModel, job_id)
+        kind, payload = job.kind, json.loads(job.payload or "{}")
+        db.rollback()  # 执行期间不占用连接上的读事务
+        started = time.perf_counter()
+        outcome = "success"
+        values = {JobModel.result: None, JobModel.error: None}
+        with JobHeartbeat(job_id, worker_id, JOB_LEASE_SECONDS / 4):
+            try:
+                result = JOB_HANDLERS[kind](payload)
+                values.update({JobModel.status: JobStatus.DONE.value, JobModel.result: json.dumps(result, default=str)})
+            except Exception as exc:
+                outcome = "error"
+                logging.exception("Job %s (%s) failed", job_id, kind)
+                values.update({
+                    JobModel.status: JobStatus.FAILED.value,
+                    JobModel.error: exc.detail if isinstance(exc, HTTPException) else str(exc),
+                })
+        values[JobModel.finished_at] = datetime.utcnow()
+        # 只有仍持有该任务时才写入结果；租约曾过期并被其他 worker 认领时以对方的结果为准
+        owned = db.query(JobModel).filter(*_owned_by(job_id, worker_id)).update(values, synchronize_session=False)
+        db.commit()
+        if not owned:
+            outcome = "lost_lease"
+            logging.warning("Job %s (%s) finished on %s after losing its lease; result discarded", job_id, kind, worker_id)
+        JOB_DURATION.observe((kind,), time.perf_counter() - started)
+        JOB_RUNS.inc((kind, outcome))
+        db.expire_all()
+        return db.get(JobModel, job_id)
+    finally:
+        db.close()
@@ -0,0 +1,61 @@
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from backend.config import env_int
+from backend.database import SessionLocal
+from backend.models import SchedulerLeaseModel
+
+
+# 定时任务选主：每个进程都启动调度器，但只有持有租约的进程真正执行任务
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+SCHEDULER_LEASE = "scheduler"
+SCHEDULER_LEASE_SECONDS = env_int("DEVSPRINT_SCHEDULER_LEASE_SECONDS", 60)
+
+
+def acquire_lease(name: str, ttl_seconds: int) -> bool:
+    """获取或续期租约：仅当租约属于自己或已过期时条件 UPDATE 成功。"""
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    try:
+        with SessionLocal() as db:
+            updated = (
+                db.query(SchedulerLeaseModel)
+                .filter(
+                    SchedulerLeaseModel.name == name,
+                    or_(SchedulerLeaseModel.holder == WORKER_ID, SchedulerLeaseModel.expires_at < now),
+                )
+                .update(
+                    {SchedulerLeaseModel.holder: WORKER_ID, SchedulerLeaseModel.expires_at: expires_at},
+                    synchronize_session=False,
+                )
+            )
+            if not updated:
+                if db.get(SchedulerLeaseModel, name) is not None:
+                    return False
+                db.add(SchedulerLeaseModel(name=name, holder=WORKER_ID, expires_at=expires_at, acquired_at=now))
+                try:
+                    db.flush()
+                except IntegrityError:
+                    return False
+            db.commit()
+            return True
+    except Exception:
+        logging.exception("Failed to acquire lease %s", name)
+        return False
+
+
+def release_lease(name: str) -> None:
+    try:
+        with SessionLocal() as db:
+            db.query(SchedulerLeaseModel).filter(
+                SchedulerLeaseModel.name == name, SchedulerLeaseModel.holder == WORKER_ID
+            ).update({SchedulerLeaseModel.expires_at: datetime.utcnow()}, synchronize_session=False)
+            db.commit()
+    except Exception:
+        logging.exception("Failed to release lease %s", name)
@@ -0,0 +1,80 @@
+"""Management commands for DevSprint.
+
+Schema creation and demo seeding are explicit steps instead of import-time side
+effects. Run them once per deployment (e.g. as an init container), then start
+the API with `DEVSPRINT_AUTO_INIT_DB=0 DEVSPRINT_SEED_DEMO=0` so pods start
+without any DDL round-trips.
+
+Usage (from the project root):
+    python -m backend.manage init-db
+    python -m backend.manage seed-demo
+    python -m backend.manage check
+    python -m backend.manage --database-url sqlite:///./devsprint.db init-db
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+def init_db() -> int:
+    from backend import database
+
+    started = time.perf_counter()
+    database.init_db()
+    print(f"Schema ready on {database.engine.dialect.name} in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+def seed_demo() -> int:
+    from backend import database
+    from backend.seed import seed_demo_data
+
+    database.init_db()
+    db = database.SessionLocal()
+    try:
+        seed_demo_data(db)
+    finally:
+        db.close()
+    return 0
+
+
+def check() -> int:
+    from sqlalchemy import inspect
+
+    from backend import models  # noqa: F401  registers every table on Base.metadata
+    from backend.database import Base, engine
+
+    existing = set(inspect(engine).get_table_names())
+    missing = sorted(set(Base.metadata.tables) - existing)
+    if missing:
+        print(f"Missing tables: {', '.join(missing)} (run `python -m backend.manage init-db`)")
+        return 1
+    print("Schema OK")
+    return 0
+
+
+COMMANDS = {
+    "init-db": (init_db, "Create missing tables and apply column patches"),
+    "seed-demo": (seed_demo, "Initialise the schema and load demo data if the board is empty"),
+    "check": (check, "Exit non-zero if any table is missing"),
+}
+
+
+def main_cli() -> int:
+    parser = argparse.ArgumentParser(description="DevSprint management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text)
+    parser.add_argument("--database-url", help="Override DATABASE_URL")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    # backend.database reads DATABASE_URL at import time, so commands import it lazily
+    return COMMANDS[args.command][0]()
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
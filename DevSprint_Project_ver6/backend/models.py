@@ -0,0 +1,293 @@
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import relationship
+
+from backend.database import Base
+
+
+class SprintStatus(str, Enum):
+    ACTIVE = "ACTIVE"
+    CLOSED = "CLOSED"
+
+
+class TaskStatus(str, Enum):
+    TODO = "TODO"
+    IN_PROGRESS = "IN_PROGRESS"
+    CODE_REVIEW = "CODE_REVIEW"
+    DONE = "DONE"
+
+
+class UserStoryStatus(str, Enum):
+    PLANNED = "PLANNED"
+    ACTIVE = "ACTIVE"
+    DONE = "DONE"
+
+
+# 2. 定义数据库模型
+class SprintModel(Base):
+    __tablename__ = "sprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False)
+    goal = Column(String(500), nullable=True)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    status = Column(String(20), default=SprintStatus.ACTIVE.value)
+    # 关闭（滚动）时固化的速度汇总，结转后的未完成故事不再计入本 Sprint
+    committed_points = Column(Integer, nullable=True)
+    completed_points = Column(Integer, nullable=True)
+    closed_at = Column(DateTime, nullable=True)
+    # 评审 SLA 天数；为空时使用 DEVSPRINT_REVIEW_SLA_DAYS
+    review_sla_days = Column(Integer, nullable=True)
+
+    stories = relationship(
+        "UserStoryModel",
+        back_populates="sprint",
+        cascade="all, delete-orphan",
+    )
+    snapshots = relationship(
+        "BurndownSnapshotModel",
+        back_populates="sprint",
+        cascade="all, delete-orphan",
+    )
+
+
+class UserStoryModel(Base):
+    __tablename__ = "user_stories"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sprint_id = Column(Integer, ForeignKey("sprints.id", ondelete="SET NULL"))
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    story_points = Column(Integer, nullable=False)
+    priority = Column(Integer, default=3)
+    is_tech_debt = Column(Boolean, default=False)
+    status = Column(String(20), default=UserStoryStatus.PLANNED.value)
+    # 乐观并发控制：UPDATE 以 version 为条件并自增，并发写入方版本落后时抛出 StaleDataError
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
+
+    sprint = relationship("SprintModel", back_populates="stories")
+    tasks = relationship(
+        "TaskModel",
+        back_populates="story",
+        cascade="all, delete-orphan",
+    )
+
+
+class TaskModel(Base):
+    __tablename__ = "tasks"
+    __table_args__ = (
+        # 按负责人统计未完成任务只读索引即可
+        Index("ix_tasks_assignee_status", "assignee", "status"),
+        # 超期扫描：按截止时间做范围查询，只有评审中的任务有截止时间
+        Index("ix_tasks_review_due", "review_due_at", "review_breached_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    story_id = Column(Integer, ForeignKey("user_stories.id", ondelete="CASCADE"), index=True)
+    title = Column(String(255), nullable=False)
+    status = Column(String(20), default=TaskStatus.TODO.value)
+    story_points = Column(Integer, nullable=False)
+    is_tech_debt = Column(Boolean, default=False)
+    assignee = Column(String(255), nullable=True)
+    reviewer = Column(String(255), nullable=True)
+    review_started_at = Column(DateTime, nullable=True)
+    review_due_at = Column(DateTime, nullable=True)  # review_started_at + 评审 SLA
+    review_breached_at = Column(DateTime, nullable=True)  # 超期扫描发现并发布的时间
+    is_blocked = Column(Boolean, default=False)
+    tech_debt_estimate_days = Column(Integer, nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
+
+    story = relationship("UserStoryModel", back_populates="tasks")
+    github_links = relationship(
+        "GitHubLinkModel",
+        back_populates="task",
+        cascade="all, delete-orphan",
+    )
+    assignments = relationship(
+        "TaskAssignmentModel",
+        back_populates="task",
+        cascade="all, delete-orphan",
+    )
+
+
+class GitHubLinkModel(Base):
+    __tablename__ = "github_links"
+
+    id = Column(Integer, primary_key=True, index=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"))
+    commit_hash = Column(String(100), nullable=True)
+    pr_url = Column(String(500), nullable=True)
+    repo_name = Column(String(255), nullable=True)
+    pr_state = Column(String(50), nullable=True)
+    pr_merged = Column(Boolean, default=False)
+    ci_status = Column(String(50), nullable=True)
+
+    task = relationship("TaskModel", back_populates="github_links")
+
+
+def remaining_days_until(due_date: Optional[date], legacy_days: Optional[int], today: date) -> Optional[int]:
+    # 剩余天数由到期日推算；尚未回填到期日的旧数据沿用原倒计时列
+    if due_date is None:
+        return legacy_days
+    return max(0, (due_date - today).days)
+
+
+class TaskAssignmentModel(Base):
+    __tablename__ = "task_assignments"
+    __table_args__ = (
+        Index("ix_task_assignments_status_due", "status", "due_date"),
+        # SQLite 不会为外键自动建索引；按任务查分配（含相关子查询）依赖它
+        Index("ix_task_assignments_task_role", "task_id", "role"),
+        # 个人工作量：按人员查进行中的 DEV / REVIEW 分配
+        Index("ix_task_assignments_user_status_role", "user", "status", "role"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"))
+    user = Column(String(255), nullable=True)
+    role = Column(String(20), nullable=False)
+    # 旧的逐日递减倒计时列，只在 due_date 为空时读取，不再写入
+    legacy_remaining_days = Column("remaining_days", Integer, default=0)
+    due_date = Column(Date, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    status = Column(String(20), default="ACTIVE")
+    decision = Column(String(20), nullable=True)
+
+    task = relationship("TaskModel", back_populates="assignments")
+
+    @property
+    def remaining_days(self) -> Optional[int]:
+        from backend.clock import get_today
+
+        return remaining_days_until(self.due_date, self.legacy_remaining_days, get_today())
+
+    @remaining_days.setter
+    def remaining_days(self, days: Optional[int]) -> None:
+        from backend.clock import get_today
+
+        if days is None:
+            self.due_date = self.legacy_remaining_days = None
+        else:
+            self.due_date = get_today() + timedelta(days=days)
+
+
+class TaskTransitionModel(Base):
+    # 只追加的任务状态变更日志：每次 status / is_blocked 变化写一行，由 backend.transitions 在 flush 时生成
+    __tablename__ = "task_transitions"
+    __table_args__ = (Index("ix_task_transitions_task_time", "task_id", "transitioned_at"),)
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    from_status = Column(String(20), nullable=True)  # 为空表示任务创建
+    to_status = Column(String(20), nullable=False)
+    is_blocked = Column(Boolean, default=False)
+    transitioned_at = Column(DateTime, nullable=False, index=True)
+
+    task = relationship("TaskModel")
+
+class BurndownSnapshotModel(Base):
+    __tablename__ = "burndown_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sprint_id = Column(Integer, ForeignKey("sprints.id", ondelete="CASCADE"))
+    snapshot_date = Column(Date, default=date.today)
+    remaining_points = Column(Integer, default=0)
+    is_simulated = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    sprint = relationship("SprintModel", back_populates="snapshots")
+
+
+class FlowSnapshotModel(Base):
+    __tablename__ = "flow_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sprint_id = Column(Integer, ForeignKey("sprints.id", ondelete="CASCADE"))
+    snapshot_date = Column(Date, default=date.today)
+    todo_count = Column(Integer, default=0)
+    in_progress_count = Column(Integer, default=0)
+    code_review_count = Column(Integer, default=0)
+    done_count = Column(Integer, default=0)
+    is_simulated = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class SnapshotArchiveModel(Base):
+    # 已关闭 Sprint 的快照历史压缩为一行列式 JSON，原始快照行随之删除
+    __tablename__ = "snapshot_archives"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sprint_id = Column(Integer, ForeignKey("sprints.id", ondelete="CASCADE"), unique=True)
+    burndown_series = Column(Text, nullable=True)
+    flow_series = Column(Text, nullable=True)
+    compacted_at = Column(DateTime, default=datetime.utcnow)
+
+
+class BoardCheckpointModel(Base):
+    # 看板检查点：某一时刻 Sprint 内全部任务的状态（列式 JSON），历史看板从最近的检查点回放变更日志重建
+    __tablename__ = "board_checkpoints"
+    __table_args__ = (Index("ix_board_checkpoints_sprint_time", "sprint_id", "checkpoint_at"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    sprint_id = Column(Integer, ForeignKey("sprints.id", ondelete="CASCADE"), nullable=False)
+    checkpoint_at = Column(DateTime, nullable=False)
+    task_states = Column(Text, nullable=False)
+    is_simulated = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class SimulationClockModel(Base):
+    # 全局唯一一行（id=1），多进程共享的模拟天数偏移
+    __tablename__ = "simulation_clock"
+
+    id = Column(Integer, primary_key=True)
+    offset_days = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SchedulerLeaseModel(Base):
+    # 数据库租约：同名租约同一时刻只有一个持有者（用于定时任务选主）
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(255), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    acquired_at = Column(DateTime, default=datetime.utcnow)
+
+
+class JobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class JobModel(Base):
+    # 后台任务队列：API 入队，backend.worker 进程认领执行
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=True)
+    status = Column(String(20), default=JobStatus.QUEUED.value, index=True)
+    result = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0)
+    worker = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    # 执行中的 worker 定期续租；超过租期未续才视为失联并重新入队
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
+# 放在所有模型定义之后：注册写入 task_transitions 的 flush 钩子
+from backend import transitions  # noqa: E402,F401
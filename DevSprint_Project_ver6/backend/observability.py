@@ -0,0 +1,386 @@
+import bisect
+import collections
+import contextvars
+import cProfile
+import functools
+import hmac
+import inspect
+import json
+import logging
+import marshal
+import os
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import Header, HTTPException, Request
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+
+from backend.config import env_flag, env_int
+from backend.database import engine
+
+
+# 按请求的 cProfile：由中间件放入上下文，在接口函数所在的线程内启停
+_request_profiler: contextvars.ContextVar[Optional[cProfile.Profile]] = contextvars.ContextVar(
+    "devsprint_request_profiler", default=None
+)
+
+
+def _profiled_endpoint(endpoint):
+    # include_router 会按原路由类重新构建路由，已包装过的接口不再重复包装
+    if getattr(endpoint, "_devsprint_profiled", False):
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+        # 异步接口必须保持 async def，否则 FastAPI 会把它放进线程池并拿到未 await 的协程；
+        # 采样期间事件循环上交错执行的其他协程也会计入
+        @functools.wraps(endpoint)
+        async def run(*args, **kwargs):
+            profiler = _request_profiler.get()
+            if profiler is None:
+                return await endpoint(*args, **kwargs)
+            profiler.enable()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                profiler.disable()
+
+    else:
+
+        @functools.wraps(endpoint)
+        def run(*args, **kwargs):
+            profiler = _request_profiler.get()
+            if profiler is None:
+                return endpoint(*args, **kwargs)
+            profiler.enable()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                profiler.disable()
+
+    run._devsprint_profiled = True
+    return run
+
+
+class ProfiledRoute(APIRoute):
+    # 同步接口在线程池中执行，只有包在接口函数外层才能采集到实际工作；异步接口用 async 包装
+    def __init__(self, path: str, endpoint, **kwargs) -> None:
+        super().__init__(path, _profiled_endpoint(endpoint), **kwargs)
+
+
+# 请求级 SQL 统计：语句数、数据库总耗时与最慢语句
+class RequestQueryStats:
+    __slots__ = ("count", "total_seconds", "slowest_seconds", "slowest_statement")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        if elapsed > self.slowest_seconds:
+            self.slowest_seconds = elapsed
+            self.slowest_statement = statement
+
+
+_request_query_stats: contextvars.ContextVar[Optional[RequestQueryStats]] = contextvars.ContextVar(
+    "devsprint_request_query_stats", default=None
+)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_query_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_query_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+def _parse_query_budgets(raw: str) -> Dict[str, int]:
+    # 形如 "GET /api/dashboard=20,GET /api/velocity=5"
+    budgets: Dict[str, int] = {}
+    for item in raw.split(","):
+        route, _, limit = item.rpartition("=")
+        try:
+            budgets[route.strip()] = int(limit)
+        except ValueError:
+            continue
+    return budgets
+
+
+QUERY_BUDGETS = _parse_query_budgets(os.getenv("DEVSPRINT_QUERY_BUDGETS", ""))
+request_logger = logging.getLogger("devsprint.request")
+
+
+# 指标：进程内计数器，/metrics 以 Prometheus 文本格式输出
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: Dict[tuple, float] = {}
+
+    def _label_str(self, labels: tuple, extra: Optional[Dict[str, str]] = None) -> str:
+        pairs = list(zip(self.label_names, labels)) + list((extra or {}).items())
+        if not pairs:
+            return ""
+        body = ",".join(
+            f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+            for key, value in pairs
+        )
+        return "{" + body + "}"
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{self._label_str(labels)} {value}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, labels: tuple = (), value: float = 0) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, labels: tuple, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * len(self.buckets), 0, 0.0]
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += 1
+            state[2] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = [(labels, list(state[0]), state[1], state[2]) for labels, state in self._values.items()]
+        for labels, bucket_counts, count, total in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{self._label_str(labels, {'le': str(bound)})} {cumulative}")
+            lines.append(f"{self.name}_bucket{self._label_str(labels, {'le': '+Inf'})} {count}")
+            lines.append(f"{self.name}_sum{self._label_str(labels)} {total}")
+            lines.append(f"{self.name}_count{self._label_str(labels)} {count}")
+        return lines
+
+
+HTTP_REQUESTS = Counter("devsprint_http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status"))
+HTTP_LATENCY = Histogram("devsprint_http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route"))
+HTTP_IN_FLIGHT = Gauge("devsprint_http_requests_in_flight", "HTTP requests currently being served.")
+DB_QUERIES = Counter("devsprint_db_queries_total", "SQL statements executed while serving requests.", ("method", "route"))
+DB_POOL_CHECKOUTS = Counter("devsprint_db_pool_checkouts_total", "Connections checked out from the SQLAlchemy pool.")
+DB_POOL_STATE = Gauge("devsprint_db_pool_connections", "SQLAlchemy pool connections by state.", ("state",))
+WEBHOOK_DELIVERIES = Counter("devsprint_webhook_deliveries_total", "GitHub webhook deliveries processed.", ("event", "outcome"))
+WEBHOOK_LINKED_TASKS = Counter("devsprint_webhook_linked_tasks_total", "Tasks linked by GitHub webhook deliveries.")
+REVIEW_ASSIGNMENTS = Counter("devsprint_review_assignments_total", "Reviewer assignments by origin.", ("origin",))
+REVIEW_SLA_BREACHES = Counter("devsprint_review_sla_breaches_total", "Reviews detected past their SLA deadline.")
+JOB_RUNS = Counter("devsprint_job_runs_total", "Scheduled job runs by outcome.", ("job", "outcome"))
+JOB_DURATION = Histogram(
+    "devsprint_job_duration_seconds",
+    "Scheduled job duration.",
+    ("job",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0),
+)
+JOB_LAST_SUCCESS = Gauge("devsprint_job_last_success_timestamp_seconds", "Unix time of the last successful job run.", ("job",))
+SCHEDULER_LEADER = Gauge("devsprint_scheduler_leader", "1 if this process holds the scheduler lease.")
+METRICS = [
+    HTTP_REQUESTS,
+    HTTP_LATENCY,
+    HTTP_IN_FLIGHT,
+    DB_QUERIES,
+    DB_POOL_CHECKOUTS,
+    DB_POOL_STATE,
+    WEBHOOK_DELIVERIES,
+    WEBHOOK_LINKED_TASKS,
+    REVIEW_ASSIGNMENTS,
+    REVIEW_SLA_BREACHES,
+    JOB_RUNS,
+    JOB_DURATION,
+    JOB_LAST_SUCCESS,
+    SCHEDULER_LEADER,
+]
+
+
+@event.listens_for(engine, "checkout")
+def _on_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKOUTS.inc()
+
+
+def _collect_pool_state() -> None:
+    pool = engine.pool
+    for state, getter in (
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ):
+        if hasattr(pool, getter):
+            # QueuePool.overflow() 在未溢出时为负数，这里按 0 上报
+            DB_POOL_STATE.set((state,), max(getattr(pool, getter)(), 0))
+
+
+def render_metrics() -> str:
+    _collect_pool_state()
+    lines: List[str] = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# 生产诊断：需 DEVSPRINT_PROFILING=1 且请求携带正确的 X-Admin-Token
+PROFILE_STORE: collections.deque = collections.deque(maxlen=env_int("DEVSPRINT_PROFILE_KEEP", 20) or 20)
+_IDLE_LEAF_FUNCTIONS = {"wait", "select", "poll", "accept", "_wait_for_tstate_lock", "get"}
+
+
+def profiling_enabled() -> bool:
+    return env_flag("DEVSPRINT_PROFILING", "0")
+
+
+def _admin_token_valid(token: Optional[str]) -> bool:
+    expected = os.getenv("DEVSPRINT_ADMIN_TOKEN")
+    return bool(expected and token and hmac.compare_digest(token, expected))
+
+
+def require_profiling_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    if not profiling_enabled():
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    if not _admin_token_valid(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+def sample_stacks(seconds: float, interval: float, include_idle: bool = False) -> Dict[str, int]:
+    # 低开销采样：定期读取所有线程的栈帧，输出 flamegraph 可用的 collapsed 格式计数
+    own_ident = threading.get_ident()
+    counts: Dict[str, int] = collections.Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            if not include_idle and frame.f_code.co_name in _IDLE_LEAF_FUNCTIONS:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            counts[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return counts
+
+
+async def instrument_requests(request: Request, call_next):
+    stats = RequestQueryStats()
+    token = _request_query_stats.set(stats)
+    profiler = None
+    if request.headers.get("x-profile") and profiling_enabled() and _admin_token_valid(
+        request.headers.get("x-admin-token")
+    ):
+        profiler = cProfile.Profile()
+    profiler_token = _request_profiler.set(profiler)
+    started = time.perf_counter()
+    HTTP_IN_FLIGHT.inc()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        _request_query_stats.reset(token)
+        _request_profiler.reset(profiler_token)
+        HTTP_IN_FLIGHT.dec()
+        elapsed = time.perf_counter() - started
+        route = request.scope.get("route")
+        # 未匹配的路径统一归为 unmatched，避免标签基数失控
+        route_label = getattr(route, "path", "unmatched")
+        HTTP_REQUESTS.inc((request.method, route_label, str(status_code)))
+        HTTP_LATENCY.observe((request.method, route_label), elapsed)
+        DB_QUERIES.inc((request.method, route_label), stats.count)
+    elapsed_ms = elapsed * 1000
+    db_ms = stats.total_seconds * 1000
+    route_key = f"{request.method} {getattr(route, 'path', request.url.path)}"
+
+    response.headers["Server-Timing"] = (
+        f'app;dur={elapsed_ms:.2f}, db;dur={db_ms:.2f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_seconds * 1000:.2f}"
+    )
+    record = {
+        "route": route_key,
+        "status": response.status_code,
+        "duration_ms": round(elapsed_ms, 2),
+        "db_queries": stats.count,
+        "db_ms": round(db_ms, 2),
+        "slowest_query_ms": round(stats.slowest_seconds * 1000, 2),
+        "slowest_query": (stats.slowest_statement or "")[:300],
+    }
+    if profiler is not None:
+        profiler.create_stats()
+        profile_id = uuid.uuid4().hex[:12]
+        PROFILE_STORE.append(
+            {
+                "id": profile_id,
+                "route": route_key,
+                "status": status_code,
+                "duration_ms": round(elapsed_ms, 2),
+                "created_at": datetime.utcnow().isoformat(),
+                "stats": marshal.dumps(profiler.stats),
+            }
+        )
+        response.headers["X-Profile-Id"] = profile_id
+    budget = QUERY_BUDGETS.get(route_key, env_int("DEVSPRINT_QUERY_BUDGET", None))
+    if budget is not None and stats.count > budget:
+        record["query_budget"] = budget
+        request_logger.warning("query budget exceeded %s", json.dumps(record, ensure_ascii=False))
+    else:
+        request_logger.info("request stats %s", json.dumps(record, ensure_ascii=False))
+    return response
@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+
+def fast_json_response(payload: Any) -> Response:
+    # orjson 原生支持 date/datetime/Enum；回退路径先转换为 JSON 兼容类型
+    if orjson is not None:
+        return ORJSONResponse(payload)
+    return JSONResponse(jsonable_encoder(payload))
@@ -0,0 +1,127 @@
+import functools
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from backend.clock import get_now, get_today
+from backend.config import env_int
+from backend.database import SessionLocal
+from backend.models import SprintModel, TaskModel, TaskStatus, UserStoryModel
+from backend.observability import REVIEW_SLA_BREACHES
+
+# 评审 SLA：进入评审时记录截止时间 review_due_at = review_started_at + SLA 天数（带索引），
+# 定时扫描只做一次范围查询即可找出新超期的评审；任务离开 CODE_REVIEW 时截止时间被清空
+# （见 transitions.py），索引中只保留评审中的任务。
+BREACH_LOG_LIMIT = 20
+
+
+@functools.lru_cache(maxsize=1)
+def default_review_sla_days() -> int:
+    # 全局默认值；Sprint 可用 review_sla_days 单独覆盖
+    return max(1, env_int("DEVSPRINT_REVIEW_SLA_DAYS", 2) or 2)
+
+
+def effective_sla_days(override: Optional[int]) -> int:
+    return override if override else default_review_sla_days()
+
+
+def task_review_slas(db: Session, task_ids: Iterable[int]) -> Dict[int, int]:
+    # 按任务所属 Sprint 取 SLA，一条查询；不属于任何 Sprint 的任务用默认值
+    ids = sorted(set(task_ids))
+    slas = {task_id: default_review_sla_days() for task_id in ids}
+    if ids:
+        rows = db.execute(
+            select(TaskModel.id, SprintModel.review_sla_days)
+            .join(UserStoryModel, TaskModel.story_id == UserStoryModel.id)
+            .join(SprintModel, UserStoryModel.sprint_id == SprintModel.id)
+            .where(TaskModel.id.in_(ids), SprintModel.review_sla_days.isnot(None))
+        )
+        for task_id, override in rows:
+            slas[task_id] = effective_sla_days(override)
+    return slas
+
+
+def start_review_clock(task: TaskModel, sla_days: int) -> None:
+    task.review_started_at = get_now()
+    task.review_due_at = task.review_started_at + timedelta(days=sla_days)
+    task.review_breached_at = None
+
+
+def breach_cutoff(today: Optional[date] = None) -> datetime:
+    # 与看板的天粒度口径一致：等待天数 > SLA，即截止日期早于今天（模拟日期）
+    return datetime.combine(today or get_today(), time.min)
+
+
+def detect_review_breaches(db: Session) -> List[int]:
+    """标记新超期的评审并发布（日志与指标），返回这些任务的 id；由调用方提交。"""
+    cutoff = breach_cutoff()
+    breached = db.execute(
+        select(TaskModel.id, TaskModel.review_due_at)
+        .where(TaskModel.review_due_at < cutoff, TaskModel.review_breached_at.is_(None))
+        .order_by(TaskModel.review_due_at)
+    ).all()
+    if breached:
+        db.execute(
+            update(TaskModel)
+            .where(TaskModel.id.in_([task_id for task_id, _ in breached]))
+            .values(review_breached_at=get_now())
+            .execution_options(synchronize_session=False)
+        )
+        # 一次扫描只记一条日志，积压较多时只列出最早到期的若干任务
+        ids = [str(task_id) for task_id, _ in breached]
+        logging.warning(
+            "Review SLA breached for %d task(s): %s%s",
+            len(ids),
+            ", ".join(ids[:BREACH_LOG_LIMIT]),
+            " ..." if len(ids) > BREACH_LOG_LIMIT else "",
+        )
+        REVIEW_SLA_BREACHES.inc(amount=len(breached))
+    # 模拟时钟回拨后，截止时间又落在“今天”之后的评审撤销超期标记
+    db.execute(
+        update(TaskModel)
+        .where(TaskModel.review_due_at >= cutoff, TaskModel.review_breached_at.isnot(None))
+        .values(review_breached_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    return [task_id for task_id, _ in breached]
+
+
+def run_review_breach_scan(raise_errors: bool = False) -> Dict[str, int]:
+    db = SessionLocal()
+    try:
+        breached = detect_review_breaches(db)
+        db.commit()
+        return {"breached": len(breached)}
+    except Exception as exc:
+        db.rollback()
+        if raise_errors:
+            raise
+        logging.exception("Failed to scan review SLA breaches: %s", exc)
+        return {"breached": 0}
+    finally:
+        db.close()
+
+
+def recompute_review_deadlines(db: Session, sprint_id: int, sla_days: int) -> int:
+    # Sprint 的 SLA 变更后重算其评审中任务的截止时间，超期标记交由下次扫描重新判定
+    rows = db.execute(
+        select(TaskModel.id, TaskModel.review_started_at)
+        .join(UserStoryModel, TaskModel.story_id == UserStoryModel.id)
+        .where(
+            UserStoryModel.sprint_id == sprint_id,
+            TaskModel.status == TaskStatus.CODE_REVIEW.value,
+            TaskModel.review_started_at.isnot(None),
+        )
+    ).all()
+    if rows:
+        tasks = TaskModel.__table__
+        db.execute(
+            update(tasks)
+            .where(tasks.c.id == bindparam("task_id"))
+            .values(review_due_at=bindparam("due_at"), review_breached_at=None),
+            [{"task_id": task_id, "due_at": started_at + timedelta(days=sla_days)} for task_id, started_at in rows],
+        )
+    return len(rows)
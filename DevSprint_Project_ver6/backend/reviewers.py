@@ -0,0 +1,252 @@
+import functools
+import heapq
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.clock import get_today
+from backend.config import env_int
+from backend.database import SessionLocal
+from backend.models import TaskAssignmentModel, TaskModel, TaskStatus, remaining_days_until
+from backend.observability import REVIEW_ASSIGNMENTS
+from backend.review_sla import task_review_slas
+
+# 评审人被替换后的分配状态：不再计入负载，也不参与评审结论判断
+REASSIGNED = "REASSIGNED"
+
+
+class ReviewerPool(NamedTuple):
+    reviewers: Tuple[str, ...]
+    per_pr: int
+
+
+@functools.lru_cache(maxsize=1)
+def reviewer_pool() -> ReviewerPool:
+    # 评审人池配置只解析一次；修改环境变量后调用 reviewer_pool.cache_clear() 重新读取（SLA 见 review_sla.py）
+    reviewers = tuple(dict.fromkeys(r.strip() for r in os.getenv("DEVSPRINT_REVIEWERS", "").split(",") if r.strip()))
+    per_pr = env_int("DEVSPRINT_REVIEWERS_PER_PR", 2) or 2
+    return ReviewerPool(reviewers, max(1, per_pr))
+
+
+class ReviewerLoadQueue:
+    """评审人负载的最小堆：负载为（评审中任务上进行中的 REVIEW 分配数, 剩余天数合计）。
+
+    堆项失效采用惰性删除：负载变化时压入新项，弹出时丢弃与当前负载不一致的旧项，
+    每次选人 O(k log n)。内存中的负载只反映本进程的分配，按 TTL 从数据库整体重新加载，
+    多进程部署时各进程间的偏差不会超过一个 TTL。
+
+    每个 (任务, 评审人) 计入的天数记在 _charges 中，release 扣除的正是当初计入的天数；
+    不在其中的分配（其他进程指派、或加载后才出现）本来就不在内存负载里，释放时忽略。
+    选人后事务回滚的调用方须调用 invalidate()，下次选人时从数据库重新加载。
+    """
+
+    def __init__(self, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[int, int, str]] = []
+        self._load: Dict[str, Tuple[int, int]] = {}
+        self._charges: Dict[Tuple[int, str], List[int]] = {}
+        self._pool: Tuple[str, ...] = ()
+        self._loaded_at: Optional[float] = None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def _refresh(self, db: Session, pool: Tuple[str, ...]) -> None:
+        load = {user: (0, 0) for user in pool}
+        charges: Dict[Tuple[int, str], List[int]] = {}
+        if pool:
+            today = get_today()
+            # 一条查询：按 (user, status, role) 索引取评审人池中进行中的评审分配，每个分配计入其剩余天数
+            rows = db.execute(
+                select(
+                    TaskAssignmentModel.task_id,
+                    TaskAssignmentModel.user,
+                    TaskAssignmentModel.due_date,
+                    TaskAssignmentModel.legacy_remaining_days,
+                )
+                .join(TaskModel, TaskAssignmentModel.task_id == TaskModel.id)
+                .where(
+                    TaskAssignmentModel.user.in_(pool),
+                    TaskAssignmentModel.status == "ACTIVE",
+                    TaskAssignmentModel.role == "REVIEW",
+                    TaskModel.status == TaskStatus.CODE_REVIEW.value,
+                )
+            )
+            for task_id, user, due_date, legacy_days in rows:
+                active, days = load[user]
+                remaining = remaining_days_until(due_date, legacy_days, today) or 0
+                load[user] = (active + 1, days + remaining)
+                charges.setdefault((task_id, user), []).append(remaining)
+        self._load = load
+        self._charges = charges
+        self._heap = [(active, days, user) for user, (active, days) in load.items()]
+        heapq.heapify(self._heap)
+        self._pool = pool
+        self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self, db: Session, pool: Tuple[str, ...]) -> None:
+        if (
+            self._loaded_at is None
+            or self._pool != pool
+            or time.monotonic() - self._loaded_at > self.ttl_seconds
+        ):
+            self._refresh(db, pool)
+
+    def _adjust(self, user: str, active: int, days: int) -> None:
+        if user not in self._load:
+            return
+        current_active, current_days = self._load[user]
+        load = (max(0, current_active + active), max(0, current_days + days))
+        self._load[user] = load
+        heapq.heappush(self._heap, (load[0], load[1], user))
+
+    def pick(self, db: Session, task_id: int, count: int, days: int, exclude: Iterable[str] = ()) -> List[str]:
+        # 为任务取负载最低的 count 名评审人（排除 exclude），并立即把这次分配计入其负载
+        pool = reviewer_pool().reviewers
+        excluded = set(exclude)
+        with self._lock:
+            self._ensure_loaded(db, pool)
+            chosen: List[str] = []
+            skipped: List[Tuple[int, int, str]] = []
+            while self._heap and len(chosen) < count:
+                entry = heapq.heappop(self._heap)
+                active, remaining, user = entry
+                if self._load.get(user) != (active, remaining) or user in chosen:
+                    continue  # 过期项
+                if user in excluded:
+                    skipped.append(entry)
+                    continue
+                chosen.append(user)
+            for entry in skipped:
+                heapq.heappush(self._heap, entry)
+            for user in chosen:
+                self._adjust(user, 1, days)
+                self._charges.setdefault((task_id, user), []).append(days)
+            return chosen
+
+    def release(self, task_id: int, user: Optional[str]) -> None:
+        # 评审完成或被替换：扣除该分配当初计入的负载；没有计入记录或尚未加载时忽略
+        with self._lock:
+            charged = self._charges.get((task_id, user)) if self._loaded_at is not None else None
+            if not charged:
+                return
+            days = charged.pop()
+            if not charged:
+                del self._charges[(task_id, user)]
+            self._adjust(user, -1, -days)
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        with self._lock:
+            return dict(self._load)
+
+
+reviewer_queue = ReviewerLoadQueue(env_int("DEVSPRINT_REVIEWER_LOAD_TTL_SECONDS", 60) or 60)
+
+
+def assign_reviewers(
+    db: Session, task: TaskModel, sla_days: int, exclude: Iterable[str] = ()
+) -> List[TaskAssignmentModel]:
+    # 为任务指派负载最低的 per_pr 名评审人，分配期限为该任务适用的评审 SLA；池为空时不指派
+    pool = reviewer_pool()
+    if not pool.reviewers:
+        return []
+    users = reviewer_queue.pick(db, task.id, pool.per_pr, sla_days, exclude)
+    assignments = [
+        TaskAssignmentModel(
+            task_id=task.id,
+            user=user,
+            role="REVIEW",
+            remaining_days=sla_days,
+            started_at=datetime.utcnow(),
+            status="ACTIVE",
+        )
+        for user in users
+    ]
+    db.add_all(assignments)
+    REVIEW_ASSIGNMENTS.inc(("assigned",), amount=len(assignments))
+    return assignments
+
+
+def rebalance_breached_reviews(db: Session) -> Dict[str, int]:
+    """超过 SLA 仍未给出结论的评审分配转交给当前负载最低、且未参与该任务评审的评审人。
+
+    超期即到期日早于今天（到期日 = 指派日 + SLA），按 (status, due_date) 索引做范围查询；
+    原分配标记为 REASSIGNED，新分配重新计时，同一任务下一个 SLA 周期内不会被再次转交。
+    """
+    today = get_today()
+    overdue = db.scalars(
+        select(TaskAssignmentModel)
+        .join(TaskModel, TaskAssignmentModel.task_id == TaskModel.id)
+        .where(
+            TaskAssignmentModel.status == "ACTIVE",
+            TaskAssignmentModel.due_date < today,
+            TaskAssignmentModel.role == "REVIEW",
+            TaskAssignmentModel.decision.is_(None),
+            TaskModel.status == TaskStatus.CODE_REVIEW.value,
+        )
+        .order_by(TaskAssignmentModel.due_date, TaskAssignmentModel.id)
+    ).all()
+    if not overdue:
+        return {"breached": 0, "reassigned": 0}
+
+    task_ids = {a.task_id for a in overdue}
+    reviewers_by_task: Dict[int, Set[str]] = {task_id: set() for task_id in task_ids}
+    for task_id, user in db.execute(
+        select(TaskAssignmentModel.task_id, TaskAssignmentModel.user).where(
+            TaskAssignmentModel.task_id.in_(task_ids),
+            TaskAssignmentModel.role == "REVIEW",
+            TaskAssignmentModel.status == "ACTIVE",
+        )
+    ):
+        reviewers_by_task[task_id].add(user)
+
+    slas = task_review_slas(db, task_ids)
+    reassigned = 0
+    for assignment in overdue:
+        current = reviewers_by_task[assignment.task_id]
+        sla_days = slas[assignment.task_id]
+        users = reviewer_queue.pick(db, assignment.task_id, 1, sla_days, exclude=current)
+        if not users:
+            continue  # 评审人池中没有可替换的人
+        assignment.status = REASSIGNED
+        reviewer_queue.release(assignment.task_id, assignment.user)
+        db.add(
+            TaskAssignmentModel(
+                task_id=assignment.task_id,
+                user=users[0],
+                role="REVIEW",
+                remaining_days=sla_days,
+                started_at=datetime.utcnow(),
+                status="ACTIVE",
+            )
+        )
+        current.discard(assignment.user)
+        current.add(users[0])
+        reassigned += 1
+    db.commit()
+    REVIEW_ASSIGNMENTS.inc(("reassigned",), amount=reassigned)
+    return {"breached": len(overdue), "reassigned": reassigned}
+
+
+def run_review_rebalance(raise_errors: bool = False) -> Dict[str, int]:
+    db = SessionLocal()
+    try:
+        return rebalance_breached_reviews(db)
+    except Exception as exc:
+        db.rollback()
+        # 回滚后内存负载可能多算了未提交的分配，下次选人时从数据库重新加载
+        reviewer_queue.invalidate()
+        if raise_errors:
+            raise
+        logging.exception("Failed to rebalance reviews: %s", exc)
+        return {"breached": 0, "reassigned": 0}
+    finally:
+        db.close()
@@ -0,0 +1,79 @@
+import io
+import marshal
+from typing import Dict, List, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse, Response
+from sqlalchemy.orm import Session
+
+from backend.database import get_db
+from backend.models import SprintModel, SprintStatus
+from backend.observability import PROFILE_STORE, ProfiledRoute, require_profiling_admin, sample_stacks
+from backend.services import delete_sprint_snapshots, delete_sprint_stories
+from backend.snapshots import compact_snapshot_history
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.post("/api/admin/clear_board")
+def clear_board(db: Session = Depends(get_db)):
+    sprint = (
+        db.query(SprintModel)
+        .filter(SprintModel.status == SprintStatus.ACTIVE.value)
+        .order_by(SprintModel.start_date)
+        .first()
+    )
+    if not sprint:
+        raise HTTPException(status_code=404, detail="No active sprint found")
+    sprint_id = sprint.id
+    # 集合式分块删除故事、任务、关联与分配，不加载 ORM 对象
+    counts = delete_sprint_stories(db, sprint_id)
+    delete_sprint_snapshots(db, sprint_id)
+    db.commit()
+    return {**counts, "sprint_id": sprint_id}
+
+
+@router.post("/api/admin/compact_snapshots")
+def compact_snapshots() -> Dict[str, int]:
+    return compact_snapshot_history()
+
+
+@router.get("/api/admin/profiling/requests", dependencies=[Depends(require_profiling_admin)])
+def list_request_profiles() -> List[Dict[str, Union[int, float, str]]]:
+    return [
+        {key: value for key, value in entry.items() if key != "stats"}
+        for entry in reversed(PROFILE_STORE)
+    ]
+
+
+@router.get("/api/admin/profiling/requests/{profile_id}", dependencies=[Depends(require_profiling_admin)])
+def download_request_profile(profile_id: str, format: str = Query("pstats", pattern="^(pstats|text)$")):
+    entry = next((item for item in PROFILE_STORE if item["id"] == profile_id), None)
+    if not entry:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "text":
+        import pstats  # 仅在下载文本报告时需要
+
+        # 与 pstats.Stats.dump_stats 的文件格式一致，可直接 load 回来排序输出
+        buffer = io.StringIO()
+        stats = pstats.Stats(stream=buffer)
+        stats.stats = marshal.loads(entry["stats"])
+        stats.get_top_level_stats()
+        stats.sort_stats("cumulative").print_stats(60)
+        return PlainTextResponse(buffer.getvalue())
+    return Response(
+        entry["stats"],
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.pstats"'},
+    )
+
+
+@router.post("/api/admin/profiling/sample", dependencies=[Depends(require_profiling_admin)])
+def sample_profile(
+    seconds: float = Query(10.0, gt=0, le=120),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    include_idle: bool = False,
+) -> PlainTextResponse:
+    counts = sample_stacks(seconds, interval_ms / 1000, include_idle)
+    lines = [f"{stack} {count}" for stack, count in sorted(counts.items(), key=lambda item: -item[1])]
+    return PlainTextResponse("\n".join(lines) + "\n")
@@ -0,0 +1,532 @@
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import case, func, literal_column, select
+from sqlalchemy.orm import Session, joinedload
+
+from backend.clock import get_now, get_today
+from backend.config import env_int
+from backend.database import get_db
+from backend.models import (
+    BurndownSnapshotModel,
+    FlowSnapshotModel,
+    SnapshotArchiveModel,
+    SprintModel,
+    SprintStatus,
+    TaskModel,
+    TaskStatus,
+    TaskTransitionModel,
+    UserStoryModel,
+    UserStoryStatus,
+)
+from backend.observability import ProfiledRoute
+from backend.responses import fast_json_response
+from backend.review_sla import default_review_sla_days, effective_sla_days
+from backend.schemas import (
+    AnalyticsSeriesResponse,
+    BurndownPoint,
+    CycleTimeGroup,
+    CycleTimeResponse,
+    DashboardResponse,
+    FlowPoint,
+    ThroughputPoint,
+    ThroughputResponse,
+    VelocityPoint,
+    VelocityResponse,
+    WipStatus,
+)
+from backend.serializers import sprint_dicts, task_dicts
+from backend.snapshots import _archived_burndown, _archived_flow, build_burndown_payload, load_flow_history
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+# 8. API - 燃尽图与仪表盘
+@router.get("/api/burndown/{sprint_id}", response_model=List[BurndownPoint])
+def get_burndown(sprint_id: int, db: Session = Depends(get_db)):
+    sprint = db.get(SprintModel, sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    return build_burndown_payload(db, sprint)
+
+
+@router.get("/api/cfd/{sprint_id}", response_model=List[FlowPoint])
+def get_cfd(sprint_id: int, db: Session = Depends(get_db)):
+    sprint = db.get(SprintModel, sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    history = load_flow_history(db, sprint_id)
+    points: List[FlowPoint] = []
+    for idx, (todo, in_progress, code_review, done) in enumerate(history.values()):
+        points.append(
+            FlowPoint(
+                day=f"Day {idx + 1}",
+                todo=todo,
+                in_progress=in_progress,
+                code_review=code_review,
+                done=done,
+            )
+        )
+    return points
+
+
+@router.get("/api/velocity", response_model=VelocityResponse)
+def get_velocity(db: Session = Depends(get_db)):
+    sprints = db.query(SprintModel).order_by(SprintModel.start_date).all()
+    points: List[VelocityPoint] = []
+    for sp in sprints:
+        if sp.status == SprintStatus.CLOSED.value and sp.completed_points is not None:
+            # 已滚动关闭的 Sprint 使用关闭时固化的汇总，结转走的故事不影响历史速度
+            points.append(
+                VelocityPoint(
+                    sprint_id=sp.id,
+                    sprint_name=sp.name,
+                    start_date=sp.start_date,
+                    end_date=sp.end_date,
+                    total_points=sp.committed_points or 0,
+                    completed_points=sp.completed_points,
+                )
+            )
+            continue
+        total_points = (
+            db.query(func.coalesce(func.sum(TaskModel.story_points), 0))
+            .join(UserStoryModel)
+            .filter(UserStoryModel.sprint_id == sp.id)
+            .scalar()
+        ) or 0
+        completed_points = (
+            db.query(func.coalesce(func.sum(TaskModel.story_points), 0))
+            .join(UserStoryModel)
+            .filter(UserStoryModel.sprint_id == sp.id, TaskModel.status == TaskStatus.DONE.value)
+            .scalar()
+        ) or 0
+        points.append(
+            VelocityPoint(
+                sprint_id=sp.id,
+                sprint_name=sp.name,
+                start_date=sp.start_date,
+                end_date=sp.end_date,
+                total_points=total_points,
+                completed_points=completed_points,
+            )
+        )
+    closed = [p.completed_points for p in points if any([True if sp.status == SprintStatus.CLOSED.value else False for sp in sprints if sp.id == p.sprint_id])]
+    avg = float(sum(closed) / len(closed)) if closed else 0.0
+    return VelocityResponse(points=points, average_velocity=avg)
+
+
+def build_analytics_series(db: Session, sprint_ids: Optional[List[int]] = None) -> Dict:
+    # 直接基于列查询结果构建列式数据，不实例化 ORM 对象，查询次数与 Sprint 数量无关
+    sprint_query = select(
+        SprintModel.id,
+        SprintModel.name,
+        SprintModel.status,
+        SprintModel.start_date,
+        SprintModel.end_date,
+        SprintModel.committed_points,
+        SprintModel.completed_points,
+    ).order_by(SprintModel.start_date, SprintModel.id)
+    if sprint_ids:
+        sprint_query = sprint_query.where(SprintModel.id.in_(sprint_ids))
+    sprint_rows = db.execute(sprint_query).all()
+    ids = [row.id for row in sprint_rows]
+
+    story_totals: Dict[int, tuple] = {}
+    task_totals: Dict[int, tuple] = {}
+    burndown_rows: Dict[int, Dict[date, int]] = {sid: {} for sid in ids}
+    flow_rows: Dict[int, Dict[date, tuple]] = {sid: {} for sid in ids}
+    if ids:
+        for archive in db.execute(
+            select(
+                SnapshotArchiveModel.sprint_id,
+                SnapshotArchiveModel.burndown_series,
+                SnapshotArchiveModel.flow_series,
+            ).where(SnapshotArchiveModel.sprint_id.in_(ids))
+        ):
+            burndown_rows[archive.sprint_id] = _archived_burndown(archive)
+            flow_rows[archive.sprint_id] = _archived_flow(archive)
+        story_totals = {
+            row.sprint_id: (int(row.total or 0), int(row.remaining or 0))
+            for row in db.execute(
+                select(
+                    UserStoryModel.sprint_id,
+                    func.sum(UserStoryModel.story_points).label("total"),
+                    func.sum(
+                        case(
+                            (UserStoryModel.status != UserStoryStatus.DONE.value, UserStoryModel.story_points),
+                            else_=0,
+                        )
+                    ).label("remaining"),
+                )
+                .where(UserStoryModel.sprint_id.in_(ids))
+                .group_by(UserStoryModel.sprint_id)
+            )
+        }
+        task_totals = {
+            row.sprint_id: (int(row.total or 0), int(row.completed or 0))
+            for row in db.execute(
+                select(
+                    UserStoryModel.sprint_id,
+                    func.sum(TaskModel.story_points).label("total"),
+                    func.sum(
+                        case(
+                            (TaskModel.status == TaskStatus.DONE.value, TaskModel.story_points),
+                            else_=0,
+                        )
+                    ).label("completed"),
+                )
+                .join(UserStoryModel, TaskModel.story_id == UserStoryModel.id)
+                .where(UserStoryModel.sprint_id.in_(ids))
+                .group_by(UserStoryModel.sprint_id)
+            )
+        }
+        for row in db.execute(
+            select(
+                BurndownSnapshotModel.sprint_id,
+                BurndownSnapshotModel.snapshot_date,
+                BurndownSnapshotModel.remaining_points,
+            ).where(BurndownSnapshotModel.sprint_id.in_(ids))
+        ):
+            burndown_rows[row.sprint_id][row.snapshot_date] = row.remaining_points
+        for row in db.execute(
+            select(
+                FlowSnapshotModel.sprint_id,
+                FlowSnapshotModel.snapshot_date,
+                FlowSnapshotModel.todo_count,
+                FlowSnapshotModel.in_progress_count,
+                FlowSnapshotModel.code_review_count,
+                FlowSnapshotModel.done_count,
+            )
+            .where(FlowSnapshotModel.sprint_id.in_(ids))
+        ):
+            flow_rows[row.sprint_id][row.snapshot_date] = tuple(row[2:])
+
+    today = get_today()
+    columns: Dict[str, list] = {
+        "id": [], "name": [], "status": [], "start_date": [], "end_date": [],
+        "total_points": [], "completed_points": [],
+    }
+    burndown: List[Dict] = []
+    cfd: List[Dict] = []
+    closed_completed: List[int] = []
+    for row in sprint_rows:
+        total_points, completed_points = task_totals.get(row.id, (0, 0))
+        if row.status == SprintStatus.CLOSED.value and row.completed_points is not None:
+            total_points, completed_points = row.committed_points or 0, row.completed_points
+        columns["id"].append(row.id)
+        columns["name"].append(row.name)
+        columns["status"].append(row.status)
+        columns["start_date"].append(row.start_date.isoformat())
+        columns["end_date"].append(row.end_date.isoformat())
+        columns["total_points"].append(total_points)
+        columns["completed_points"].append(completed_points)
+        if row.status == SprintStatus.CLOSED.value:
+            closed_completed.append(completed_points)
+
+        # 与 build_burndown_payload 保持同样的理想线与实际线规则
+        story_points, live_remaining = story_totals.get(row.id, (0, 0))
+        snapshot_map = burndown_rows[row.id]
+        total_days = max((row.end_date - row.start_date).days + 1, 1)
+        series = {"dates": [], "ideal": [], "actual": []}
+        last_actual = story_points
+        for index in range(total_days):
+            current_day = row.start_date + timedelta(days=index)
+            if current_day in snapshot_map:
+                last_actual = snapshot_map[current_day]
+            series["dates"].append(current_day.isoformat())
+            series["ideal"].append(
+                max(story_points - index * story_points / max(total_days - 1, 1), 0)
+            )
+            series["actual"].append(max(last_actual, 0) if current_day <= today else None)
+        if not snapshot_map and row.start_date <= today:
+            idx = (today - row.start_date).days
+            if 0 <= idx < total_days:
+                series["actual"][idx] = live_remaining
+        burndown.append(series)
+
+        flow = {"dates": [], "todo": [], "in_progress": [], "code_review": [], "done": []}
+        for day, (todo, in_progress, code_review, done) in sorted(flow_rows[row.id].items()):
+            flow["dates"].append(day.isoformat())
+            flow["todo"].append(todo)
+            flow["in_progress"].append(in_progress)
+            flow["code_review"].append(code_review)
+            flow["done"].append(done)
+        cfd.append(flow)
+
+    avg = float(sum(closed_completed) / len(closed_completed)) if closed_completed else 0.0
+    return {
+        "sprints": columns,
+        "average_velocity": avg,
+        "burndown": burndown,
+        "cfd": cfd,
+    }
+
+
+@router.get("/api/analytics/series", response_model=AnalyticsSeriesResponse)
+def get_analytics_series(
+    sprint_ids: Optional[List[int]] = Query(None),
+    db: Session = Depends(get_db),
+):
+    return fast_json_response(build_analytics_series(db, sprint_ids))
+
+
+# 周期时间与吞吐量：基于 task_transitions 的窗口函数在数据库内计算（SQLite >= 3.25 / MySQL 8）
+GROUP_BY_PATTERN = "^(sprint|assignee)$"
+PERCENTILES = (50, 85, 95)
+
+
+def hours_between(db: Session, start, end):
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return (func.julianday(end) - func.julianday(start)) * 24.0
+    if dialect in ("mysql", "mariadb"):
+        return func.timestampdiff(literal_column("SECOND"), start, end) / 3600.0
+    return func.extract("epoch", end - start) / 3600.0
+
+
+def transition_rows(db: Session, group_by: str, sprint_id: Optional[int], assignee: Optional[str]):
+    # 每条状态变更附带分组键与同一任务的下一次变更时间（LEAD 窗口）
+    t = TaskTransitionModel
+    group_key = UserStoryModel.sprint_id if group_by == "sprint" else TaskModel.assignee
+    query = (
+        select(
+            group_key.label("group_key"),
+            t.task_id,
+            t.from_status,
+            t.to_status,
+            t.transitioned_at,
+            func.lead(t.transitioned_at)
+            .over(partition_by=t.task_id, order_by=(t.transitioned_at, t.id))
+            .label("next_at"),
+        )
+        .join(TaskModel, t.task_id == TaskModel.id)
+        .join(UserStoryModel, TaskModel.story_id == UserStoryModel.id)
+    )
+    if sprint_id is not None:
+        query = query.where(UserStoryModel.sprint_id == sprint_id)
+    if assignee is not None:
+        query = query.where(TaskModel.assignee == assignee)
+    return query
+
+
+@router.get("/api/analytics/cycle-time", response_model=CycleTimeResponse)
+def get_cycle_time(
+    group_by: str = Query("sprint", pattern=GROUP_BY_PATTERN),
+    sprint_id: Optional[int] = None,
+    assignee: Optional[str] = None,
+    days: Optional[int] = Query(None, ge=1, le=3650),
+    db: Session = Depends(get_db),
+):
+    """已完成任务的周期时间（首次进入 IN_PROGRESS 到最后一次 DONE）分位数、前置时间与评审耗时。
+
+    分位数按最近秩取值：CUME_DIST 不小于 p 的最小周期时间。
+    """
+    steps = transition_rows(db, group_by, sprint_id, assignee).where(
+        TaskModel.status == TaskStatus.DONE.value
+    ).subquery()
+    per_task = (
+        select(
+            steps.c.group_key,
+            steps.c.task_id,
+            func.min(case((steps.c.from_status.is_(None), steps.c.transitioned_at))).label("created_at"),
+            func.min(
+                case((steps.c.to_status == TaskStatus.IN_PROGRESS.value, steps.c.transitioned_at))
+            ).label("started_at"),
+            func.max(case((steps.c.to_status == TaskStatus.DONE.value, steps.c.transitioned_at))).label("done_at"),
+            func.sum(
+                case(
+                    (
+                        steps.c.to_status == TaskStatus.CODE_REVIEW.value,
+                        hours_between(db, steps.c.transitioned_at, steps.c.next_at),
+                    ),
+                    else_=0,
+                )
+            ).label("review_hours"),
+        )
+        .group_by(steps.c.group_key, steps.c.task_id)
+        .subquery()
+    )
+    cycle = hours_between(db, per_task.c.started_at, per_task.c.done_at)
+    ranked = select(
+        per_task.c.group_key,
+        cycle.label("cycle_hours"),
+        hours_between(db, per_task.c.created_at, per_task.c.done_at).label("lead_hours"),
+        per_task.c.review_hours,
+        func.cume_dist().over(partition_by=per_task.c.group_key, order_by=cycle).label("rank"),
+    ).where(per_task.c.started_at.isnot(None), per_task.c.done_at.isnot(None))
+    if days is not None:
+        ranked = ranked.where(per_task.c.done_at >= get_now() - timedelta(days=days))
+    ranked = ranked.subquery()
+    query = select(
+        ranked.c.group_key,
+        func.count().label("tasks"),
+        func.avg(ranked.c.cycle_hours).label("avg_cycle"),
+        *(
+            func.min(case((ranked.c.rank >= p / 100.0, ranked.c.cycle_hours))).label(f"p{p}")
+            for p in PERCENTILES
+        ),
+        func.avg(ranked.c.lead_hours).label("avg_lead"),
+        func.avg(ranked.c.review_hours).label("avg_review"),
+    ).group_by(ranked.c.group_key).order_by(ranked.c.group_key)
+
+    def hours(value) -> Optional[float]:
+        return round(float(value), 2) if value is not None else None
+
+    groups = [
+        CycleTimeGroup(
+            key=str(row.group_key) if row.group_key is not None else None,
+            tasks=row.tasks,
+            avg_cycle_hours=hours(row.avg_cycle),
+            p50_cycle_hours=hours(row.p50),
+            p85_cycle_hours=hours(row.p85),
+            p95_cycle_hours=hours(row.p95),
+            avg_lead_hours=hours(row.avg_lead),
+            avg_review_hours=hours(row.avg_review),
+        )
+        for row in db.execute(query)
+    ]
+    return CycleTimeResponse(group_by=group_by, groups=groups)
+
+
+@router.get("/api/analytics/throughput", response_model=ThroughputResponse)
+def get_throughput(
+    group_by: str = Query("sprint", pattern=GROUP_BY_PATTERN),
+    sprint_id: Optional[int] = None,
+    assignee: Optional[str] = None,
+    days: int = Query(14, ge=1, le=3650),
+    db: Session = Depends(get_db),
+):
+    # 每天进入 DONE 的任务数（同一任务同一天多次进入只计一次）
+    t = TaskTransitionModel
+    group_key = UserStoryModel.sprint_id if group_by == "sprint" else TaskModel.assignee
+    day = func.date(t.transitioned_at)
+    query = (
+        select(group_key.label("group_key"), day.label("day"), func.count(func.distinct(t.task_id)).label("completed"))
+        .join(TaskModel, t.task_id == TaskModel.id)
+        .join(UserStoryModel, TaskModel.story_id == UserStoryModel.id)
+        .where(
+            t.to_status == TaskStatus.DONE.value,
+            t.from_status.is_distinct_from(TaskStatus.DONE.value),
+            t.transitioned_at >= get_now() - timedelta(days=days),
+        )
+        .group_by(group_key, day)
+        .order_by(group_key, day)
+    )
+    if sprint_id is not None:
+        query = query.where(UserStoryModel.sprint_id == sprint_id)
+    if assignee is not None:
+        query = query.where(TaskModel.assignee == assignee)
+    points = [
+        ThroughputPoint(
+            key=str(row.group_key) if row.group_key is not None else None,
+            day=row.day,
+            completed=row.completed,
+        )
+        for row in db.execute(query)
+    ]
+    return ThroughputResponse(group_by=group_by, days=days, points=points)
+
+
+@router.get("/api/dashboard", response_model=DashboardResponse)
+def get_dashboard(db: Session = Depends(get_db)):
+    sprint = (
+        db.query(SprintModel)
+        .options(joinedload(SprintModel.stories))
+        .filter(SprintModel.status == SprintStatus.ACTIVE.value)
+        .order_by(SprintModel.start_date)
+        .first()
+    )
+    burndown: List[BurndownPoint] = []
+    tech_debt_points = 0
+    countdown = None
+    wip: List[WipStatus] = []
+    if sprint:
+        burndown = build_burndown_payload(db, sprint)
+        tech_debt_points = (
+            db.query(func.coalesce(func.sum(TaskModel.story_points), 0))
+            .join(UserStoryModel)
+            .filter(
+                UserStoryModel.sprint_id == sprint.id,
+                TaskModel.is_tech_debt == True,
+                TaskModel.status != TaskStatus.DONE.value,
+            )
+            .scalar()
+        ) or 0
+        countdown = (sprint.end_date - get_today()).days
+
+    review_queue: List[Dict] = []
+    if sprint:
+        review_queue = task_dicts(
+            db,
+            select(TaskModel.id)
+            .join(UserStoryModel)
+            .where(
+                TaskModel.status == TaskStatus.CODE_REVIEW.value,
+                UserStoryModel.sprint_id == sprint.id,
+            ),
+        )
+    
+    wip_counts: Dict[str, int] = {}
+    if sprint:
+        for s in TaskStatus:
+            wip_counts[s.value] = (
+                db.query(func.count(TaskModel.id))
+                .join(UserStoryModel)
+                .filter(
+                    TaskModel.status == s.value,
+                    UserStoryModel.sprint_id == sprint.id
+                )
+                .scalar()
+            ) or 0
+    else:
+        # 如果没有活跃 Sprint，WIP 计数应为 0
+        for s in TaskStatus:
+            wip_counts[s.value] = 0
+
+    limits_map: Dict[str, Optional[int]] = {
+        TaskStatus.TODO.value: env_int("DEVSPRINT_WIP_TODO", None),
+        TaskStatus.IN_PROGRESS.value: env_int("DEVSPRINT_WIP_IN_PROGRESS", 3),
+        TaskStatus.CODE_REVIEW.value: env_int("DEVSPRINT_WIP_CODE_REVIEW", 2),
+        TaskStatus.DONE.value: env_int("DEVSPRINT_WIP_DONE", None),
+    }
+    for key in [
+        TaskStatus.TODO.value,
+        TaskStatus.IN_PROGRESS.value,
+        TaskStatus.CODE_REVIEW.value,
+        TaskStatus.DONE.value,
+    ]:
+        count = wip_counts.get(key, 0)
+        limit = limits_map.get(key)
+        breached = limit is not None and count > limit
+        wip.append(
+            WipStatus(status=TaskStatus(key), count=count, limit=limit, breached=breached)
+        )
+
+    # 截止时间在进入评审时写入，超期由扫描任务预先标记（review_sla.py），这里不再逐个判定
+    sla_days = effective_sla_days(sprint.review_sla_days) if sprint else default_review_sla_days()
+    today = get_today()
+    review_metrics = [
+        {
+            "task_id": t["id"],
+            "waiting_days": max(0, (today - t["review_started_at"].date()).days),
+            "sla_days": sla_days,
+            "breached": t["review_breached_at"] is not None,
+            "due_at": t["review_due_at"],
+            "breached_at": t["review_breached_at"],
+        }
+        for t in review_queue
+        if t["review_started_at"]
+    ]
+
+    # 与 DashboardResponse 字段一致；Sprint 树与评审队列走快速序列化，不再逐层做 Pydantic 校验
+    return fast_json_response({
+        "sprint": sprint_dicts(db, select(SprintModel.id).where(SprintModel.id == sprint.id))[0] if sprint else None,
+        "burndown": [point.model_dump() for point in burndown],
+        "review_queue": review_queue,
+        "tech_debt_points": tech_debt_points,
+        "sprint_countdown_days": countdown,
+        "wip": [item.model_dump(mode="json") for item in wip],
+        "review_metrics": review_metrics,
+        "current_date": get_today(),
+    })
@@ -0,0 +1,128 @@
+import re
+from typing import List, Optional
+
+from fastapi import APIRouter, Body, Depends, Header
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.database import get_db
+from backend.models import GitHubLinkModel, TaskAssignmentModel, TaskModel, TaskStatus
+from backend.observability import WEBHOOK_DELIVERIES, WEBHOOK_LINKED_TASKS, ProfiledRoute
+from backend.review_sla import start_review_clock, task_review_slas
+from backend.reviewers import assign_reviewers, reviewer_queue
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+# 7. API - GitHub 集成
+commit_ref_pattern = re.compile(r"ref\s+#(\d+)", re.IGNORECASE)
+# 指标标签只取已知事件：X-GitHub-Event 来自未认证的请求头，原样作为标签会让序列数无限增长
+KNOWN_WEBHOOK_EVENTS = frozenset({"push", "pull_request", "status", "check_suite", "ping"})
+
+
+def webhook_event_label(event: Optional[str]) -> str:
+    if event is None:
+        return "unknown"
+    return event if event in KNOWN_WEBHOOK_EVENTS else "other"
+
+
+def link_commit_to_task(
+    db: Session, task: TaskModel, commit_hash: str, repo_name: Optional[str]
+):
+    link = GitHubLinkModel(
+        task_id=task.id,
+        commit_hash=commit_hash,
+        repo_name=repo_name,
+    )
+    db.add(link)
+
+
+def link_pr_to_task(
+    db: Session, task: TaskModel, pr_url: str, repo_name: Optional[str]
+):
+    link = GitHubLinkModel(
+        task_id=task.id,
+        pr_url=pr_url,
+        repo_name=repo_name,
+    )
+    task.status = TaskStatus.CODE_REVIEW.value
+    # 同一 PR 的后续事件（synchronize、edited 等）不再重复指派：任务已有进行中的评审时跳过
+    in_review = db.scalar(
+        select(TaskAssignmentModel.id)
+        .where(
+            TaskAssignmentModel.task_id == task.id,
+            TaskAssignmentModel.role == "REVIEW",
+            TaskAssignmentModel.status == "ACTIVE",
+        )
+        .limit(1)
+    )
+    if in_review is None:
+        sla_days = task_review_slas(db, [task.id])[task.id]
+        if assign_reviewers(db, task, sla_days):
+            start_review_clock(task, sla_days)
+    db.add(link)
+
+
+@router.post("/api/github/webhook")
+def github_webhook(
+    payload: dict = Body(...),
+    x_github_event: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    repo_name = payload.get("repository", {}).get("full_name")
+    processed_tasks: List[int] = []
+    try:
+        for commit in payload.get("commits", []):
+            message = commit.get("message", "")
+            for match in commit_ref_pattern.findall(message):
+                task = db.get(TaskModel, int(match))
+                if task:
+                    link_commit_to_task(db, task, commit.get("id"), repo_name)
+                    processed_tasks.append(task.id)
+
+        pull_request = payload.get("pull_request")
+        if pull_request:
+            text = f"{pull_request.get('title', '')}\n{pull_request.get('body', '')}"
+            pr_url = pull_request.get("html_url")
+            pr_state = pull_request.get("state")
+            pr_merged = bool(pull_request.get("merged"))
+            for match in commit_ref_pattern.findall(text):
+                task = db.get(TaskModel, int(match))
+                if task:
+                    link_pr_to_task(db, task, pr_url, repo_name)
+                    last_link = (
+                        db.query(GitHubLinkModel)
+                        .filter(GitHubLinkModel.task_id == task.id, GitHubLinkModel.pr_url == pr_url)
+                        .order_by(GitHubLinkModel.id.desc())
+                        .first()
+                    )
+                    if last_link:
+                        last_link.pr_state = pr_state
+                        last_link.pr_merged = pr_merged
+                    processed_tasks.append(task.id)
+
+        status_payload = payload.get("status") or payload.get("check_suite")
+        if status_payload:
+            state = status_payload.get("state") or status_payload.get("conclusion")
+            sha = status_payload.get("sha") or status_payload.get("head_sha")
+            if sha and state:
+                gh_links = (
+                    db.query(GitHubLinkModel)
+                    .filter(GitHubLinkModel.commit_hash == sha)
+                    .all()
+                )
+                for link in gh_links:
+                    link.ci_status = state
+                    task = db.get(TaskModel, link.task_id)
+                    if task and str(state).lower() in {"failure", "failed", "error"}:
+                        task.is_blocked = True
+        db.commit()
+    except Exception:
+        db.rollback()
+        # PR 关联可能已把评审人计入内存负载，回滚后从数据库重新加载
+        reviewer_queue.invalidate()
+        raise
+    WEBHOOK_DELIVERIES.inc((webhook_event_label(x_github_event), "linked" if processed_tasks else "ignored"))
+    WEBHOOK_LINKED_TASKS.inc(amount=len(processed_tasks))
+
+    return {"linked_tasks": processed_tasks}
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from backend.database import get_db
+from backend.jobs import enqueue_job, job_to_response
+from backend.models import JobModel
+from backend.observability import ProfiledRoute
+from backend.schemas import JobCreate, JobResponse
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.post("/api/jobs", response_model=JobResponse, status_code=202)
+def create_job(payload: JobCreate, db: Session = Depends(get_db)):
+    return job_to_response(enqueue_job(db, payload.kind, payload.payload))
+
+
+@router.get("/api/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, db: Session = Depends(get_db)):
+    job = db.get(JobModel, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_to_response(job)
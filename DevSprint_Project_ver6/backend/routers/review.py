@@ -0,0 +1,131 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from backend.database import get_db
+from backend.models import TaskAssignmentModel, TaskModel, TaskStatus, UserStoryModel
+from backend.observability import ProfiledRoute
+from backend.responses import fast_json_response
+from backend.review_sla import breach_cutoff
+from backend.reviewers import REASSIGNED, reviewer_queue
+from backend.schemas import ReviewBreach, ReviewDecision, TaskResponse
+from backend.services import check_version, set_etag
+from backend.unit_of_work import UnitOfWork
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.get("/api/review/breaches", response_model=List[ReviewBreach])
+def list_review_breaches(sprint_id: Optional[int] = Query(None), db: Session = Depends(get_db)):
+    # 超期扫描已发布的评审：按截止时间的范围查询读取，不再遍历评审队列
+    query = (
+        select(
+            TaskModel.id,
+            TaskModel.title,
+            UserStoryModel.sprint_id,
+            TaskModel.assignee,
+            TaskModel.review_started_at,
+            TaskModel.review_due_at,
+            TaskModel.review_breached_at,
+        )
+        .outerjoin(UserStoryModel, TaskModel.story_id == UserStoryModel.id)
+        .where(TaskModel.review_due_at < breach_cutoff(), TaskModel.review_breached_at.isnot(None))
+        .order_by(TaskModel.review_due_at, TaskModel.id)
+    )
+    if sprint_id is not None:
+        query = query.where(UserStoryModel.sprint_id == sprint_id)
+    rows = db.execute(query).all()
+    reviewers: Dict[int, List[str]] = defaultdict(list)
+    if rows:
+        for task_id, user in db.execute(
+            select(TaskAssignmentModel.task_id, TaskAssignmentModel.user)
+            .where(
+                TaskAssignmentModel.task_id.in_([row.id for row in rows]),
+                TaskAssignmentModel.role == "REVIEW",
+                TaskAssignmentModel.status == "ACTIVE",
+            )
+            .order_by(TaskAssignmentModel.id)
+        ):
+            reviewers[task_id].append(user)
+    return fast_json_response([
+        {
+            "task_id": row.id,
+            "title": row.title,
+            "sprint_id": row.sprint_id,
+            "assignee": row.assignee,
+            "reviewers": reviewers.get(row.id, []),
+            "review_started_at": row.review_started_at,
+            "review_due_at": row.review_due_at,
+            "review_breached_at": row.review_breached_at,
+        }
+        for row in rows
+    ])
+
+
+@router.post("/api/review/{task_id}/decision", response_model=TaskResponse)
+def review_decision(
+    task_id: int,
+    payload: ReviewDecision,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    task = db.get(
+        TaskModel,
+        task_id,
+        options=[selectinload(TaskModel.assignments), selectinload(TaskModel.github_links)],
+    )
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    check_version(task, if_match)
+    with UnitOfWork(db) as uow:
+        reviews = [a for a in task.assignments if a.role == "REVIEW" and a.status == "ACTIVE"]
+        if payload.approved:
+            for a in reviews:
+                a.decision = "APPROVED"
+                a.status = "DONE"
+            # 被转交的评审分配不参与结论判断
+            if all(
+                a.decision == "APPROVED"
+                for a in task.assignments
+                if a.role == "REVIEW" and a.status != REASSIGNED
+            ):
+                task.status = TaskStatus.DONE.value
+        else:
+            for a in reviews:
+                a.decision = "REJECTED"
+                a.status = "DONE"
+            task.is_tech_debt = True
+            task.tech_debt_estimate_days = max(0, payload.tech_debt_days or 1)
+            task.status = TaskStatus.IN_PROGRESS.value
+            if task.assignee:
+                # 检查是否已有该用户的DEV assignment
+                existing_dev_assignment = next(
+                    (a for a in task.assignments if a.user == task.assignee and a.role == "DEV"), None
+                )
+                if existing_dev_assignment:
+                    # 更新现有的assignment，重置为ACTIVE状态并设置新的剩余天数
+                    existing_dev_assignment.status = "ACTIVE"
+                    existing_dev_assignment.remaining_days = task.tech_debt_estimate_days or 1
+                    existing_dev_assignment.started_at = datetime.utcnow()
+                    existing_dev_assignment.decision = None
+                else:
+                    # 如果没有，创建新的assignment
+                    task.assignments.append(
+                        TaskAssignmentModel(
+                            user=task.assignee,
+                            role="DEV",
+                            remaining_days=task.tech_debt_estimate_days or 1,
+                            started_at=datetime.utcnow(),
+                            status="ACTIVE",
+                        )
+                    )
+        uow.touch_story(task.story_id)
+    for a in reviews:
+        reviewer_queue.release(task.id, a.user)
+    set_etag(response, task)
+    return task
@@ -0,0 +1,46 @@
+from typing import Dict, Union
+
+from fastapi import APIRouter, Body, HTTPException, Query
+
+from backend.clock import get_today, simulation_clock
+from backend.jobs import enqueue_job_response
+from backend.observability import ProfiledRoute
+from backend.review_sla import run_review_breach_scan
+from backend.simulation import run_set_remaining_days, run_simulation_days
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.post("/api/simulate/advance_days")
+def simulate_advance_days(
+    days: int = Body(..., embed=True),
+    defer: bool = Query(False),
+) -> Dict[str, Union[int, str]]:
+    if days <= 0:
+        raise HTTPException(status_code=400, detail="Days must be positive")
+    if defer:
+        return enqueue_job_response("simulate_advance_days", {"days": days})
+    return run_simulation_days(days)
+
+
+@router.post("/api/simulate/set_remaining_days")
+def simulate_set_remaining_days(
+    remaining_days: int = Body(..., embed=True),
+    defer: bool = Query(False),
+) -> Dict[str, Union[int, str]]:
+    if remaining_days < 0:
+        raise HTTPException(status_code=400, detail="Remaining days must be non-negative")
+    if defer:
+        return enqueue_job_response("simulate_set_remaining_days", {"remaining_days": remaining_days})
+    return run_set_remaining_days(remaining_days)
+
+
+@router.post("/api/simulate/reset_time")
+def simulate_reset_time() -> Dict[str, Union[int, str]]:
+    offset_days = simulation_clock.set(0)
+    # 时钟回拨后撤销“未来”日期上标记的超期
+    run_review_breach_scan()
+    return {
+        "current_day": get_today().isoformat(),
+        "offset_days": offset_days,
+    }
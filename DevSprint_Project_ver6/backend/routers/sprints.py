@@ -0,0 +1,297 @@
+import re
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.orm import Session
+
+from backend.board_history import board_tasks, current_board, reconstruct_board
+from backend.clock import get_now, get_today
+from backend.database import get_db
+from backend.models import SprintModel, SprintStatus, TaskModel, TaskStatus, UserStoryModel, UserStoryStatus
+from backend.observability import ProfiledRoute
+from backend.responses import fast_json_response
+from backend.review_sla import effective_sla_days, recompute_review_deadlines
+from backend.schemas import (
+    BoardResponse,
+    SprintCreate,
+    SprintResponse,
+    SprintRollover,
+    SprintRolloverResponse,
+    SprintUpdate,
+    UserStoryCreate,
+    UserStoryResponse,
+    UserStoryUpdate,
+)
+from backend.serializers import sprint_dicts
+from backend.services import check_version, delete_sprint_snapshots, delete_sprint_stories, set_etag
+from backend.snapshots import capture_sprint_snapshot
+
+router = APIRouter(route_class=ProfiledRoute)
+
+BARE_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+# 5. API - Sprint & Story
+@router.post("/api/sprints", response_model=SprintResponse)
+def create_sprint(payload: SprintCreate, db: Session = Depends(get_db)):
+    sprint = SprintModel(**payload.dict())
+    if sprint.end_date < sprint.start_date:
+        raise HTTPException(status_code=400, detail="End date must be after start date")
+    db.add(sprint)
+    db.commit()
+    db.refresh(sprint)
+    return sprint
+
+
+@router.get("/api/sprints", response_model=List[SprintResponse])
+def list_sprints(db: Session = Depends(get_db)):
+    return fast_json_response(sprint_dicts(db, select(SprintModel.id)))
+
+
+@router.get("/api/sprints/active", response_model=Optional[SprintResponse])
+def get_active_sprint(db: Session = Depends(get_db)):
+    sprint_id = db.scalar(
+        select(SprintModel.id)
+        .where(SprintModel.status == SprintStatus.ACTIVE.value)
+        .order_by(SprintModel.start_date)
+        .limit(1)
+    )
+    if sprint_id is None:
+        return None
+    return fast_json_response(sprint_dicts(db, select(SprintModel.id).where(SprintModel.id == sprint_id))[0])
+
+
+@router.patch("/api/sprints/{sprint_id}", response_model=SprintResponse)
+def update_sprint(
+    sprint_id: int, payload: SprintUpdate, db: Session = Depends(get_db)
+):
+    sprint = db.get(SprintModel, sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    changes = payload.dict(exclude_unset=True)
+    for key, value in changes.items():
+        setattr(sprint, key, value)
+    if sprint.end_date < sprint.start_date:
+        raise HTTPException(status_code=400, detail="End date must be after start date")
+    if "review_sla_days" in changes:
+        recompute_review_deadlines(db, sprint.id, effective_sla_days(sprint.review_sla_days))
+    db.commit()
+    db.refresh(sprint)
+    return sprint
+
+
+@router.delete("/api/sprints/{sprint_id}")
+def delete_sprint(sprint_id: int, db: Session = Depends(get_db)) -> Dict[str, int]:
+    if db.scalar(select(SprintModel.id).where(SprintModel.id == sprint_id)) is None:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    counts = delete_sprint_stories(db, sprint_id)
+    delete_sprint_snapshots(db, sprint_id)
+    db.execute(delete(SprintModel).where(SprintModel.id == sprint_id))
+    db.commit()
+    return {**counts, "sprint_id": sprint_id}
+
+
+def parse_as_of(value: str) -> datetime:
+    # 只有不带时间的日期取当天结束时；显式给出的时间（包括 T00:00:00）按原值使用，
+    # 因此不能交给 Union[date, datetime] 解析，后者会把零点时间也当作日期
+    try:
+        if BARE_DATE.fullmatch(value):
+            return datetime.combine(date.fromisoformat(value), time.max)
+        # Python 3.10 的 fromisoformat 不接受结尾的 Z
+        moment = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith(("Z", "z")) else value)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="as_of must be an ISO date or datetime")
+    # 变更日志以 UTC 的 naive 时间存储
+    return moment.astimezone(timezone.utc).replace(tzinfo=None) if moment.tzinfo else moment
+
+
+@router.get("/api/sprints/{sprint_id}/board", response_model=BoardResponse)
+def get_sprint_board(
+    sprint_id: int,
+    as_of: Optional[str] = Query(None, description="仅日期（YYYY-MM-DD）表示当天结束时；省略时为当前时间"),
+    db: Session = Depends(get_db),
+):
+    # 历史看板：最近的检查点 + 之后的状态变更回放（见 backend/board_history.py）
+    if db.scalar(select(SprintModel.id).where(SprintModel.id == sprint_id)) is None:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    if as_of is None:
+        # 未指定时间直接读取当前状态；模拟时钟被重置后，之前记录的变更可能晚于“现在”
+        moment = get_now()
+        board = current_board(db, sprint_id)
+    else:
+        moment = parse_as_of(as_of)
+        board = reconstruct_board(db, sprint_id, moment)
+    tasks = board_tasks(db, sprint_id, board["states"])
+    return BoardResponse(
+        sprint_id=sprint_id,
+        as_of=moment,
+        checkpoint_at=board["checkpoint_at"],
+        replayed_transitions=board["replayed_transitions"],
+        counts=dict(Counter(task["status"] for task in tasks)),
+        tasks=tasks,
+    )
+
+
+def resolve_next_sprint(db: Session, sprint: SprintModel, payload: SprintRollover) -> tuple:
+    # 返回 (next_sprint, created)；新建的 Sprint 沿用当前 Sprint 的时长与评审 SLA，紧接其结束日期
+    if payload.next_sprint_id is not None:
+        target = db.get(SprintModel, payload.next_sprint_id)
+        if not target:
+            raise HTTPException(status_code=404, detail="Next sprint not found")
+        if target.id == sprint.id or target.status == SprintStatus.CLOSED.value:
+            raise HTTPException(status_code=400, detail="Next sprint must be another open sprint")
+        return target, False
+    target = db.scalars(
+        select(SprintModel)
+        .where(
+            SprintModel.id != sprint.id,
+            SprintModel.status != SprintStatus.CLOSED.value,
+            SprintModel.start_date > sprint.start_date,
+        )
+        .order_by(SprintModel.start_date, SprintModel.id)
+        .limit(1)
+    ).first()
+    if target is not None:
+        return target, False
+    start_date = payload.start_date or sprint.end_date + timedelta(days=1)
+    end_date = payload.end_date or start_date + (sprint.end_date - sprint.start_date)
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="End date must be after start date")
+    target = SprintModel(
+        name=payload.name or f"Sprint {start_date.isoformat()}",
+        goal=payload.goal,
+        start_date=start_date,
+        end_date=end_date,
+        status=SprintStatus.ACTIVE.value,
+        review_sla_days=sprint.review_sla_days,
+    )
+    db.add(target)
+    db.flush()
+    return target, True
+
+
+@router.post("/api/sprints/{sprint_id}/rollover", response_model=SprintRolloverResponse)
+def rollover_sprint(
+    sprint_id: int,
+    payload: Optional[SprintRollover] = Body(None),
+    db: Session = Depends(get_db),
+):
+    """关闭 Sprint 并把未完成的故事（连同其任务）结转到下一个 Sprint。
+
+    快照、速度汇总、关闭与结转在同一事务中完成，语句数与故事数量无关。
+    """
+    payload = payload or SprintRollover()
+    sprint = db.get(SprintModel, sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    if sprint.status == SprintStatus.CLOSED.value:
+        raise HTTPException(status_code=409, detail="Sprint is already closed")
+    try:
+        next_sprint, created = resolve_next_sprint(db, sprint, payload)
+        next_sprint_id = next_sprint.id
+
+        unfinished = UserStoryModel.status != UserStoryStatus.DONE.value
+        task_totals = db.execute(
+            select(
+                func.coalesce(func.sum(TaskModel.story_points), 0),
+                func.coalesce(
+                    func.sum(case((TaskModel.status == TaskStatus.DONE.value, TaskModel.story_points), else_=0)), 0
+                ),
+                func.coalesce(func.sum(case((unfinished, 1), else_=0)), 0),
+            )
+            .join(UserStoryModel, TaskModel.story_id == UserStoryModel.id)
+            .where(UserStoryModel.sprint_id == sprint_id)
+        ).one()
+        story_totals = db.execute(
+            select(func.count(UserStoryModel.id), func.coalesce(func.sum(UserStoryModel.story_points), 0))
+            .where(UserStoryModel.sprint_id == sprint_id, unfinished)
+        ).one()
+
+        # 结转前记录最终的燃尽与累积流快照
+        capture_sprint_snapshot(db, sprint_id, get_today())
+
+        # 带状态条件的 UPDATE：并发的两次滚动只有一次能关闭 Sprint
+        closed = db.execute(
+            update(SprintModel)
+            .where(SprintModel.id == sprint_id, SprintModel.status != SprintStatus.CLOSED.value)
+            .values(
+                status=SprintStatus.CLOSED.value,
+                committed_points=int(task_totals[0]),
+                completed_points=int(task_totals[1]),
+                closed_at=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if closed.rowcount != 1:
+            raise HTTPException(status_code=409, detail="Sprint is already closed")
+        # 任务随故事一起移动（task.story_id 不变），只需一条 UPDATE
+        db.execute(
+            update(UserStoryModel)
+            .where(UserStoryModel.sprint_id == sprint_id, unfinished)
+            .values(sprint_id=next_sprint_id, version=UserStoryModel.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return SprintRolloverResponse(
+        sprint_id=sprint_id,
+        next_sprint_id=next_sprint_id,
+        created_next_sprint=created,
+        committed_points=int(task_totals[0]),
+        completed_points=int(task_totals[1]),
+        moved_stories=int(story_totals[0]),
+        moved_tasks=int(task_totals[2]),
+        moved_points=int(story_totals[1]),
+    )
+
+
+@router.post("/api/stories", response_model=UserStoryResponse)
+def create_story(payload: UserStoryCreate, db: Session = Depends(get_db)):
+    if payload.sprint_id:
+        sprint = db.get(SprintModel, payload.sprint_id)
+        if not sprint:
+            raise HTTPException(status_code=404, detail="Sprint not found")
+    story = UserStoryModel(**payload.dict())
+    db.add(story)
+    db.commit()
+    db.refresh(story)
+    return story
+
+
+@router.patch("/api/stories/{story_id}", response_model=UserStoryResponse)
+def update_story(
+    story_id: int,
+    payload: UserStoryUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    story = db.get(UserStoryModel, story_id)
+    if not story:
+        raise HTTPException(status_code=404, detail="Story not found")
+    check_version(story, if_match)
+    update_data = payload.dict(exclude_unset=True)
+    if "sprint_id" in update_data and update_data["sprint_id"]:
+        sprint = db.get(SprintModel, update_data["sprint_id"])
+        if not sprint:
+            raise HTTPException(status_code=404, detail="Sprint not found")
+    for key, value in update_data.items():
+        setattr(story, key, value)
+    db.commit()
+    db.refresh(story)
+    set_etag(response, story)
+    return story
+
+
+@router.get("/api/stories/{story_id}", response_model=UserStoryResponse)
+def get_story(story_id: int, response: Response, db: Session = Depends(get_db)):
+    story = db.get(UserStoryModel, story_id)
+    if not story:
+        raise HTTPException(status_code=404, detail="Story not found")
+    set_etag(response, story)
+    return story
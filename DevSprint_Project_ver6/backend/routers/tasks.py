@@ -0,0 +1,193 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, selectinload
+
+from backend.database import get_db
+from backend.models import TaskAssignmentModel, TaskModel, TaskTransitionModel, UserStoryModel
+from backend.observability import ProfiledRoute
+from backend.responses import fast_json_response
+from backend.schemas import (
+    AssignmentBatchCreate,
+    TaskAssignmentResponse,
+    TaskBatchUpdate,
+    TaskCreate,
+    TaskResponse,
+    TaskUpdate,
+)
+from backend.serializers import task_dicts
+from backend.services import check_version, set_etag
+from backend.unit_of_work import UnitOfWork
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+# 6. API - Task
+@router.get("/api/tasks", response_model=List[TaskResponse])
+def list_tasks(db: Session = Depends(get_db)):
+    return fast_json_response(task_dicts(db, select(TaskModel.id)))
+
+
+@router.post("/api/tasks", response_model=TaskResponse)
+def create_task(payload: TaskCreate, response: Response, db: Session = Depends(get_db)):
+    story = db.get(UserStoryModel, payload.story_id)
+    if not story:
+        raise HTTPException(status_code=404, detail="Story not found")
+    task_data = payload.dict()
+    remaining_days = task_data.pop("remaining_days", None)
+    # 新任务的关联集合直接初始化，提交后无需再查询
+    task = TaskModel(**task_data, github_links=[], assignments=[])
+    # 如果有assignee和remaining_days（包括0），创建TaskAssignment
+    if task.assignee and remaining_days is not None:
+        task.assignments.append(
+            TaskAssignmentModel(
+                user=task.assignee,
+                role="DEV",
+                remaining_days=max(0, remaining_days),
+                started_at=datetime.utcnow(),
+                status="ACTIVE",
+            )
+        )
+    with UnitOfWork(db) as uow:
+        db.add(task)
+        uow.touch_story(story.id)
+    set_etag(response, task)
+    return task
+
+
+def apply_task_update(task: TaskModel, update_data: Dict, remaining_days: Optional[int]) -> None:
+    # 单个与批量更新共用的规则；task.assignments 需已加载，分配处理全部在内存中完成
+    old_assignee = task.assignee
+    for key, value in update_data.items():
+        setattr(task, key, value)
+    active_dev = [a for a in task.assignments if a.role == "DEV" and a.status == "ACTIVE"]
+
+    # 如果 assignee 发生了变化，关闭旧的 assignment
+    if "assignee" in update_data and old_assignee != task.assignee:
+        for assign in active_dev:
+            if assign.user != task.assignee:
+                assign.status = "DONE"
+                assign.remaining_days = 0
+
+    # 处理 remaining_days 更新或新 assignee 的 assignment 创建
+    if task.assignee and (remaining_days is not None or "assignee" in update_data):
+        dev_assignment = next((a for a in active_dev if a.user == task.assignee), None)
+        if dev_assignment:
+            if remaining_days is not None:
+                dev_assignment.remaining_days = max(0, remaining_days)
+        else:
+            # 如果没有提供 remaining_days，使用默认值 1
+            days_to_set = remaining_days if remaining_days is not None else 1
+            task.assignments.append(
+                TaskAssignmentModel(
+                    user=task.assignee,
+                    role="DEV",
+                    remaining_days=max(0, days_to_set),
+                    started_at=datetime.utcnow(),
+                    status="ACTIVE",
+                )
+            )
+
+
+# 必须注册在 /api/tasks/{task_id} 之前，否则 "batch" 会被当作 task_id 匹配
+@router.patch("/api/tasks/batch", response_model=List[TaskResponse])
+def batch_update_tasks(payload: TaskBatchUpdate, db: Session = Depends(get_db)):
+    ids = [item.id for item in payload.items]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Each task may appear only once per batch")
+    # 一次加载全部任务及其分配与关联，整批在一个事务内提交，每个故事只推导一次状态
+    tasks = {
+        task.id: task
+        for task in db.scalars(
+            select(TaskModel)
+            .where(TaskModel.id.in_(ids))
+            .options(selectinload(TaskModel.assignments), selectinload(TaskModel.github_links))
+        )
+    }
+    missing = [task_id for task_id in ids if task_id not in tasks]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Tasks not found: {', '.join(map(str, missing))}")
+    stale = [item.id for item in payload.items if item.version is not None and item.version != tasks[item.id].version]
+    if stale:
+        raise HTTPException(status_code=409, detail=f"Version conflict on tasks: {', '.join(map(str, stale))}")
+
+    with UnitOfWork(db) as uow:
+        for item in payload.items:
+            update_data = item.dict(exclude_unset=True, exclude={"id", "version"})
+            remaining_days = update_data.pop("remaining_days", None)
+            task = tasks[item.id]
+            apply_task_update(task, update_data, remaining_days)
+            uow.touch_story(task.story_id)
+    return [tasks[task_id] for task_id in ids]
+
+
+@router.patch("/api/tasks/{task_id}", response_model=TaskResponse)
+def update_task(
+    task_id: int,
+    payload: TaskUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    # 分配与关联随任务一并加载，后续的分配处理在内存中完成，响应也不再额外查询
+    task = db.get(
+        TaskModel,
+        task_id,
+        options=[selectinload(TaskModel.assignments), selectinload(TaskModel.github_links)],
+    )
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    # 条件更新：If-Match 与当前版本不一致时返回 409，客户端应重新读取后再提交
+    check_version(task, if_match)
+    update_data = payload.dict(exclude_unset=True)
+    remaining_days = update_data.pop("remaining_days", None)
+
+    with UnitOfWork(db) as uow:
+        apply_task_update(task, update_data, remaining_days)
+        uow.touch_story(task.story_id)
+    set_etag(response, task)
+    return task
+
+
+@router.delete("/api/tasks/{task_id}", status_code=204)
+def delete_task(task_id: int, if_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    task = db.get(TaskModel, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    check_version(task, if_match)
+    with UnitOfWork(db) as uow:
+        uow.touch_story(task.story_id)
+        # 变更日志没有 ORM 级联；显式删除，避免 SQLite 复用任务 id 时继承旧记录
+        db.execute(delete(TaskTransitionModel).where(TaskTransitionModel.task_id == task_id))
+        db.delete(task)
+    return None
+
+
+@router.get("/api/tasks/{task_id}/assignments", response_model=List[TaskAssignmentResponse])
+def list_assignments(task_id: int, db: Session = Depends(get_db)):
+    task = db.get(TaskModel, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return db.query(TaskAssignmentModel).filter(TaskAssignmentModel.task_id == task_id).all()
+
+@router.post("/api/tasks/{task_id}/assignments", response_model=List[TaskAssignmentResponse])
+def create_assignments(task_id: int, payload: AssignmentBatchCreate, db: Session = Depends(get_db)):
+    task = db.get(TaskModel, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    created: List[TaskAssignmentModel] = []
+    for u in payload.users:
+        a = TaskAssignmentModel(
+            task_id=task_id,
+            user=u,
+            role=payload.role or "DEV",
+            remaining_days=max(0, payload.remaining_days),
+            started_at=datetime.utcnow(),
+            status="ACTIVE",
+        )
+        db.add(a)
+        created.append(a)
+    db.commit()
+    return created
@@ -0,0 +1,102 @@
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.clock import get_today
+from backend.database import get_db
+from backend.models import TaskAssignmentModel, TaskModel, TaskStatus, remaining_days_until
+from backend.observability import ProfiledRoute
+from backend.responses import fast_json_response
+from backend.schemas import UserWorkload
+
+router = APIRouter(route_class=ProfiledRoute)
+
+WORKLOAD_ROLES = ("DEV", "REVIEW")
+
+
+def build_workloads(db: Session, users: Optional[List[str]]) -> List[Dict]:
+    """按人员汇总进行中的 DEV / REVIEW 分配；users 为空时返回所有有进行中分配的人员。
+
+    分配明细一条查询（走 (user, status, role) 索引），未完成任务数一条分组查询（走 tasks.assignee 索引）。
+    """
+    today = get_today()
+    workloads: Dict[str, Dict] = {}
+    if users:
+        for user in users:
+            workloads[user] = {"user": user}
+
+    query = (
+        select(
+            TaskAssignmentModel.user,
+            TaskAssignmentModel.id,
+            TaskAssignmentModel.role,
+            TaskAssignmentModel.due_date,
+            TaskAssignmentModel.legacy_remaining_days,
+            TaskModel.id.label("task_id"),
+            TaskModel.title,
+            TaskModel.status,
+            TaskModel.story_id,
+            TaskModel.is_blocked,
+        )
+        .join(TaskModel, TaskAssignmentModel.task_id == TaskModel.id)
+        .where(TaskAssignmentModel.status == "ACTIVE", TaskAssignmentModel.role.in_(WORKLOAD_ROLES))
+        .order_by(TaskAssignmentModel.user, TaskAssignmentModel.due_date, TaskAssignmentModel.id)
+    )
+    if users:
+        query = query.where(TaskAssignmentModel.user.in_(users))
+    else:
+        query = query.where(TaskAssignmentModel.user.isnot(None))
+    for row in db.execute(query):
+        workload = workloads.setdefault(row.user, {"user": row.user})
+        remaining = remaining_days_until(row.due_date, row.legacy_remaining_days, today)
+        workload.setdefault("items", []).append(
+            {
+                "assignment_id": row.id,
+                "role": row.role,
+                "task_id": row.task_id,
+                "title": row.title,
+                "task_status": row.status,
+                "story_id": row.story_id,
+                "remaining_days": remaining,
+                "due_date": row.due_date,
+                "is_blocked": bool(row.is_blocked),
+            }
+        )
+
+    open_tasks: Dict[str, int] = {}
+    if workloads:
+        open_query = (
+            select(TaskModel.assignee, func.count(TaskModel.id))
+            .where(TaskModel.assignee.in_(list(workloads)), TaskModel.status != TaskStatus.DONE.value)
+            .group_by(TaskModel.assignee)
+        )
+        open_tasks = dict(db.execute(open_query).all())
+
+    result: List[Dict] = []
+    for user, workload in workloads.items():
+        items = workload.get("items", [])
+        result.append(
+            {
+                "user": user,
+                "active_dev": sum(1 for item in items if item["role"] == "DEV"),
+                "active_review": sum(1 for item in items if item["role"] == "REVIEW"),
+                "remaining_days": sum(item["remaining_days"] or 0 for item in items),
+                "blocked": sum(1 for item in items if item["is_blocked"]),
+                "open_tasks": open_tasks.get(user, 0),
+                "items": items,
+            }
+        )
+    return result
+
+
+@router.get("/api/users/workload", response_model=List[UserWorkload])
+def get_team_workload(users: Optional[List[str]] = Query(None), db: Session = Depends(get_db)):
+    # 团队容量热力图：?users=alice&users=bob，省略时返回所有有进行中分配的人员
+    return fast_json_response(build_workloads(db, users))
+
+
+@router.get("/api/users/{user}/workload", response_model=UserWorkload)
+def get_user_workload(user: str, db: Session = Depends(get_db)):
+    return fast_json_response(build_workloads(db, [user])[0])
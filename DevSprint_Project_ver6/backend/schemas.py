@@ -0,0 +1,367 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.models import JobStatus, SprintStatus, TaskStatus, UserStoryStatus
+
+
+# 3. Pydantic 模型
+class GitHubLinkResponse(BaseModel):
+    id: int
+    commit_hash: Optional[str]
+    pr_url: Optional[str]
+    repo_name: Optional[str]
+    pr_state: Optional[str]
+    pr_merged: Optional[bool]
+    ci_status: Optional[str]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskAssignmentResponse(BaseModel):
+    id: int
+    user: Optional[str]
+    role: str
+    # 到期日与旧倒计时列都为空时没有剩余天数（见 models.remaining_days_until）
+    remaining_days: Optional[int] = None
+    due_date: Optional[date] = None
+    started_at: Optional[datetime]
+    status: str
+    decision: Optional[str]
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AssignmentBatchCreate(BaseModel):
+    users: List[str]
+    role: Optional[str] = "DEV"
+    remaining_days: int = Field(..., ge=0)
+
+class ReviewDecision(BaseModel):
+    approved: bool
+    tech_debt_days: Optional[int] = Field(None, ge=0)
+
+class TaskBase(BaseModel):
+    title: str
+    story_id: int
+    story_points: int = Field(..., ge=1)
+    status: TaskStatus = TaskStatus.TODO
+    is_tech_debt: bool = False
+    assignee: Optional[str] = None
+    reviewer: Optional[str] = None
+
+
+class TaskCreate(TaskBase):
+    remaining_days: Optional[int] = Field(None, ge=0)
+
+
+class TaskUpdate(BaseModel):
+    title: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    story_points: Optional[int] = Field(None, ge=1)
+    is_tech_debt: Optional[bool] = None
+    assignee: Optional[str] = None
+    reviewer: Optional[str] = None
+    is_blocked: Optional[bool] = None
+    remaining_days: Optional[int] = Field(None, ge=0)
+
+
+class TaskBatchItem(TaskUpdate):
+    id: int
+    # 可选的乐观锁版本，等同于单个更新的 If-Match
+    version: Optional[int] = None
+
+
+class TaskBatchUpdate(BaseModel):
+    items: List[TaskBatchItem] = Field(..., min_length=1, max_length=1000)
+
+
+class TaskResponse(TaskBase):
+    id: int
+    version: int = 1
+    github_links: List[GitHubLinkResponse] = Field(default_factory=list)
+    review_started_at: Optional[datetime] = None
+    review_due_at: Optional[datetime] = None
+    review_breached_at: Optional[datetime] = None
+    is_blocked: bool = False
+    assignments: List["TaskAssignmentResponse"] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserStoryBase(BaseModel):
+    title: str
+    description: Optional[str] = None
+    story_points: int = Field(..., ge=1)
+    priority: int = Field(ge=1, le=5, default=3)
+    is_tech_debt: bool = False
+    sprint_id: Optional[int] = None
+    status: UserStoryStatus = UserStoryStatus.PLANNED
+
+
+class UserStoryCreate(UserStoryBase):
+    pass
+
+
+class UserStoryUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    story_points: Optional[int] = Field(None, ge=1)
+    priority: Optional[int] = Field(None, ge=1, le=5)
+    is_tech_debt: Optional[bool] = None
+    sprint_id: Optional[int] = None
+    status: Optional[UserStoryStatus] = None
+
+
+class UserStoryResponse(UserStoryBase):
+    id: int
+    version: int = 1
+    tasks: List[TaskResponse] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SprintBase(BaseModel):
+    name: str
+    goal: Optional[str] = None
+    start_date: date
+    end_date: date
+    status: SprintStatus = SprintStatus.ACTIVE
+    # 评审 SLA 天数，为空时使用 DEVSPRINT_REVIEW_SLA_DAYS
+    review_sla_days: Optional[int] = Field(None, ge=1)
+
+
+class SprintCreate(SprintBase):
+    pass
+
+
+class SprintUpdate(BaseModel):
+    name: Optional[str] = None
+    goal: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    status: Optional[SprintStatus] = None
+    review_sla_days: Optional[int] = Field(None, ge=1)
+
+
+class SprintResponse(SprintBase):
+    id: int
+    stories: List[UserStoryResponse] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SprintRollover(BaseModel):
+    # 指定 next_sprint_id 时结转到该 Sprint；否则取下一个未关闭的 Sprint，没有则按以下字段新建
+    next_sprint_id: Optional[int] = None
+    name: Optional[str] = None
+    goal: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+class SprintRolloverResponse(BaseModel):
+    sprint_id: int
+    next_sprint_id: int
+    created_next_sprint: bool
+    committed_points: int
+    completed_points: int
+    moved_stories: int
+    moved_tasks: int
+    moved_points: int
+
+
+class BoardTask(BaseModel):
+    id: int
+    story_id: Optional[int] = None
+    title: str
+    story_points: int
+    assignee: Optional[str] = None
+    status: TaskStatus
+    is_blocked: bool = False
+
+
+class BoardResponse(BaseModel):
+    sprint_id: int
+    as_of: datetime
+    checkpoint_at: Optional[datetime] = None
+    replayed_transitions: int = 0
+    counts: Dict[str, int] = Field(default_factory=dict)
+    tasks: List[BoardTask] = Field(default_factory=list)
+
+
+class BurndownPoint(BaseModel):
+    day: str
+    ideal: float
+    actual: Optional[float] = None
+
+
+class FlowPoint(BaseModel):
+    day: str
+    todo: int
+    in_progress: int
+    code_review: int
+    done: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class VelocityPoint(BaseModel):
+    sprint_id: int
+    sprint_name: str
+    start_date: date
+    end_date: date
+    total_points: int
+    completed_points: int
+
+
+class VelocityResponse(BaseModel):
+    points: List[VelocityPoint] = Field(default_factory=list)
+    average_velocity: float = 0.0
+
+
+class BurndownSeries(BaseModel):
+    dates: List[date] = Field(default_factory=list)
+    ideal: List[float] = Field(default_factory=list)
+    actual: List[Optional[float]] = Field(default_factory=list)
+
+
+class FlowSeries(BaseModel):
+    dates: List[date] = Field(default_factory=list)
+    todo: List[int] = Field(default_factory=list)
+    in_progress: List[int] = Field(default_factory=list)
+    code_review: List[int] = Field(default_factory=list)
+    done: List[int] = Field(default_factory=list)
+
+
+class SprintColumns(BaseModel):
+    id: List[int] = Field(default_factory=list)
+    name: List[str] = Field(default_factory=list)
+    status: List[str] = Field(default_factory=list)
+    start_date: List[date] = Field(default_factory=list)
+    end_date: List[date] = Field(default_factory=list)
+    total_points: List[int] = Field(default_factory=list)
+    completed_points: List[int] = Field(default_factory=list)
+
+
+class AnalyticsSeriesResponse(BaseModel):
+    # 列式结构：burndown / cfd 与 sprints 各列按下标一一对应
+    sprints: SprintColumns = Field(default_factory=SprintColumns)
+    average_velocity: float = 0.0
+    burndown: List[BurndownSeries] = Field(default_factory=list)
+    cfd: List[FlowSeries] = Field(default_factory=list)
+
+
+class CycleTimeGroup(BaseModel):
+    # key 为 sprint_id（字符串）或 assignee；时长单位均为小时
+    key: Optional[str] = None
+    tasks: int
+    avg_cycle_hours: Optional[float] = None
+    p50_cycle_hours: Optional[float] = None
+    p85_cycle_hours: Optional[float] = None
+    p95_cycle_hours: Optional[float] = None
+    avg_lead_hours: Optional[float] = None
+    avg_review_hours: Optional[float] = None
+
+
+class CycleTimeResponse(BaseModel):
+    group_by: str
+    groups: List[CycleTimeGroup] = Field(default_factory=list)
+
+
+class ThroughputPoint(BaseModel):
+    key: Optional[str] = None
+    day: date
+    completed: int
+
+
+class ThroughputResponse(BaseModel):
+    group_by: str
+    days: int
+    points: List[ThroughputPoint] = Field(default_factory=list)
+
+
+class WipStatus(BaseModel):
+    status: TaskStatus
+    count: int
+    limit: Optional[int] = None
+    breached: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReviewMetric(BaseModel):
+    task_id: int
+    waiting_days: int
+    sla_days: int
+    breached: bool
+    due_at: Optional[datetime] = None
+    breached_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReviewBreach(BaseModel):
+    task_id: int
+    title: str
+    sprint_id: Optional[int] = None
+    assignee: Optional[str] = None
+    reviewers: List[str] = Field(default_factory=list)
+    review_started_at: Optional[datetime] = None
+    review_due_at: datetime
+    review_breached_at: datetime
+
+
+class DashboardResponse(BaseModel):
+    sprint: Optional[SprintResponse] = None
+    burndown: List[BurndownPoint] = Field(default_factory=list)
+    review_queue: List[TaskResponse] = Field(default_factory=list)
+    tech_debt_points: int = 0
+    sprint_countdown_days: Optional[int] = None
+    wip: List[WipStatus] = Field(default_factory=list)
+    review_metrics: List[ReviewMetric] = Field(default_factory=list)
+    current_date: Optional[date] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WorkloadItem(BaseModel):
+    assignment_id: int
+    role: str
+    task_id: int
+    title: str
+    task_status: TaskStatus
+    story_id: Optional[int] = None
+    remaining_days: Optional[int] = None
+    due_date: Optional[date] = None
+    is_blocked: bool = False
+
+
+class UserWorkload(BaseModel):
+    user: str
+    active_dev: int = 0
+    active_review: int = 0
+    remaining_days: int = 0
+    blocked: int = 0
+    # 以该人员为 assignee 且未完成的任务数（含尚未建立分配的任务）
+    open_tasks: int = 0
+    items: List[WorkloadItem] = Field(default_factory=list)
+
+
+class JobCreate(BaseModel):
+    kind: str
+    payload: Dict = Field(default_factory=dict)
+
+
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    payload: Optional[Dict] = None
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    worker: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
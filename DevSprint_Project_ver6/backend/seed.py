@@ -0,0 +1,176 @@
+import logging
+import os
+from datetime import timedelta
+
+from sqlalchemy.orm import Session
+
+from backend.clock import get_today
+from backend.models import GitHubLinkModel, SprintModel, SprintStatus, TaskModel, TaskStatus, UserStoryModel
+from backend.services import sync_story_status
+from backend.snapshots import capture_burndown_snapshots
+
+
+def seed_demo_data(db: Session) -> None:
+    if db.query(TaskModel).count() > 0:
+        logging.info("Demo data seeding skipped: tasks already exist.")
+        return
+
+    demo_repo = os.getenv("DEVSPRINT_DEMO_REPO", "octocat/Hello-World")
+    demo_pr_url = os.getenv(
+        "DEVSPRINT_DEMO_PR_URL", "https://github.com/octocat/Hello-World/pull/1"
+    )
+    demo_commit_hash = os.getenv(
+        "DEVSPRINT_DEMO_COMMIT", "7fd1a60b01f91b314f59955a4e4d4f5a5d5f90a3"
+    )
+
+    today = get_today()
+    sprint = SprintModel(
+        name=f"Sprint {today.isoformat()}",
+        goal="交付核心功能并完成技术债务收敛",
+        start_date=today,
+        end_date=today + timedelta(days=7),
+        status=SprintStatus.ACTIVE.value,
+    )
+    db.add(sprint)
+    db.flush()
+
+    story_defs = [
+        {
+            "title": "登录与权限收敛",
+            "description": "- 支持企业 SSO\n- 登录失败时记录审计日志\n- 梳理角色权限矩阵",
+            "story_points": 8,
+            "priority": 1,
+            "tasks": [
+                {
+                    "title": "实现基础登录接口",
+                    "story_points": 3,
+                    "status": TaskStatus.IN_PROGRESS.value,
+                    "assignee": "alice",
+                },
+                {
+                    "title": "接入 OAuth2 SSO",
+                    "story_points": 3,
+                    "status": TaskStatus.TODO.value,
+                    "assignee": "bob",
+                },
+                {
+                    "title": "安全扫描遗留项修复",
+                    "story_points": 2,
+                    "status": TaskStatus.TODO.value,
+                    "is_tech_debt": True,
+                    "assignee": "alice",
+                },
+            ],
+        },
+        {
+            "title": "团队看板体验提升",
+            "description": "- Story 支持 Markdown 展示\n- 优化列内排序与快捷操作\n- 可见性分组与筛选",
+            "story_points": 7,
+            "priority": 2,
+            "tasks": [
+                {
+                    "title": "支持 Story Markdown 渲染",
+                    "story_points": 2,
+                    "status": TaskStatus.DONE.value,
+                    "assignee": "carol",
+                },
+                {
+                    "title": "看板列内拖拽排序",
+                    "story_points": 3,
+                    "status": TaskStatus.TODO.value,
+                    "assignee": "dave",
+                },
+                {
+                    "title": "为技术债务卡片增加高亮",
+                    "story_points": 2,
+                    "status": TaskStatus.CODE_REVIEW.value,
+                    "is_tech_debt": True,
+                    "assignee": "carol",
+                },
+            ],
+        },
+        {
+            "title": "持续交付与发布安全",
+            "description": "- 部署前置健康检查\n- 增加缓存与并行策略\n- 回滚脚本自动化",
+            "story_points": 9,
+            "priority": 1,
+            "tasks": [
+                {
+                    "title": "流水线缓存与并行优化",
+                    "story_points": 4,
+                    "status": TaskStatus.IN_PROGRESS.value,
+                    "assignee": "erin",
+                },
+                {
+                    "title": "部署前烟囱检查",
+                    "story_points": 3,
+                    "status": TaskStatus.CODE_REVIEW.value,
+                    "assignee": "frank",
+                },
+                {
+                    "title": "回滚脚本与演练手册",
+                    "story_points": 2,
+                    "status": TaskStatus.TODO.value,
+                    "assignee": "erin",
+                },
+            ],
+        },
+        {
+            "title": "监控告警闭环",
+            "description": "- 建立关键 SLI/SLO\n- 引入告警抑制策略\n- 报警可观测性面板",
+            "story_points": 6,
+            "priority": 3,
+            "tasks": [
+                {
+                    "title": "核心 API SLO 定义与仪表盘",
+                    "story_points": 3,
+                    "status": TaskStatus.DONE.value,
+                    "assignee": "grace",
+                },
+                {
+                    "title": "告警抑制与值班转派规则",
+                    "story_points": 3,
+                    "status": TaskStatus.TODO.value,
+                    "assignee": "heidi",
+                },
+            ],
+        },
+    ]
+
+    for story_def in story_defs:
+        story = UserStoryModel(
+            sprint_id=sprint.id,
+            title=story_def["title"],
+            description=story_def["description"],
+            story_points=story_def["story_points"],
+            priority=story_def.get("priority", 3),
+            is_tech_debt=story_def.get("is_tech_debt", False),
+        )
+        db.add(story)
+        db.flush()
+        for task_def in story_def["tasks"]:
+            task = TaskModel(
+                story_id=story.id,
+                title=task_def["title"],
+                status=task_def["status"],
+                story_points=task_def["story_points"],
+                is_tech_debt=task_def.get("is_tech_debt", False),
+                assignee=task_def.get("assignee"),
+            )
+            db.add(task)
+            if task.status == TaskStatus.CODE_REVIEW.value:
+                db.flush()
+                db.add(
+                    GitHubLinkModel(
+                        task_id=task.id,
+                        pr_url=demo_pr_url,
+                        repo_name=demo_repo,
+                        commit_hash=demo_commit_hash,
+                    )
+                )
+        sync_story_status(db, story)
+
+    db.commit()
+    logging.info("Demo data seeded: sprint=%s, stories=%d", sprint.name, len(story_defs))
+    # 生成今天的快照
+    capture_burndown_snapshots(get_today())
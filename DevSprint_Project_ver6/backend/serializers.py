@@ -0,0 +1,118 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from backend.clock import get_today
+from backend.models import (
+    GitHubLinkModel,
+    SprintModel,
+    TaskAssignmentModel,
+    TaskModel,
+    UserStoryModel,
+    remaining_days_until,
+)
+from backend.schemas import (
+    GitHubLinkResponse,
+    SprintResponse,
+    TaskAssignmentResponse,
+    TaskResponse,
+    UserStoryResponse,
+)
+
+# 快速序列化：直接按列查询构建与 *Response 字段顺序一致的 dict，跳过 ORM 实例化与
+# Pydantic from_attributes 校验；接口仍声明 response_model，OpenAPI 文档不变。
+# 日期时间保持原始类型，由 fast_json_response（orjson / jsonable_encoder）编码。
+
+
+def _fields(schema, nested: Sequence[str] = ()) -> List[str]:
+    return [name for name in schema.model_fields if name not in nested]
+
+
+LINK_FIELDS = _fields(GitHubLinkResponse)
+ASSIGNMENT_FIELDS = _fields(TaskAssignmentResponse)
+TASK_FIELDS = _fields(TaskResponse, ("github_links", "assignments"))
+STORY_FIELDS = _fields(UserStoryResponse, ("tasks",))
+SPRINT_FIELDS = _fields(SprintResponse, ("stories",))
+
+
+def _children(db: Session, model, fields: List[str], parent_column, parent_ids: Select) -> Dict[int, List[Dict]]:
+    grouped: Dict[int, List[Dict]] = defaultdict(list)
+    query = (
+        select(parent_column, *(getattr(model, name) for name in fields))
+        .where(parent_column.in_(parent_ids))
+        .order_by(model.id)
+    )
+    for row in db.execute(query):
+        grouped[row[0]].append(dict(zip(fields, row[1:])))
+    return grouped
+
+
+def _assignments(db: Session, task_ids: Select) -> Dict[int, List[Dict]]:
+    # remaining_days 不是列：查询到期日与旧倒计时列，按当前（模拟）日期换算
+    today = get_today()
+    columns = [
+        TaskAssignmentModel.legacy_remaining_days if name == "remaining_days" else getattr(TaskAssignmentModel, name)
+        for name in ASSIGNMENT_FIELDS
+    ]
+    grouped: Dict[int, List[Dict]] = defaultdict(list)
+    query = (
+        select(TaskAssignmentModel.task_id, *columns)
+        .where(TaskAssignmentModel.task_id.in_(task_ids))
+        .order_by(TaskAssignmentModel.id)
+    )
+    for row in db.execute(query):
+        assignment = dict(zip(ASSIGNMENT_FIELDS, row[1:]))
+        assignment["remaining_days"] = remaining_days_until(
+            assignment["due_date"], assignment["remaining_days"], today
+        )
+        grouped[row[0]].append(assignment)
+    return grouped
+
+
+def task_dicts(db: Session, task_ids: Select) -> List[Dict]:
+    # task_ids 为返回任务 id 的子查询，关联表以子查询过滤，每类数据只查一次
+    links = _children(db, GitHubLinkModel, LINK_FIELDS, GitHubLinkModel.task_id, task_ids)
+    assignments = _assignments(db, task_ids)
+    tasks: List[Dict] = []
+    query = (
+        select(*(getattr(TaskModel, name) for name in TASK_FIELDS))
+        .where(TaskModel.id.in_(task_ids))
+        .order_by(TaskModel.id)
+    )
+    for row in db.execute(query):
+        task = dict(zip(TASK_FIELDS, row))
+        task["is_blocked"] = bool(task["is_blocked"])
+        task["github_links"] = links.get(task["id"], [])
+        task["assignments"] = assignments.get(task["id"], [])
+        tasks.append(task)
+    return tasks
+
+
+def sprint_dicts(db: Session, sprint_ids: Select) -> List[Dict]:
+    stories: Dict[int, List[Dict]] = defaultdict(list)
+    story_ids = select(UserStoryModel.id).where(UserStoryModel.sprint_id.in_(sprint_ids))
+    tasks: Dict[int, List[Dict]] = defaultdict(list)
+    for task in task_dicts(db, select(TaskModel.id).where(TaskModel.story_id.in_(story_ids))):
+        tasks[task["story_id"]].append(task)
+    story_query = (
+        select(UserStoryModel.sprint_id, *(getattr(UserStoryModel, name) for name in STORY_FIELDS))
+        .where(UserStoryModel.sprint_id.in_(sprint_ids))
+        .order_by(UserStoryModel.id)
+    )
+    for row in db.execute(story_query):
+        story = dict(zip(STORY_FIELDS, row[1:]))
+        story["tasks"] = tasks.get(story["id"], [])
+        stories[row[0]].append(story)
+    sprints: List[Dict] = []
+    query = (
+        select(*(getattr(SprintModel, name) for name in SPRINT_FIELDS))
+        .where(SprintModel.id.in_(sprint_ids))
+        .order_by(SprintModel.id)
+    )
+    for row in db.execute(query):
+        sprint = dict(zip(SPRINT_FIELDS, row))
+        sprint["stories"] = stories.get(sprint["id"], [])
+        sprints.append(sprint)
+    return sprints
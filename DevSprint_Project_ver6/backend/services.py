@@ -0,0 +1,99 @@
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Response
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from backend.config import env_int
+from backend.models import (
+    BoardCheckpointModel,
+    BurndownSnapshotModel,
+    FlowSnapshotModel,
+    GitHubLinkModel,
+    SnapshotArchiveModel,
+    TaskAssignmentModel,
+    TaskModel,
+    TaskStatus,
+    TaskTransitionModel,
+    UserStoryModel,
+    UserStoryStatus,
+)
+
+DELETE_CHUNK_SIZE = env_int("DEVSPRINT_DELETE_CHUNK_SIZE", 1000) or 1000
+# 引用 tasks.id 的子表，删除任务前按此顺序先删
+TASK_CHILD_MODELS = (GitHubLinkModel, TaskAssignmentModel, TaskTransitionModel)
+SPRINT_SNAPSHOT_MODELS = (BurndownSnapshotModel, FlowSnapshotModel, SnapshotArchiveModel, BoardCheckpointModel)
+
+
+def sync_story_status(db: Session, story: UserStoryModel) -> None:
+    if not story.tasks:
+        return
+    if all(task.status == TaskStatus.DONE.value for task in story.tasks):
+        story.status = UserStoryStatus.DONE.value
+    elif any(task.status in (TaskStatus.IN_PROGRESS.value, TaskStatus.CODE_REVIEW.value) for task in story.tasks):
+        story.status = UserStoryStatus.ACTIVE.value
+    else:
+        story.status = UserStoryStatus.PLANNED.value
+
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    # If-Match 接受 "3"、W/"3" 或 3；缺省或 * 表示不做条件检查
+    if value is None or value.strip() == "*":
+        return None
+    tag = value.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    try:
+        return int(tag.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must be a version number")
+
+
+def check_version(entity, if_match: Optional[str]) -> None:
+    expected = parse_if_match(if_match)
+    if expected is not None and expected != entity.version:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Version conflict: expected {expected}, current version is {entity.version}",
+        )
+
+
+def set_etag(response: Response, entity) -> None:
+    response.headers["ETag"] = f'"{entity.version}"'
+
+
+def delete_sprint_stories(db: Session, sprint_id: int, chunk_size: int = DELETE_CHUNK_SIZE) -> Dict[str, int]:
+    """集合式删除 Sprint 下的故事、任务及其关联与分配，按依赖顺序分块提交。
+
+    不加载 ORM 对象，数量用聚合统计；每块单独提交以缩短锁持有时间，因此中途失败时
+    已提交的块不会回滚，重试会继续删除剩余数据。
+    """
+    story_ids = select(UserStoryModel.id).where(UserStoryModel.sprint_id == sprint_id)
+    deleted_stories = db.scalar(select(func.count()).select_from(story_ids.subquery())) or 0
+    deleted_tasks = db.scalar(
+        select(func.count(TaskModel.id)).where(TaskModel.story_id.in_(story_ids))
+    ) or 0
+
+    while True:
+        task_ids = db.scalars(
+            select(TaskModel.id).where(TaskModel.story_id.in_(story_ids)).limit(chunk_size)
+        ).all()
+        if not task_ids:
+            break
+        for model in TASK_CHILD_MODELS:
+            db.execute(delete(model).where(model.task_id.in_(task_ids)).execution_options(synchronize_session=False))
+        db.execute(delete(TaskModel).where(TaskModel.id.in_(task_ids)).execution_options(synchronize_session=False))
+        db.commit()
+
+    while True:
+        chunk = db.scalars(story_ids.limit(chunk_size)).all()
+        if not chunk:
+            break
+        db.execute(delete(UserStoryModel).where(UserStoryModel.id.in_(chunk)).execution_options(synchronize_session=False))
+        db.commit()
+    return {"deleted_stories": deleted_stories, "deleted_tasks": deleted_tasks}
+
+
+def delete_sprint_snapshots(db: Session, sprint_id: int) -> None:
+    for model in SPRINT_SNAPSHOT_MODELS:
+        db.execute(delete(model).where(model.sprint_id == sprint_id).execution_options(synchronize_session=False))
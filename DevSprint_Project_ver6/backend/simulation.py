@@ -0,0 +1,231 @@
+from datetime import date, datetime
+from typing import Dict, Union
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session, selectinload
+
+from backend.clock import get_today, simulation_clock
+from backend.database import SessionLocal
+from backend.models import SprintModel, SprintStatus, TaskAssignmentModel, TaskModel, TaskStatus, UserStoryModel
+from backend.review_sla import detect_review_breaches, effective_sla_days, run_review_breach_scan, start_review_clock
+from backend.reviewers import reviewer_queue
+from backend.snapshots import capture_burndown_snapshots
+from backend.unit_of_work import derive_story_statuses
+
+
+def simulate_progress(db: Session) -> None:
+    sprint = (
+        db.query(SprintModel)
+        .filter(SprintModel.status == SprintStatus.ACTIVE.value)
+        .order_by(SprintModel.start_date)
+        .first()
+    )
+    if not sprint:
+        return
+
+    def pick_task(status: TaskStatus):
+        return (
+            db.query(TaskModel)
+            .join(UserStoryModel)
+            .filter(
+                TaskModel.status == status.value,
+                UserStoryModel.sprint_id == sprint.id,
+            )
+            .order_by(TaskModel.is_tech_debt.desc(), TaskModel.id)
+            .first()
+        )
+
+    def ensure_tech_debt_story() -> UserStoryModel:
+        td_story = (
+            db.query(UserStoryModel)
+            .filter(
+                UserStoryModel.sprint_id == sprint.id,
+                UserStoryModel.is_tech_debt == True,
+            )
+            .order_by(UserStoryModel.priority, UserStoryModel.id)
+            .first()
+        )
+        if td_story:
+            return td_story
+        td_story = UserStoryModel(
+            sprint_id=sprint.id,
+            title="技术债务集中处理",
+            description="- 自动生成的技术债务故事\n- 清理告警与代码异味",
+            story_points=5,
+            priority=1,
+            is_tech_debt=True,
+        )
+        db.add(td_story)
+        db.flush()
+        return td_story
+
+    def ensure_tech_debt_task():
+        td_story = ensure_tech_debt_story()
+        task = TaskModel(
+            story_id=td_story.id,
+            title="处理技术债务项",
+            status=TaskStatus.TODO.value,
+            story_points=2,
+            is_tech_debt=True,
+            assignee=None,
+        )
+        db.add(task)
+        db.flush()
+        return task
+
+    today = get_today()
+    sprint_tasks = select(TaskModel.id).join(UserStoryModel).where(UserStoryModel.sprint_id == sprint.id)
+
+    def assignments_of(role: str):
+        return select(TaskAssignmentModel.id).where(
+            TaskAssignmentModel.task_id == TaskModel.id, TaskAssignmentModel.role == role
+        )
+
+    def pending(role: str):
+        # 未完成且未到期（到期日为空视为尚未开始计时）
+        return assignments_of(role).where(
+            TaskAssignmentModel.status != "DONE",
+            or_(TaskAssignmentModel.due_date.is_(None), TaskAssignmentModel.due_date > today),
+        )
+
+    # 1. 有负责人却没有 DEV 分配的任务：补建分配并计入今天的进度（数据修复，通常为空）
+    for t in db.scalars(
+        select(TaskModel)
+        .where(
+            TaskModel.id.in_(sprint_tasks),
+            TaskModel.status.in_([TaskStatus.TODO.value, TaskStatus.IN_PROGRESS.value]),
+            TaskModel.assignee.isnot(None),
+            ~assignments_of("DEV").exists(),
+        )
+    ):
+        db.add(
+            TaskAssignmentModel(
+                task_id=t.id,
+                user=t.assignee,
+                role="DEV",
+                remaining_days=max(0, (t.tech_debt_estimate_days or 1) - 1),
+                started_at=datetime.utcnow(),
+                status="ACTIVE",
+            )
+        )
+    db.flush()
+
+    # 2. 到期的 DEV 分配标记为完成：按 (status, due_date) 索引的范围查询，只触及今天到期的行
+    db.execute(
+        update(TaskAssignmentModel)
+        .where(
+            TaskAssignmentModel.status == "ACTIVE",
+            TaskAssignmentModel.due_date <= today,
+            TaskAssignmentModel.role == "DEV",
+            TaskAssignmentModel.task_id.in_(
+                sprint_tasks.where(TaskModel.status.in_([TaskStatus.TODO.value, TaskStatus.IN_PROGRESS.value]))
+            ),
+        )
+        .values(status="DONE")
+        .execution_options(synchronize_session=False)
+    )
+
+    # 3. 只加载今天会发生状态变化的任务：有 DEV 分配的 TODO、DEV 全部完成的 IN_PROGRESS、
+    #    评审全部完成且没有驳回的 CODE_REVIEW
+    rejected_review = assignments_of("REVIEW").where(
+        TaskAssignmentModel.decision.isnot(None), TaskAssignmentModel.decision != "APPROVED"
+    )
+    candidates = db.scalars(
+        select(TaskModel)
+        .where(
+            TaskModel.id.in_(sprint_tasks),
+            or_(
+                and_(TaskModel.status == TaskStatus.TODO.value, assignments_of("DEV").exists()),
+                and_(
+                    TaskModel.status == TaskStatus.IN_PROGRESS.value,
+                    assignments_of("DEV").exists(),
+                    ~pending("DEV").exists(),
+                ),
+                and_(
+                    TaskModel.status == TaskStatus.CODE_REVIEW.value,
+                    assignments_of("REVIEW").exists(),
+                    ~pending("REVIEW").exists(),
+                    ~rejected_review.exists(),
+                ),
+            ),
+        )
+        .options(selectinload(TaskModel.assignments))
+    ).all()
+
+    def finished(a: TaskAssignmentModel) -> bool:
+        return (a.remaining_days is not None and a.remaining_days <= 0) or a.status == "DONE"
+
+    review_sla_days = effective_sla_days(sprint.review_sla_days)
+    touched_stories = set()
+    for t in candidates:
+        dev_all = [a for a in t.assignments if a.role == "DEV"]
+        review_all = [a for a in t.assignments if a.role == "REVIEW"]
+        if t.status == TaskStatus.TODO.value and dev_all:
+            # 有 ACTIVE 的 DEV 分配，或已有到期 / 完成的 DEV 分配，移动到 IN_PROGRESS
+            if any(a.status == "ACTIVE" for a in dev_all) or any(finished(a) for a in dev_all):
+                t.status = TaskStatus.IN_PROGRESS.value
+        if t.status == TaskStatus.IN_PROGRESS.value and dev_all and all(finished(a) for a in dev_all):
+            t.status = TaskStatus.CODE_REVIEW.value
+            start_review_clock(t, review_sla_days)
+        if t.status == TaskStatus.CODE_REVIEW.value and review_all and all(finished(a) for a in review_all):
+            # 只有当所有 review 都 approved（或未给出结论）时才移动到 DONE
+            if all(a.decision == "APPROVED" for a in review_all if a.decision):
+                t.status = TaskStatus.DONE.value
+        touched_stories.add(t.story_id)
+    db.flush()
+    derive_story_statuses(db, touched_stories)
+
+    if db.scalar(select(TaskModel.id).where(TaskModel.id.in_(sprint_tasks), TaskModel.status != TaskStatus.DONE.value).limit(1)) is None:
+        ensure_tech_debt_task()
+    # 模拟日期前进后扫描新超期的评审
+    detect_review_breaches(db)
+    db.commit()
+    # 模拟推进会让评审中的任务直接完成，评审人负载下次选人时从数据库重新加载
+    reviewer_queue.invalidate()
+
+
+def run_simulation_days(days: int) -> Dict[str, Union[int, str]]:
+    created = 0
+    db = SessionLocal()
+    try:
+        for _ in range(days):
+            simulation_clock.advance(1)
+            simulate_date = get_today()
+            simulate_progress(db)
+            capture_burndown_snapshots(simulate_date, simulated=True)
+            created += 1
+    finally:
+        db.close()
+    return {
+        "created_snapshots": created,
+        "last_date": simulate_date.isoformat(),
+        "current_day": get_today().isoformat(),
+        "offset_days": simulation_clock.offset(),
+    }
+
+
+def run_set_remaining_days(remaining_days: int) -> Dict[str, Union[int, str]]:
+    db = SessionLocal()
+    try:
+        sprint = (
+            db.query(SprintModel)
+            .filter(SprintModel.status == SprintStatus.ACTIVE.value)
+            .order_by(SprintModel.start_date)
+            .first()
+        )
+        if not sprint:
+            raise HTTPException(status_code=404, detail="No active sprint found")
+
+        base_remaining = (sprint.end_date - date.today()).days
+        offset_days = simulation_clock.set(base_remaining - remaining_days)
+        snapshot_date = get_today()
+        capture_burndown_snapshots(snapshot_date, simulated=True)
+        run_review_breach_scan()
+        return {
+            "current_day": snapshot_date.isoformat(),
+            "offset_days": offset_days,
+            "remaining_days": remaining_days,
+        }
+    finally:
+        db.close()
@@ -0,0 +1,321 @@
+import json
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.board_history import capture_board_checkpoint, thin_board_checkpoints
+from backend.clock import get_now, get_today
+from backend.config import env_int
+from backend.database import SessionLocal
+from backend.models import (
+    BoardCheckpointModel,
+    BurndownSnapshotModel,
+    FlowSnapshotModel,
+    SnapshotArchiveModel,
+    SprintModel,
+    SprintStatus,
+    TaskModel,
+    TaskStatus,
+    UserStoryModel,
+    UserStoryStatus,
+)
+from backend.schemas import BurndownPoint
+
+
+def calculate_remaining_points(db: Session, sprint_id: int) -> int:
+    remaining = (
+        db.query(func.coalesce(func.sum(UserStoryModel.story_points), 0))
+        .filter(
+            UserStoryModel.sprint_id == sprint_id,
+            UserStoryModel.status != UserStoryStatus.DONE.value,
+        )
+        .scalar()
+    )
+    return remaining or 0
+
+
+def _decode_archive(raw: Optional[str]) -> Dict[str, list]:
+    return json.loads(raw) if raw else {}
+
+
+def _archived_burndown(archive: Optional[SnapshotArchiveModel]) -> Dict[date, int]:
+    if archive is None:
+        return {}
+    series = _decode_archive(archive.burndown_series)
+    return {
+        date.fromisoformat(day): remaining
+        for day, remaining in zip(series.get("dates", []), series.get("remaining", []))
+    }
+
+
+def _archived_flow(archive: Optional[SnapshotArchiveModel]) -> Dict[date, tuple]:
+    if archive is None:
+        return {}
+    series = _decode_archive(archive.flow_series)
+    return {
+        date.fromisoformat(day): counts
+        for day, *counts in zip(
+            series.get("dates", []),
+            series.get("todo", []),
+            series.get("in_progress", []),
+            series.get("code_review", []),
+            series.get("done", []),
+        )
+    }
+
+
+def load_burndown_history(db: Session, sprint_id: int) -> Dict[date, int]:
+    # 压缩归档与原始快照合并读取，原始行（如 Sprint 重新打开后写入的）优先
+    archive = (
+        db.query(SnapshotArchiveModel)
+        .filter(SnapshotArchiveModel.sprint_id == sprint_id)
+        .first()
+    )
+    history = _archived_burndown(archive)
+    rows = db.execute(
+        select(BurndownSnapshotModel.snapshot_date, BurndownSnapshotModel.remaining_points)
+        .where(BurndownSnapshotModel.sprint_id == sprint_id)
+    )
+    for row in rows:
+        history[row.snapshot_date] = row.remaining_points
+    return dict(sorted(history.items()))
+
+
+def load_flow_history(db: Session, sprint_id: int) -> Dict[date, tuple]:
+    archive = (
+        db.query(SnapshotArchiveModel)
+        .filter(SnapshotArchiveModel.sprint_id == sprint_id)
+        .first()
+    )
+    history = _archived_flow(archive)
+    rows = db.execute(
+        select(
+            FlowSnapshotModel.snapshot_date,
+            FlowSnapshotModel.todo_count,
+            FlowSnapshotModel.in_progress_count,
+            FlowSnapshotModel.code_review_count,
+            FlowSnapshotModel.done_count,
+        ).where(FlowSnapshotModel.sprint_id == sprint_id)
+    )
+    for row in rows:
+        history[row.snapshot_date] = tuple(row[1:])
+    return dict(sorted(history.items()))
+
+
+def build_burndown_payload(
+    db: Session, sprint: SprintModel
+) -> List[BurndownPoint]:
+    if not sprint.start_date or not sprint.end_date:
+        return []
+
+    total_days = (sprint.end_date - sprint.start_date).days + 1
+    total_days = max(total_days, 1)
+    total_points = sum(story.story_points for story in sprint.stories)
+    total_points = max(total_points, 0)
+
+    snapshot_map = load_burndown_history(db, sprint.id)
+
+    current_day = sprint.start_date
+    last_actual = total_points
+    burndown_points: List[BurndownPoint] = []
+    today = get_today()
+
+    for index in range(total_days):
+        ideal_remaining = total_points - (
+            index * total_points / max(total_days - 1, 1)
+        )
+        if current_day in snapshot_map:
+            last_actual = snapshot_map[current_day]
+        
+        # 只显示到今天（含）的实际数据
+        actual_value = max(last_actual, 0) if current_day <= today else None
+
+        burndown_points.append(
+            BurndownPoint(
+                day=f"Day {index + 1}",
+                ideal=max(ideal_remaining, 0),
+                actual=actual_value,
+            )
+        )
+        current_day = current_day + timedelta(days=1)
+
+    if burndown_points and not snapshot_map and sprint.start_date <= today:
+        # 如果尚未生成快照且在Sprint范围内，则使用实时剩余点数填充
+        # 注意：这可能会覆盖掉上面的 None，如果是未来的话不应该覆盖，但在 start_date <= today 条件下是安全的
+        idx = (today - sprint.start_date).days
+        if 0 <= idx < len(burndown_points):
+             burndown_points[idx].actual = calculate_remaining_points(db, sprint.id)
+
+    return burndown_points
+
+
+# 9. 轮询任务：燃尽记录与快照压缩
+def capture_sprint_snapshot(db: Session, sprint_id: int, target_date: date, simulated: bool = False) -> None:
+    # 写入（或覆盖）指定 Sprint 当天的燃尽、累积流快照与看板检查点，由调用方负责提交
+    remaining = calculate_remaining_points(db, sprint_id)
+    snapshot = (
+        db.query(BurndownSnapshotModel)
+        .filter(
+            BurndownSnapshotModel.sprint_id == sprint_id,
+            BurndownSnapshotModel.snapshot_date == target_date,
+        )
+        .first()
+    )
+    if snapshot:
+        snapshot.remaining_points = remaining
+        snapshot.is_simulated = simulated
+    else:
+        db.add(
+            BurndownSnapshotModel(
+                sprint_id=sprint_id,
+                snapshot_date=target_date,
+                remaining_points=remaining,
+                is_simulated=simulated,
+            )
+        )
+    # 一次分组查询得到各状态的任务数
+    status_counts = dict(
+        db.query(TaskModel.status, func.count(TaskModel.id))
+        .join(UserStoryModel)
+        .filter(UserStoryModel.sprint_id == sprint_id)
+        .group_by(TaskModel.status)
+        .all()
+    )
+    todo_count = status_counts.get(TaskStatus.TODO.value, 0)
+    in_progress_count = status_counts.get(TaskStatus.IN_PROGRESS.value, 0)
+    code_review_count = status_counts.get(TaskStatus.CODE_REVIEW.value, 0)
+    done_count = status_counts.get(TaskStatus.DONE.value, 0)
+    flow = (
+        db.query(FlowSnapshotModel)
+        .filter(
+            FlowSnapshotModel.sprint_id == sprint_id,
+            FlowSnapshotModel.snapshot_date == target_date,
+        )
+        .first()
+    )
+    if flow:
+        flow.todo_count = todo_count
+        flow.in_progress_count = in_progress_count
+        flow.code_review_count = code_review_count
+        flow.done_count = done_count
+        flow.is_simulated = simulated
+    else:
+        db.add(
+            FlowSnapshotModel(
+                sprint_id=sprint_id,
+                snapshot_date=target_date,
+                todo_count=todo_count,
+                in_progress_count=in_progress_count,
+                code_review_count=code_review_count,
+                done_count=done_count,
+                is_simulated=simulated,
+            )
+        )
+    # 同时写入看板检查点，供历史看板重建使用
+    capture_board_checkpoint(db, sprint_id, get_now(), simulated)
+
+
+def capture_burndown_snapshots(
+    for_date: Optional[date] = None, simulated: bool = False, raise_errors: bool = False
+):
+    db = SessionLocal()
+    try:
+        target_date = for_date or get_today()
+        active_sprints = (
+            db.query(SprintModel)
+            .filter(SprintModel.status == SprintStatus.ACTIVE.value)
+            .all()
+        )
+        for sprint in active_sprints:
+            capture_sprint_snapshot(db, sprint.id, target_date, simulated)
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        if raise_errors:
+            raise
+        logging.exception("Failed to capture burndown snapshots: %s", exc)
+    finally:
+        db.close()
+
+
+def compact_sprint_snapshots(db: Session, sprint_id: int) -> None:
+    burndown = load_burndown_history(db, sprint_id)
+    flow = load_flow_history(db, sprint_id)
+    archive = (
+        db.query(SnapshotArchiveModel)
+        .filter(SnapshotArchiveModel.sprint_id == sprint_id)
+        .first()
+    )
+    if archive is None:
+        archive = SnapshotArchiveModel(sprint_id=sprint_id)
+        db.add(archive)
+    archive.burndown_series = json.dumps(
+        {
+            "dates": [day.isoformat() for day in burndown],
+            "remaining": list(burndown.values()),
+        }
+    )
+    archive.flow_series = json.dumps(
+        {
+            "dates": [day.isoformat() for day in flow],
+            "todo": [counts[0] for counts in flow.values()],
+            "in_progress": [counts[1] for counts in flow.values()],
+            "code_review": [counts[2] for counts in flow.values()],
+            "done": [counts[3] for counts in flow.values()],
+        }
+    )
+    archive.compacted_at = datetime.utcnow()
+    db.query(BurndownSnapshotModel).filter(
+        BurndownSnapshotModel.sprint_id == sprint_id
+    ).delete(synchronize_session=False)
+    db.query(FlowSnapshotModel).filter(
+        FlowSnapshotModel.sprint_id == sprint_id
+    ).delete(synchronize_session=False)
+    thin_board_checkpoints(db, sprint_id)
+
+
+def purge_simulated_snapshots(db: Session, retention_days: int) -> int:
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    purged = 0
+    for model in (BurndownSnapshotModel, FlowSnapshotModel, BoardCheckpointModel):
+        purged += (
+            db.query(model)
+            .filter(model.is_simulated == True, model.created_at < cutoff)
+            .delete(synchronize_session=False)
+        )
+    return purged
+
+
+def compact_snapshot_history(raise_errors: bool = False) -> Dict[str, int]:
+    # 已关闭 Sprint 不再变化：冻结为单行归档；模拟生成的快照按保留期清理
+    db = SessionLocal()
+    result = {"compacted_sprints": 0, "purged_snapshots": 0}
+    try:
+        closed_ids = [
+            row.id
+            for row in db.execute(
+                select(SprintModel.id).where(
+                    SprintModel.status == SprintStatus.CLOSED.value,
+                    SprintModel.id.in_(select(BurndownSnapshotModel.sprint_id))
+                    | SprintModel.id.in_(select(FlowSnapshotModel.sprint_id)),
+                )
+            )
+        ]
+        for sprint_id in closed_ids:
+            compact_sprint_snapshots(db, sprint_id)
+        result["compacted_sprints"] = len(closed_ids)
+        retention_days = env_int("DEVSPRINT_SIM_SNAPSHOT_RETENTION_DAYS", 30)
+        if retention_days is not None and retention_days > 0:
+            result["purged_snapshots"] = purge_simulated_snapshots(db, retention_days)
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        if raise_errors:
+            raise
+        logging.exception("Failed to compact snapshot history: %s", exc)
+    finally:
+        db.close()
+    return result
@@ -0,0 +1,57 @@
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from backend.models import TaskModel, TaskStatus, TaskTransitionModel
+
+# 任务状态变更日志：所有经由 ORM 修改 status / is_blocked 的写路径（任务更新、评审决策、
+# PR 关联、CI 阻塞、模拟推进）在 flush 前统一生成 task_transitions 行，与业务变更同一事务提交，
+# 调用方无需各自记录。
+
+
+def _changed(task: TaskModel, key: str) -> Optional[tuple]:
+    # 返回 (旧值, 新值)；只赋了相同的值时视为未变化
+    history = inspect(task).attrs[key].history
+    if not history.added:
+        return None
+    old = history.deleted[0] if history.deleted else None
+    new = history.added[0]
+    if old == new:
+        return None
+    return old, new
+
+
+@event.listens_for(Session, "before_flush")
+def record_task_transitions(session: Session, flush_context, instances) -> None:
+    now = None
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, TaskModel):
+            continue
+        if obj in session.new:
+            from_status = None
+            to_status = obj.status or TaskStatus.TODO.value
+        else:
+            status = _changed(obj, "status")
+            blocked = _changed(obj, "is_blocked")
+            if status is None and blocked is None:
+                continue
+            from_status = status[0] if status else obj.status
+            to_status = obj.status
+            if from_status == TaskStatus.CODE_REVIEW.value and to_status != TaskStatus.CODE_REVIEW.value:
+                # 离开评审：清空 SLA 截止时间与超期标记，超期索引中只保留评审中的任务
+                obj.review_due_at = None
+                obj.review_breached_at = None
+        if now is None:
+            from backend.clock import get_now
+
+            now = get_now()
+        session.add(
+            TaskTransitionModel(
+                task=obj,
+                from_status=from_status,
+                to_status=to_status,
+                is_blocked=bool(obj.is_blocked),
+                transitioned_at=now,
+            )
+        )
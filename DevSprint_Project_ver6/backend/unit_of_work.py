@@ -0,0 +1,82 @@
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from backend.models import TaskModel, TaskStatus, UserStoryModel, UserStoryStatus
+
+
+def story_status_expression():
+    # 与 sync_story_status 相同的规则，用 SQL 表达：无任务时保持原状态
+    story_tasks = select(TaskModel.id).where(TaskModel.story_id == UserStoryModel.id)
+    return case(
+        (~story_tasks.exists(), UserStoryModel.status),
+        (~story_tasks.where(TaskModel.status != TaskStatus.DONE.value).exists(), UserStoryStatus.DONE.value),
+        (
+            story_tasks.where(
+                TaskModel.status.in_([TaskStatus.IN_PROGRESS.value, TaskStatus.CODE_REVIEW.value])
+            ).exists(),
+            UserStoryStatus.ACTIVE.value,
+        ),
+        else_=UserStoryStatus.PLANNED.value,
+    )
+
+
+def derive_story_statuses(db: Session, story_ids: Iterable[int]) -> None:
+    # 一条 UPDATE 完成推导；只有状态真正变化的故事才会写入并递增 version
+    ids = sorted(set(story_ids))
+    if not ids:
+        return
+    status = story_status_expression()
+    db.execute(
+        update(UserStoryModel)
+        .where(UserStoryModel.id.in_(ids), UserStoryModel.status.is_distinct_from(status))
+        .values(status=status, version=UserStoryModel.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    # 会话中已加载的故事对象只让这两列失效，下次访问时按需重新读取
+    for story_id in ids:
+        story = db.identity_map.get(identity_key(UserStoryModel, story_id))
+        if story is not None:
+            db.expire(story, ["status", "version"])
+
+
+class UnitOfWork:
+    """一次写操作对应一个事务：任务、分配与故事状态推导在同一次 flush 后只提交一次。
+
+    提交后不让对象整体过期，响应直接使用内存中的状态（id 与 version 在 flush 时已确定），
+    避免提交后再逐个 refresh。
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.story_ids: Set[int] = set()
+
+    def touch_story(self, story_id: Optional[int]) -> None:
+        if story_id is not None:
+            self.story_ids.add(story_id)
+
+    def commit(self) -> None:
+        self.db.flush()
+        derive_story_statuses(self.db, self.story_ids)
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self.db.rollback()
+            return False
+        try:
+            self.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return False
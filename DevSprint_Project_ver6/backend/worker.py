@@ -0,0 +1,125 @@
+"""DevSprint 后台 worker。
+
+执行定时任务（每日快照、快照压缩、GitHub 轮询），并消费 `jobs` 表中的后台任务
+（由 `POST /api/jobs` 或模拟接口的 `?defer=true` 写入）。部署该进程后 API 可设
+`DEVSPRINT_API_SCHEDULER=0`，请求处理不再与耗时任务争用 GIL 和连接池。
+
+用法（在项目根目录）：
+    python -m backend.worker
+    python -m backend.worker --concurrency 2 --poll-interval 0.5
+    python -m backend.worker --once --no-scheduler   # 处理完队列即退出
+"""
+
+import argparse
+import logging
+import signal
+import sys
+import threading
+import time
+from typing import Optional
+
+from backend import jobs
+from backend.config import env_flag
+from backend.database import SessionLocal, ensure_db_ready
+from backend.leases import WORKER_ID
+
+
+MAX_ERROR_BACKOFF_SECONDS = 30.0
+
+
+def work_loop(stop: threading.Event, poll_interval: float, once: bool,
+              worker_id: str, max_jobs: Optional[int] = None) -> int:
+    processed = 0
+    last_stale_check = 0.0
+    failures = 0
+    while not stop.is_set():
+        try:
+            if time.monotonic() - last_stale_check > 60:
+                with SessionLocal() as db:
+                    recovered = jobs.requeue_stale_jobs(db)
+                if recovered:
+                    logging.warning("Recovered %d stale jobs", recovered)
+                last_stale_check = time.monotonic()
+            job_id = jobs.claim_next_job(worker_id)
+            if job_id is None:
+                failures = 0
+                if once:
+                    break
+                stop.wait(poll_interval)
+                continue
+            job = jobs.run_job(job_id, worker_id)
+        except Exception as exc:
+            # 数据库锁冲突、连接断开等临时错误不应结束线程：记录后按指数退避重试；
+            # 已认领但未完成的任务在租约过期后由 requeue_stale_jobs 重新入队
+            failures += 1
+            delay = min(MAX_ERROR_BACKOFF_SECONDS, poll_interval * 2 ** min(failures, 10))
+            logging.exception("Worker %s loop failed (%d in a row), retrying in %.1fs: %s",
+                              worker_id, failures, delay, exc)
+            stop.wait(delay)
+            continue
+        failures = 0
+        processed += 1
+        logging.info("Job %s (%s) finished: %s", job.id, job.kind, job.status)
+        if max_jobs is not None and processed >= max_jobs:
+            break
+    return processed
+
+
+def main_cli() -> int:
+    parser = argparse.ArgumentParser(description="Run the DevSprint background worker")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to wait when the queue is empty")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of job-processing threads")
+    parser.add_argument("--no-scheduler", action="store_true", help="Only process queued jobs, skip scheduled jobs")
+    parser.add_argument("--once", action="store_true", help="Exit once the queue is empty")
+    parser.add_argument("--max-jobs", type=int, help="Exit after processing this many jobs per thread")
+    args = parser.parse_args()
+
+    # 与 API 启动相同：表结构未就绪时不启动调度器与任务线程
+    if env_flag("DEVSPRINT_AUTO_INIT_DB", "1") and not ensure_db_ready():
+        logging.error("Database initialisation failed; worker not started")
+        return 1
+    stop = threading.Event()
+
+    def handle_signal(signum, frame):
+        logging.info("Worker received signal %s, stopping", signum)
+        stop.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    if not args.no_scheduler and not args.once:
+        # 定时任务执行前仍需获取租约，多个 worker 同时运行时只有一个真正执行
+        jobs.get_scheduler().start()
+        logging.info("Worker %s started scheduler", WORKER_ID)
+
+    threads = []
+    counts = [0] * max(1, args.concurrency)
+    crashed = [False] * len(counts)
+
+    def run(index: int) -> None:
+        try:
+            counts[index] = work_loop(stop, args.poll_interval, args.once,
+                                      f"{WORKER_ID}/{index}", args.max_jobs)
+        except BaseException:
+            crashed[index] = True
+            logging.exception("Worker thread %d died unexpectedly", index)
+            raise
+
+    for index in range(len(counts)):
+        thread = threading.Thread(target=run, args=(index,), name=f"devsprint-worker-{index}", daemon=True)
+        thread.start()
+        threads.append(thread)
+    try:
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.5)
+    finally:
+        stop.set()
+        jobs.stop_scheduler()
+    logging.info("Worker stopped after %d jobs", sum(counts))
+    # 有线程异常退出时以非零退出码结束，便于进程管理器发现并重启
+    return 1 if any(crashed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
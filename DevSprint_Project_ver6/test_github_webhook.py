@@ -6,12 +6,24 @@ GitHub Webhook 集成功能测试脚本
     python test_github_webhook.py --event-type push --task-id 1
     python test_github_webhook.py --event-type pull_request --task-id 2
     python test_github_webhook.py --event-type status --commit-sha abc123 --ci-status failure
+
+压测模式（按目标速率混合回放多种事件）:
+    python test_github_webhook.py --load --rate 50 --duration 30 --concurrency 16 \
+        --mix push=5,pull_request=2,status=2,check_suite=1 --commits-per-push 5 --ref-density 0.6
 """
 
 import argparse
 import json
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+
+EVENT_TYPES = ["push", "pull_request", "status", "check_suite"]
 
 
 def test_push_event(webhook_url: str, task_id: int, repo_name: str = "octocat/Hello-World", commit_sha: str = "7fd1a60b01f91b314f59955a4e4d4f5a5d5f90a3"):
@@ -160,6 +172,156 @@ def send_webhook(webhook_url: str, payload: dict, headers: dict):
         return False
 
 
+def parse_mix(raw: str) -> Dict[str, float]:
+    """解析事件配比，如 push=5,pull_request=2"""
+    mix = {}
+    for item in raw.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in EVENT_TYPES:
+            raise ValueError(f"未知事件类型: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def parse_task_range(raw: str) -> List[int]:
+    start, _, end = raw.partition("-")
+    return list(range(int(start), int(end or start) + 1))
+
+
+class LoadGenerator:
+    """按目标速率并发回放混合事件，复用连接池"""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.rng_lock = threading.Lock()
+        self.task_ids = parse_task_range(args.task_id_range)
+        self.mix = parse_mix(args.mix)
+        self.recent_shas = deque(maxlen=1000)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=args.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.results = []
+        self.results_lock = threading.Lock()
+        self.pr_counter = 0
+
+    def _sha(self) -> str:
+        return "%040x" % self.rng.getrandbits(160)
+
+    def _message(self) -> str:
+        # ref-density 控制提交消息中引用任务的比例
+        if self.rng.random() < self.args.ref_density:
+            return f"feat: update ref #{self.rng.choice(self.task_ids)}"
+        return "chore: routine change"
+
+    def build(self, event_type: str) -> dict:
+        repo = {"full_name": self.args.repo_name, "name": self.args.repo_name.split("/")[-1]}
+        with self.rng_lock:
+            if event_type == "push":
+                commits = []
+                for _ in range(self.args.commits_per_push):
+                    sha = self._sha()
+                    self.recent_shas.append(sha)
+                    commits.append({"id": sha, "message": self._message()})
+                return {"ref": "refs/heads/main", "repository": repo, "commits": commits}
+            if event_type == "pull_request":
+                self.pr_counter += 1
+                title = self._message()
+                return {
+                    "action": "opened",
+                    "repository": repo,
+                    "pull_request": {
+                        "number": self.pr_counter,
+                        "title": title,
+                        "body": title,
+                        "html_url": f"https://github.com/{self.args.repo_name}/pull/{self.pr_counter}",
+                        "state": "open",
+                        "merged": False,
+                    },
+                }
+            sha = self.rng.choice(self.recent_shas) if self.recent_shas else self._sha()
+            state = "failure" if self.rng.random() < self.args.failure_rate else "success"
+            if event_type == "status":
+                return {"repository": repo, "sha": sha, "state": state}
+            return {
+                "action": "completed",
+                "repository": repo,
+                "check_suite": {"head_sha": sha, "conclusion": state, "status": "completed"},
+            }
+
+    def send(self, event_type: str, payload: dict):
+        headers = {"X-GitHub-Event": event_type, "X-GitHub-Delivery": f"load-{time.time_ns()}"}
+        started = time.perf_counter()
+        error = None
+        status = None
+        try:
+            response = self.session.post(self.args.webhook_url, json=payload, headers=headers, timeout=30)
+            status = response.status_code
+            if status >= 400:
+                error = f"HTTP {status}"
+        except requests.exceptions.RequestException as exc:
+            error = type(exc).__name__
+        latency = (time.perf_counter() - started) * 1000
+        with self.results_lock:
+            self.results.append((event_type, latency, error))
+
+    def run(self):
+        args = self.args
+        total = int(args.rate * args.duration)
+        events = list(self.mix)
+        weights = [self.mix[e] for e in events]
+        print(f"🚀 压测开始: 目标 {args.rate}/s, 持续 {args.duration}s, 并发 {args.concurrency}, 事件配比 {self.mix}")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            for index in range(total):
+                # 开环调度：按计划时间发送，服务变慢时不会自动降低发送速率
+                delay = started + index / args.rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                event_type = self.rng.choices(events, weights)[0]
+                pool.submit(self.send, event_type, self.build(event_type))
+        elapsed = time.perf_counter() - started
+        self.report(elapsed)
+        return all(error is None for _, _, error in self.results)
+
+    def report(self, elapsed: float):
+        def pct(values: List[float], p: float) -> float:
+            if not values:
+                return 0.0
+            ordered = sorted(values)
+            return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+        by_event = defaultdict(list)
+        errors = defaultdict(int)
+        for event_type, latency, error in self.results:
+            by_event[event_type].append(latency)
+            if error:
+                errors[event_type] += 1
+        total = len(self.results)
+        all_latencies = [latency for _, latency, _ in self.results]
+        print("-" * 60)
+        print(f"📊 完成 {total} 个请求，用时 {elapsed:.2f}s，实际吞吐 {total / elapsed if elapsed else 0:.1f} req/s")
+        print(f"   总体延迟 p50={pct(all_latencies, 50):.1f}ms p90={pct(all_latencies, 90):.1f}ms "
+              f"p99={pct(all_latencies, 99):.1f}ms，错误率 {sum(errors.values()) / total if total else 0:.2%}")
+        for event_type, latencies in sorted(by_event.items()):
+            print(f"   {event_type:<13} n={len(latencies):<6} p50={pct(latencies, 50):.1f}ms "
+                  f"p90={pct(latencies, 90):.1f}ms p99={pct(latencies, 99):.1f}ms "
+                  f"错误率 {errors[event_type] / len(latencies):.2%}")
+        if self.args.report_json:
+            with open(self.args.report_json, "w", encoding="utf-8") as fh:
+                json.dump({
+                    "requests": total,
+                    "elapsed_s": round(elapsed, 3),
+                    "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+                    "p50_ms": round(pct(all_latencies, 50), 2),
+                    "p90_ms": round(pct(all_latencies, 90), 2),
+                    "p99_ms": round(pct(all_latencies, 99), 2),
+                    "errors": dict(errors),
+                }, fh, indent=2)
+
+
 def main():
     parser = argparse.ArgumentParser(description="测试 GitHub Webhook 集成功能")
     parser.add_argument(
@@ -169,9 +331,8 @@ def main():
     )
     parser.add_argument(
         "--event-type",
-        choices=["push", "pull_request", "status", "check_suite"],
-        required=True,
-        help="事件类型"
+        choices=EVENT_TYPES,
+        help="事件类型（单次模式必填）"
     )
     parser.add_argument(
         "--task-id",
@@ -214,7 +375,35 @@ def main():
         help="CI 状态 (默认: success)"
     )
     
+    load_group = parser.add_argument_group("压测模式")
+    load_group.add_argument("--load", action="store_true", help="开启压测模式，按目标速率混合回放事件")
+    load_group.add_argument("--rate", type=float, default=20, help="目标速率 req/s (默认: 20)")
+    load_group.add_argument("--duration", type=float, default=30, help="持续时间（秒，默认: 30）")
+    load_group.add_argument("--concurrency", type=int, default=16, help="并发连接数 (默认: 16)")
+    load_group.add_argument(
+        "--mix",
+        default="push=5,pull_request=2,status=2,check_suite=1",
+        help="事件配比 (默认: push=5,pull_request=2,status=2,check_suite=1)"
+    )
+    load_group.add_argument("--commits-per-push", type=int, default=3, help="每个 push 的提交数 (默认: 3)")
+    load_group.add_argument("--ref-density", type=float, default=0.5, help="引用任务的提交/PR 比例 0~1 (默认: 0.5)")
+    load_group.add_argument("--task-id-range", default="1-500", help="被引用的任务 ID 范围 (默认: 1-500)")
+    load_group.add_argument("--failure-rate", type=float, default=0.1, help="CI 失败比例 (默认: 0.1)")
+    load_group.add_argument("--seed", type=int, default=42, help="随机种子 (默认: 42)")
+    load_group.add_argument("--report-json", help="将压测结果写入 JSON 文件")
+    
     args = parser.parse_args()
+
+    if args.load:
+        print("=" * 60)
+        print("GitHub Webhook 压测")
+        print("=" * 60)
+        print(f"Webhook URL: {args.webhook_url}")
+        ok = LoadGenerator(args).run()
+        print("=" * 60)
+        raise SystemExit(0 if ok else 1)
+    if not args.event_type:
+        parser.error("单次模式需要指定 --event-type（或使用 --load 进入压测模式）")
     
     print("=" * 60)
     print("GitHub Webhook 集成功能测试")
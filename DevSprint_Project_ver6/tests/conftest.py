@@ -0,0 +1,67 @@
+import os
+import re
+import tempfile
+
+# 在导入 backend 之前配置：临时 SQLite 库、不灌 Demo 数据、不启动调度器；
+# 模拟时钟 TTL 拉长，避免 TTL 到期时的重新读取混入某个请求的语句数
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="devsprint-tests-"), "test.db")
+os.environ["DEVSPRINT_SEED_DEMO"] = "0"
+os.environ["DEVSPRINT_API_SCHEDULER"] = "0"
+os.environ["DEVSPRINT_CLOCK_TTL_SECONDS"] = "3600"
+os.environ["DEVSPRINT_REVIEWERS"] = "alice,bob,carol"
+
+import pytest
+from fastapi.testclient import TestClient
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def statement_count(response) -> int:
+    # 语句数取自 observability 中 before_cursor_execute 钩子写入的 Server-Timing 头
+    assert response.status_code < 400, response.text
+    match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+    assert match, response.headers.get("server-timing")
+    return int(match.group(1))
+
+
+@pytest.fixture(scope="session")
+def client():
+    from backend.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def sprint_id(client) -> int:
+    sprint = client.post(
+        "/api/sprints", json={"name": "Test Sprint", "start_date": "2026-01-05", "end_date": "2026-01-16"}
+    )
+    assert sprint.status_code == 200, sprint.text
+    return sprint.json()["id"]
+
+
+@pytest.fixture
+def story_id(client, sprint_id) -> int:
+    story = client.post("/api/stories", json={"title": "Test Story", "sprint_id": sprint_id, "story_points": 3})
+    assert story.status_code == 200, story.text
+    return story.json()["id"]
+
+
+def create_task(client, story_id: int, **fields) -> dict:
+    # 默认不带负责人；需要 DEV 分配时传入 assignee 与 remaining_days
+    response = client.post("/api/tasks", json={"title": "task", "story_id": story_id, "story_points": 1, **fields})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def open_pull_request(client, task_id: int):
+    # PR 关联把任务推进到 CODE_REVIEW 并指派评审人；返回响应，由调用方断言
+    return client.post(
+        "/api/github/webhook",
+        json={
+            "repository": {"full_name": "octo/repo"},
+            "pull_request": {"title": f"ref #{task_id}", "body": "", "html_url": f"https://pr/{task_id}", "state": "open"},
+        },
+        headers={"X-GitHub-Event": "pull_request"},
+    )
@@ -0,0 +1,23 @@
+"""Assignment responses for rows without a due date or legacy countdown."""
+from sqlalchemy import update
+
+from backend.database import SessionLocal
+from backend.models import TaskAssignmentModel
+from conftest import create_task
+
+
+def test_assignment_without_remaining_days_serializes(client, story_id):
+    task = create_task(client, story_id, assignee="dev", remaining_days=2)
+    with SessionLocal() as db:
+        db.execute(
+            update(TaskAssignmentModel)
+            .where(TaskAssignmentModel.task_id == task["id"])
+            .values(due_date=None, legacy_remaining_days=None)
+        )
+        db.commit()
+    response = client.get(f"/api/tasks/{task['id']}/assignments")
+    assert response.status_code == 200, response.text
+    assert [a["remaining_days"] for a in response.json()] == [None]
+    created = client.post(f"/api/tasks/{task['id']}/assignments", json={"users": ["qa"], "role": "REVIEW", "remaining_days": 1})
+    assert created.status_code == 200, created.text
+    assert created.json()[0]["remaining_days"] == 1
@@ -0,0 +1,61 @@
+"""Board checkpoint retention: one row per sprint per day, thinned once the sprint is closed."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.board_history import capture_board_checkpoint, thin_board_checkpoints
+from backend.database import SessionLocal
+from backend.models import BoardCheckpointModel
+from backend.snapshots import capture_sprint_snapshot, purge_simulated_snapshots
+
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def checkpoint_times(db, sprint_id: int):
+    return list(
+        db.scalars(
+            select(BoardCheckpointModel.checkpoint_at)
+            .where(BoardCheckpointModel.sprint_id == sprint_id)
+            .order_by(BoardCheckpointModel.checkpoint_at)
+        )
+    )
+
+
+def test_snapshot_upserts_one_checkpoint_per_day(db, sprint_id):
+    today = datetime.utcnow().date()
+    for _ in range(3):
+        capture_sprint_snapshot(db, sprint_id, today)
+        db.commit()
+    count = db.scalar(select(func.count(BoardCheckpointModel.id)).where(BoardCheckpointModel.sprint_id == sprint_id))
+    assert count == 1
+
+
+def test_thin_keeps_first_checkpoint_per_week_and_last(db, sprint_id):
+    monday = datetime(2026, 1, 5, 9, 0)
+    for day in range(14):
+        capture_board_checkpoint(db, sprint_id, monday + timedelta(days=day))
+    db.commit()
+    assert thin_board_checkpoints(db, sprint_id) == 11
+    db.commit()
+    assert checkpoint_times(db, sprint_id) == [monday, monday + timedelta(days=7), monday + timedelta(days=13)]
+
+
+def test_purge_includes_simulated_checkpoints(db, sprint_id):
+    capture_board_checkpoint(db, sprint_id, datetime(2026, 2, 2, 9, 0), simulated=True)
+    capture_board_checkpoint(db, sprint_id, datetime(2026, 2, 3, 9, 0))
+    db.commit()
+    db.query(BoardCheckpointModel).filter(BoardCheckpointModel.sprint_id == sprint_id).update(
+        {"created_at": datetime.utcnow() - timedelta(days=60)}, synchronize_session=False
+    )
+    db.commit()
+    assert purge_simulated_snapshots(db, retention_days=30) >= 1
+    db.commit()
+    assert checkpoint_times(db, sprint_id) == [datetime(2026, 2, 3, 9, 0)]
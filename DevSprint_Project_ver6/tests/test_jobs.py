@@ -0,0 +1,111 @@
+"""Job queue: claiming, lease expiry and the ownership-guarded final write."""
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, update
+
+from backend import jobs
+from backend.database import SessionLocal
+from backend.models import JobModel, JobStatus
+
+
+@pytest.fixture
+def db(client, monkeypatch):
+    # 每个用例使用空队列和测试专用的任务类型
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "test_job", lambda payload: {"echo": payload})
+    session = SessionLocal()
+    session.execute(delete(JobModel))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def enqueue(db, payload=None) -> int:
+    return jobs.enqueue_job(db, "test_job", payload).id
+
+
+def job_row(db, job_id: int) -> JobModel:
+    db.expire_all()
+    return db.get(JobModel, job_id)
+
+
+def set_job(db, job_id: int, **values) -> None:
+    db.execute(update(JobModel).where(JobModel.id == job_id).values(**values))
+    db.commit()
+
+
+def test_claim_in_order_and_only_once(db):
+    first, second = enqueue(db), enqueue(db)
+    assert jobs.claim_next_job("w1") == first
+    assert jobs.claim_next_job("w2") == second
+    assert jobs.claim_next_job("w3") is None
+    job = job_row(db, first)
+    assert (job.status, job.worker, job.attempts) == (JobStatus.RUNNING.value, "w1", 1)
+    assert job.heartbeat_at is not None
+
+
+def test_only_lapsed_leases_are_requeued(db):
+    lapsed, renewed, exhausted = enqueue(db), enqueue(db), enqueue(db)
+    for _ in range(3):
+        jobs.claim_next_job("w1")
+    expired = datetime.utcnow() - timedelta(seconds=jobs.JOB_LEASE_SECONDS + 5)
+    set_job(db, lapsed, heartbeat_at=expired)
+    # 启动很久但仍在续租的任务不会被回收
+    set_job(db, renewed, started_at=expired - timedelta(hours=1))
+    set_job(db, exhausted, heartbeat_at=expired, attempts=jobs.JOB_MAX_ATTEMPTS)
+
+    assert jobs.requeue_stale_jobs(db) == 2
+    assert (job_row(db, lapsed).status, job_row(db, lapsed).worker) == (JobStatus.QUEUED.value, None)
+    assert job_row(db, renewed).status == JobStatus.RUNNING.value
+    assert (job_row(db, exhausted).status, job_row(db, exhausted).error) == (JobStatus.FAILED.value, "Lease expired")
+
+
+def test_run_job_records_result_and_errors(db, monkeypatch):
+    job_id = enqueue(db, {"n": 1})
+    assert jobs.claim_next_job("w1") == job_id
+    job = jobs.run_job(job_id, "w1")
+    assert (job.status, json.loads(job.result)) == (JobStatus.DONE.value, {"echo": {"n": 1}})
+
+    def boom(payload):
+        raise RuntimeError("handler failed")
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "test_job", boom)
+    job_id = enqueue(db)
+    jobs.claim_next_job("w1")
+    job = jobs.run_job(job_id, "w1")
+    assert (job.status, job.error) == (JobStatus.FAILED.value, "handler failed")
+
+
+def test_result_discarded_after_losing_the_lease(db, monkeypatch):
+    job_id = enqueue(db)
+
+    def lose_lease(payload):
+        # 执行期间租约过期，任务被回收并由另一个 worker 认领
+        with SessionLocal() as other:
+            set_job(other, job_id, status=JobStatus.QUEUED.value, worker=None)
+        assert jobs.claim_next_job("w2") == job_id
+        return {"from": "w1"}
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "test_job", lose_lease)
+    assert jobs.claim_next_job("w1") == job_id
+    job = jobs.run_job(job_id, "w1")
+    assert (job.status, job.worker, job.result) == (JobStatus.RUNNING.value, "w2", None)
+
+
+def test_heartbeat_renews_until_ownership_is_lost(db):
+    job_id = enqueue(db)
+    jobs.claim_next_job("w1")
+    old = datetime.utcnow() - timedelta(minutes=5)
+    set_job(db, job_id, heartbeat_at=old)
+    with jobs.JobHeartbeat(job_id, "w1", 0.02) as heartbeat:
+        deadline = time.monotonic() + 2
+        while job_row(db, job_id).heartbeat_at == old and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert job_row(db, job_id).heartbeat_at > old
+        set_job(db, job_id, worker="w2")
+        heartbeat._thread.join(timeout=2)
+        assert not heartbeat._thread.is_alive()
@@ -0,0 +1,13 @@
+"""Metric labels derived from request input stay bounded."""
+from backend.observability import WEBHOOK_DELIVERIES
+
+
+def test_unknown_webhook_events_share_one_label(client):
+    for event in ("push", "made-up-1", "made-up-2"):
+        response = client.post("/api/github/webhook", json={}, headers={"X-GitHub-Event": event})
+        assert response.status_code == 200, response.text
+    metrics = client.get("/metrics").text
+    assert 'event="push"' in metrics
+    assert 'event="other"' in metrics
+    assert "made-up" not in metrics
+    assert not any("made-up" in str(labels) for labels in WEBHOOK_DELIVERIES._values)
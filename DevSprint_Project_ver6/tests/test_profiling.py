@@ -0,0 +1,39 @@
+"""ProfiledRoute wraps both sync and async endpoints without changing their behaviour."""
+import asyncio
+import cProfile
+import inspect
+import pstats
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from backend.observability import ProfiledRoute, _profiled_endpoint, _request_profiler
+
+
+async def async_work():
+    await asyncio.sleep(0)
+    return {"kind": "async"}
+
+
+def test_async_endpoint_keeps_coroutine_semantics():
+    router = APIRouter(route_class=ProfiledRoute)
+    router.add_api_route("/async", async_work)
+    router.add_api_route("/sync", lambda: {"kind": "sync"})
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as client:
+        assert client.get("/async").json() == {"kind": "async"}
+        assert client.get("/sync").json() == {"kind": "sync"}
+
+
+def test_async_endpoint_is_profiled():
+    wrapped = _profiled_endpoint(async_work)
+    assert inspect.iscoroutinefunction(wrapped)
+    profiler = cProfile.Profile()
+    token = _request_profiler.set(profiler)
+    try:
+        assert asyncio.run(wrapped()) == {"kind": "async"}
+    finally:
+        _request_profiler.reset(token)
+    profiler.create_stats()
+    assert any(func[2] == "async_work" for func in pstats.Stats(profiler).stats)
@@ -0,0 +1,90 @@
+"""Review SLA: deadline on entering review, cleared on leaving, breaches found by the indexed scan."""
+from datetime import timedelta
+
+import pytest
+
+from backend.clock import simulation_clock
+from backend.database import SessionLocal
+from backend.models import TaskModel
+from backend.review_sla import default_review_sla_days, detect_review_breaches
+from conftest import create_task, open_pull_request
+
+
+def review_fields(task_id: int) -> dict:
+    with SessionLocal() as db:
+        task = db.get(TaskModel, task_id)
+        return {
+            "started": task.review_started_at,
+            "due": task.review_due_at,
+            "breached": task.review_breached_at,
+        }
+
+
+def scan() -> list:
+    with SessionLocal() as db:
+        breached = detect_review_breaches(db)
+        db.commit()
+    return breached
+
+
+@pytest.fixture
+def in_review(client, story_id) -> int:
+    task_id = create_task(client, story_id)["id"]
+    assert open_pull_request(client, task_id).status_code == 200
+    return task_id
+
+
+@pytest.fixture
+def restore_clock():
+    offset = simulation_clock.offset()
+    yield offset
+    simulation_clock.set(offset)
+
+
+def test_deadline_follows_sprint_sla(client, sprint_id, in_review):
+    fields = review_fields(in_review)
+    assert fields["due"] == fields["started"] + timedelta(days=default_review_sla_days())
+    # Sprint 覆盖 SLA 后重算评审中任务的截止时间
+    assert client.patch(f"/api/sprints/{sprint_id}", json={"review_sla_days": 5}).status_code == 200
+    fields = review_fields(in_review)
+    assert fields["due"] == fields["started"] + timedelta(days=5)
+
+
+def test_leaving_review_clears_deadline(client, story_id, in_review):
+    assert client.post(f"/api/review/{in_review}/decision", json={"approved": False}).status_code == 200
+    assert review_fields(in_review)["due"] is None
+    # 普通的状态更新离开评审同样清空
+    other = create_task(client, story_id)["id"]
+    assert open_pull_request(client, other).status_code == 200
+    assert review_fields(other)["due"] is not None
+    assert client.patch(f"/api/tasks/{other}", json={"status": "IN_PROGRESS"}).status_code == 200
+    assert review_fields(other)["due"] is None
+
+
+def test_breach_scan_marks_lists_and_unmarks(client, sprint_id, in_review, restore_clock):
+    assert in_review not in scan()
+    # 等待天数 > SLA：截止日期早于模拟的今天
+    simulation_clock.set(restore_clock + default_review_sla_days() + 1)
+    assert in_review in scan()
+    assert review_fields(in_review)["breached"] is not None
+    # 已标记的评审不会被重复发布
+    assert in_review not in scan()
+
+    breaches = client.get("/api/review/breaches", params={"sprint_id": sprint_id}).json()
+    assert [b["task_id"] for b in breaches] == [in_review]
+    assert len(breaches[0]["reviewers"]) == 2
+    assert client.get("/api/review/breaches", params={"sprint_id": sprint_id + 1000}).json() == []
+
+    # 模拟时钟回拨后撤销超期标记
+    simulation_clock.set(restore_clock)
+    scan()
+    assert review_fields(in_review)["breached"] is None
+    assert client.get("/api/review/breaches", params={"sprint_id": sprint_id}).json() == []
+
+
+def test_breached_review_cleared_when_done(client, in_review, restore_clock):
+    simulation_clock.set(restore_clock + default_review_sla_days() + 1)
+    assert in_review in scan()
+    assert client.post(f"/api/review/{in_review}/decision", json={"approved": True}).status_code == 200
+    fields = review_fields(in_review)
+    assert fields["due"] is None and fields["breached"] is None
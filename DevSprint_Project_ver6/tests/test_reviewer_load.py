@@ -0,0 +1,77 @@
+"""In-memory reviewer load stays in step with the assignments that were actually committed."""
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+
+from backend.clock import get_today, simulation_clock
+from backend.database import SessionLocal
+from backend.models import TaskAssignmentModel
+from backend.reviewers import rebalance_breached_reviews, reviewer_queue
+from conftest import create_task, open_pull_request
+
+
+def reviewers_of(client, task_id: int):
+    assignments = client.get(f"/api/tasks/{task_id}/assignments").json()
+    return [a["user"] for a in assignments if a["role"] == "REVIEW" and a["status"] == "ACTIVE"]
+
+
+def current_load():
+    # count=0 不会计入任何分配，只在内存负载失效或过期时从数据库重新加载
+    with SessionLocal() as db:
+        reviewer_queue.pick(db, 0, 0, 0)
+    return reviewer_queue.snapshot()
+
+
+def reloaded_load():
+    reviewer_queue.invalidate()
+    return current_load()
+
+
+def test_decision_releases_what_was_charged(client, story_id):
+    task_id = create_task(client, story_id)["id"]
+    before = reloaded_load()
+    assert open_pull_request(client, task_id).status_code == 200
+    assert reviewer_queue.snapshot() != before
+    # 模拟时钟前进一天：结论给出时剩余天数已少于指派时计入的 SLA，扣除的仍应是计入的天数
+    offset = simulation_clock.offset()
+    simulation_clock.set(offset + 1)
+    try:
+        response = client.post(f"/api/review/{task_id}/decision", json={"approved": True})
+    finally:
+        simulation_clock.set(offset)
+    assert response.status_code == 200, response.text
+    assert reviewer_queue.snapshot() == before
+
+
+def test_failed_webhook_invalidates_load(client, story_id, monkeypatch):
+    task_id = create_task(client, story_id)["id"]
+    before = reloaded_load()
+
+    def fail(task, sla_days):
+        raise RuntimeError("boom")
+
+    # 在评审人已计入内存负载之后、提交之前失败
+    monkeypatch.setattr("backend.routers.github.start_review_clock", fail)
+    with pytest.raises(RuntimeError):
+        open_pull_request(client, task_id)
+    assert reviewers_of(client, task_id) == []
+    assert current_load() == before
+
+
+def test_rebalance_releases_the_replaced_charge(client, story_id):
+    task_id = create_task(client, story_id)["id"]
+    before = reloaded_load()
+    assert open_pull_request(client, task_id).status_code == 200
+    overdue_user = reviewers_of(client, task_id)[0]
+    with SessionLocal() as db:
+        db.execute(
+            update(TaskAssignmentModel)
+            .where(TaskAssignmentModel.task_id == task_id, TaskAssignmentModel.user == overdue_user)
+            .values(due_date=get_today() - timedelta(days=1))
+        )
+        db.commit()
+        assert rebalance_breached_reviews(db)["reassigned"] == 1
+    # 被替换的评审人扣除指派时计入的完整 SLA，负载回到指派之前
+    assert reviewer_queue.snapshot()[overdue_user] == before[overdue_user]
+    assert reviewer_queue.snapshot() == reloaded_load()
@@ -0,0 +1,115 @@
+"""The due-date simulation tick matches the old per-row countdown, day by day."""
+from typing import Dict, List
+
+import pytest
+from sqlalchemy import select, update
+
+from backend.clock import simulation_clock
+from backend.database import SessionLocal
+from backend.models import TaskAssignmentModel, TaskModel
+from conftest import create_task
+
+DAYS = 9
+
+
+def old_tick(tasks: Dict[int, dict]) -> None:
+    """旧版逐行倒计时的参考实现：每天把 DEV / REVIEW 分配的剩余天数减一，再按同样的规则推进状态。"""
+
+    def finished(a: dict) -> bool:
+        return a["remaining_days"] <= 0 or a["status"] == "DONE"
+
+    for task in tasks.values():
+        if task["status"] == "DONE":
+            continue
+        dev = [a for a in task["assignments"] if a["role"] == "DEV"]
+        review = [a for a in task["assignments"] if a["role"] == "REVIEW"]
+        if task["status"] in ("TODO", "IN_PROGRESS"):
+            for a in dev:
+                if a["remaining_days"] > 0:
+                    a["remaining_days"] -= 1
+                # 唯一有意的差异：旧实现不会关闭创建时就为 0 天的 ACTIVE 分配，新实现按到期一并关闭；
+                # 两者的任务状态相同
+                if a["remaining_days"] == 0 and a["status"] == "ACTIVE":
+                    a["status"] = "DONE"
+        if task["status"] == "CODE_REVIEW":
+            for a in review:
+                if a["remaining_days"] > 0:
+                    a["remaining_days"] -= 1
+        if task["status"] == "TODO" and dev and (any(a["status"] == "ACTIVE" for a in dev) or any(map(finished, dev))):
+            task["status"] = "IN_PROGRESS"
+        if task["status"] == "IN_PROGRESS" and dev and all(map(finished, dev)):
+            task["status"] = "CODE_REVIEW"
+        if task["status"] == "CODE_REVIEW" and review and all(map(finished, review)):
+            if all(a["decision"] == "APPROVED" for a in review if a["decision"]):
+                task["status"] = "DONE"
+
+
+def board_state(task_ids: List[int]) -> Dict[int, dict]:
+    with SessionLocal() as db:
+        tasks = {
+            task.id: {"status": task.status, "assignments": []}
+            for task in db.scalars(select(TaskModel).where(TaskModel.id.in_(task_ids)))
+        }
+        for a in db.scalars(
+            select(TaskAssignmentModel).where(TaskAssignmentModel.task_id.in_(task_ids)).order_by(TaskAssignmentModel.id)
+        ):
+            tasks[a.task_id]["assignments"].append(
+                {"role": a.role, "remaining_days": a.remaining_days, "status": a.status, "decision": a.decision}
+            )
+    return tasks
+
+
+@pytest.fixture
+def restore_clock():
+    offset = simulation_clock.offset()
+    yield
+    simulation_clock.set(offset)
+
+
+def test_tick_matches_per_row_countdown(client, restore_clock):
+    # 模拟只推进开始日期最早的活动 Sprint，这里用更早的开始日期确保选中本用例的 Sprint
+    sprint = client.post("/api/sprints", json={"name": "Sim", "start_date": "2025-01-06", "end_date": "2025-01-17"})
+    story = client.post("/api/stories", json={"title": "Sim", "sprint_id": sprint.json()["id"], "story_points": 8})
+    story_id = story.json()["id"]
+
+    def task(status: str = "TODO", **fields) -> int:
+        task_id = create_task(client, story_id, **fields)["id"]
+        if status != "TODO":
+            assert client.patch(f"/api/tasks/{task_id}", json={"status": status}).status_code == 200
+        return task_id
+
+    def reviews(task_id: int, days: int, decisions=(None,)) -> None:
+        users = [f"reviewer{i}" for i in range(len(decisions))]
+        response = client.post(f"/api/tasks/{task_id}/assignments", json={"users": users, "role": "REVIEW", "remaining_days": days})
+        assert response.status_code == 200, response.text
+        with SessionLocal() as db:
+            for user, decision in zip(users, decisions):
+                db.execute(
+                    update(TaskAssignmentModel)
+                    .where(TaskAssignmentModel.task_id == task_id, TaskAssignmentModel.user == user)
+                    .values(decision=decision)
+                )
+            db.commit()
+
+    ids = [
+        task(assignee="dev", remaining_days=2),  # TODO -> IN_PROGRESS -> CODE_REVIEW
+        task(assignee="dev", remaining_days=5),
+        task("IN_PROGRESS", assignee="dev", remaining_days=1),
+        task(assignee="dev", remaining_days=0),  # 已到期的分配
+        task(),  # 没有负责人：一直停在 TODO，Sprint 也就不会全部完成
+    ]
+    two_devs = task(assignee="dev", remaining_days=1)
+    assert client.post(f"/api/tasks/{two_devs}/assignments", json={"users": ["pair"], "remaining_days": 3}).status_code == 200
+    ids.append(two_devs)
+    for days, decisions in ((1, (None, None)), (3, ("APPROVED", None)), (2, ("REJECTED",))):
+        review_id = task("CODE_REVIEW")
+        reviews(review_id, days, decisions)
+        ids.append(review_id)
+
+    expected = board_state(ids)
+    for day in range(1, DAYS + 1):
+        old_tick(expected)
+        response = client.post("/api/simulate/advance_days", json={"days": 1})
+        assert response.status_code == 200, response.text
+        assert board_state(ids) == expected, f"day {day}"
+    assert {state["status"] for state in expected.values()} == {"TODO", "CODE_REVIEW", "DONE"}
@@ -0,0 +1,66 @@
+"""Historical board: how the as_of query parameter is interpreted, and which tasks it shows."""
+from datetime import timedelta
+
+from sqlalchemy import update
+
+from backend.board_history import capture_board_checkpoint
+from backend.clock import get_now
+from backend.database import SessionLocal
+from backend.models import TaskModel
+from conftest import create_task
+
+
+def board(client, sprint_id: int, as_of: str):
+    return client.get(f"/api/sprints/{sprint_id}/board", params={"as_of": as_of})
+
+
+def test_explicit_midnight_is_not_end_of_day(client, sprint_id, story_id):
+    task_id = create_task(client, story_id)["id"]
+    today = get_now().date().isoformat()
+
+    # 只给日期：当天结束时，今天创建的任务已在看板上
+    response = board(client, sprint_id, today)
+    assert response.status_code == 200, response.text
+    assert response.json()["as_of"] == f"{today}T23:59:59.999999"
+    assert task_id in [task["id"] for task in response.json()["tasks"]]
+
+    # 显式零点（含带 Z 的 UTC 写法）：任务尚未创建
+    for value in (f"{today}T00:00:00", f"{today}T00:00:00Z"):
+        response = board(client, sprint_id, value)
+        assert response.status_code == 200, response.text
+        assert response.json()["as_of"] == f"{today}T00:00:00"
+        assert task_id not in [task["id"] for task in response.json()["tasks"]]
+
+
+def test_invalid_as_of_is_rejected(client, sprint_id):
+    assert board(client, sprint_id, "yesterday").status_code == 422
+
+
+def test_checkpoint_tasks_moved_out_stay_on_the_historical_board(client, sprint_id, story_id):
+    other = client.post("/api/sprints", json={"name": "Other", "start_date": "2026-01-19", "end_date": "2026-01-30"})
+    other_story = client.post("/api/stories", json={"title": "Other", "sprint_id": other.json()["id"], "story_points": 1})
+    staying = create_task(client, story_id)["id"]
+    first_moved = create_task(client, story_id)["id"]
+    # 主键落在两个移出任务之间、但从未属于本 Sprint 的任务
+    unrelated = create_task(client, other_story.json()["id"])["id"]
+    second_moved = create_task(client, story_id)["id"]
+    with SessionLocal() as db:
+        capture_board_checkpoint(db, sprint_id, get_now())
+        db.commit()
+        db.execute(
+            update(TaskModel)
+            .where(TaskModel.id.in_([first_moved, second_moved]))
+            .values(story_id=other_story.json()["id"])
+        )
+        db.commit()
+    for task_id in (first_moved, unrelated):
+        assert client.patch(f"/api/tasks/{task_id}", json={"is_blocked": True}).status_code == 200
+
+    response = board(client, sprint_id, (get_now() + timedelta(minutes=1)).isoformat())
+    assert response.status_code == 200, response.text
+    tasks = {task["id"]: task for task in response.json()["tasks"]}
+    assert sorted(tasks) == [staying, first_moved, second_moved]
+    assert tasks[first_moved]["is_blocked"] and not tasks[second_moved]["is_blocked"]
+
+    current = client.get(f"/api/sprints/{sprint_id}/board").json()
+    assert [task["id"] for task in current["tasks"]] == [staying]
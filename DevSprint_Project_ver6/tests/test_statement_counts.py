@@ -0,0 +1,61 @@
+"""Exact SQL statement counts for the task and review write paths.
+
+Counts come from the Server-Timing header (see observability.instrument_requests) on SQLite.
+A changed count means a query was added or removed; update the expectation deliberately.
+"""
+from conftest import create_task, open_pull_request, statement_count
+
+
+# 带 DEV 分配的任务，与基准测试的 task_body 一致
+DEV = {"assignee": "dev", "remaining_days": 2}
+
+
+def test_create_task(client, story_id):
+    body = {"title": "task", "story_id": story_id, "story_points": 2, "assignee": "dev", "remaining_days": 2}
+    # story lookup, task insert, assignment insert, transition insert, story status update
+    assert statement_count(client.post("/api/tasks", json=body)) == 5
+
+
+def test_update_task(client, story_id):
+    task_id = create_task(client, story_id, **DEV)["id"]
+    # task + selectin(github_links, assignments), versioned task update, story status update
+    assert statement_count(client.patch(f"/api/tasks/{task_id}", json={"title": "renamed"})) == 5
+    # status change adds one transition insert
+    assert statement_count(client.patch(f"/api/tasks/{task_id}", json={"status": "IN_PROGRESS"})) == 6
+    # remaining_days also moves the DEV assignment's due date
+    assert statement_count(client.patch(f"/api/tasks/{task_id}", json={"status": "TODO", "remaining_days": 1})) == 7
+
+
+def test_delete_task(client, story_id):
+    task_id = create_task(client, story_id, **DEV)["id"]
+    # task, transition delete, selectin(github_links, assignments), assignment delete, task delete, story update
+    assert statement_count(client.delete(f"/api/tasks/{task_id}")) == 7
+    linked_id = create_task(client, story_id, **DEV)["id"]
+    assert open_pull_request(client, linked_id).status_code == 200
+    # one more delete for the PR link; the DEV and REVIEW assignments go in one executemany
+    assert statement_count(client.delete(f"/api/tasks/{linked_id}")) == 8
+
+
+def test_batch_update(client, story_id):
+    ids = [create_task(client, story_id, **DEV)["id"] for _ in range(3)]
+    # load + two selectins and a single story update, whatever the batch size
+    body = {"items": [{"id": task_id, "remaining_days": 1} for task_id in ids]}
+    assert statement_count(client.patch("/api/tasks/batch", json=body)) == 5
+    # versioned task updates and transition inserts are issued per task: 4 + 2 * 3
+    body = {"items": [{"id": task_id, "status": "IN_PROGRESS"} for task_id in ids]}
+    assert statement_count(client.patch("/api/tasks/batch", json=body)) == 10
+
+
+def test_review_decision(client, story_id):
+    approved_id = create_task(client, story_id, **DEV)["id"]
+    rejected_id = create_task(client, story_id, **DEV)["id"]
+    assert open_pull_request(client, approved_id).status_code == 200
+    open_pull_request(client, rejected_id)
+    # task + two selectins, task update, review assignments (executemany), transition, story update
+    response = client.post(f"/api/review/{approved_id}/decision", json={"approved": True})
+    assert statement_count(response) == 7
+    assert response.json()["status"] == "DONE"
+    # rejection also reopens the DEV assignment
+    response = client.post(f"/api/review/{rejected_id}/decision", json={"approved": False, "tech_debt_days": 2})
+    assert statement_count(response) == 8
+    assert response.json()["status"] == "IN_PROGRESS"
@@ -0,0 +1,21 @@
+"""The worker loop survives transient database errors."""
+import threading
+
+from sqlalchemy.exc import OperationalError
+
+from backend import jobs, worker
+
+
+def test_loop_retries_after_transient_errors(client, monkeypatch):
+    calls = []
+
+    def flaky_claim(worker_id):
+        calls.append(worker_id)
+        if len(calls) <= 2:
+            raise OperationalError("UPDATE jobs", {}, Exception("database is locked"))
+        return None
+
+    monkeypatch.setattr(jobs, "claim_next_job", flaky_claim)
+    # 两次失败后队列为空，--once 模式正常退出而不是结束线程
+    assert worker.work_loop(threading.Event(), 0.001, True, "test-worker") == 0
+    assert len(calls) == 3